@@ -7,10 +7,19 @@ Full validation framework with:
 - Auto-data export
 - TEST mode for quick verification
 """
+import os
+
+# One BLAS thread per process: estimation parallelizes across processes,
+# so threaded BLAS would only oversubscribe the cores (must precede numpy)
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import numpy as np
 from pathlib import Path
 import time
 import sys
+import logging
+import logging.handlers
+from multiprocessing import freeze_support
 
 from glycolysis_model import GlycolysisModel
 from my_mcem_fixed import run_mcem
@@ -26,71 +35,96 @@ try:
 except ImportError:
     print("Warning: Some analysis modules not found. Basic functionality available.")
 
+# ============================================================================
+# CONSOLE OUTPUT
+# ============================================================================
+# Menus and summaries go through one buffered logger: lines collect in
+# memory and reach the terminal in a single burst before each prompt (or
+# before other modules print), instead of one synchronous flush per line.
+
+log = logging.getLogger("phase6")
+_console = logging.StreamHandler(sys.stdout)
+_console.setFormatter(logging.Formatter("%(message)s"))
+_log_buffer = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR,
+                                             target=_console)
+log.addHandler(_log_buffer)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+def flush_log():
+    """Write out any buffered console output"""
+    _log_buffer.flush()
+
+def prompt(text):
+    """input() that first flushes buffered output so the menu is visible"""
+    flush_log()
+    return input(text)
+
 # ============================================================================
 # MENU FUNCTIONS
 # ============================================================================
 
 def print_header():
     """Print main header"""
-    print("\n" + "="*80)
-    print("PHASE 6 2.0: COMPLETE MULTI-ORGANISM VALIDATION SUITE")
-    print("="*80)
-    print("Cross-kingdom MCEM validation:")
-    print("  > E. coli (Bacteria - Gram negative)")
-    print("  > B. subtilis (Bacteria - Gram positive)")
-    print("  > Arabidopsis (Plant)")
-    print("  > S. cerevisiae (Yeast - Fungi)")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("PHASE 6 2.0: COMPLETE MULTI-ORGANISM VALIDATION SUITE")
+    log.info("="*80)
+    log.info("Cross-kingdom MCEM validation:")
+    log.info("  > E. coli (Bacteria - Gram negative)")
+    log.info("  > B. subtilis (Bacteria - Gram positive)")
+    log.info("  > Arabidopsis (Plant)")
+    log.info("  > S. cerevisiae (Yeast - Fungi)")
+    log.info("="*80)
 
 def print_main_menu():
     """Print main menu"""
-    print("\n" + "="*80)
-    print("MAIN MENU")
-    print("-"*80)
-    print("1) Parameter Estimation")
-    print("2) Robustness Testing")
-    print("3) Bayesian + FISPO Analysis")
-    print("4) Complete Analysis")
-    print("5) Generate Comparative Report (from existing results)")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("MAIN MENU")
+    log.info("-"*80)
+    log.info("1) Parameter Estimation")
+    log.info("2) Robustness Testing")
+    log.info("3) Bayesian + FISPO Analysis")
+    log.info("4) Complete Analysis")
+    log.info("5) Generate Comparative Report (from existing results)")
+    log.info("="*80)
 
 def print_organism_menu():
     """Print organism selection menu"""
-    print("\n" + "="*80)
-    print("ORGANISM SELECTION")
-    print("-"*80)
-    print("1) E. coli           (Bacteria - Prokaryote)")
-    print("2) B. subtilis       (Bacteria - Prokaryote)")
-    print("3) Arabidopsis       (Plant - Eukaryote)")
-    print("4) S. cerevisiae     (Yeast - Fungi)")
-    print("5) All 4 organisms   (Batch processing)")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("ORGANISM SELECTION")
+    log.info("-"*80)
+    log.info("1) E. coli           (Bacteria - Prokaryote)")
+    log.info("2) B. subtilis       (Bacteria - Prokaryote)")
+    log.info("3) Arabidopsis       (Plant - Eukaryote)")
+    log.info("4) S. cerevisiae     (Yeast - Fungi)")
+    log.info("5) All 4 organisms   (Batch processing)")
+    log.info("="*80)
 
 def print_mode_menu():
     """Print computation mode menu"""
-    print("\n" + "="*80)
-    print("COMPUTATION LEVEL")
-    print("-"*80)
-    print("A) FAST     - 100 iter, 1000 samples (~4-6 hrs per organism on i3)")
-    print("B) BALANCED - 150 iter, 1500 samples (~8-12 hrs per organism on i3)")
-    print("C) PRECISE  - 200 iter, 2000 samples (~24+ hrs per organism on i3)")
-    print("D) TEST     - 20 iter, 500 samples (~15-20 min) [QUICK VERIFICATION]")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("COMPUTATION LEVEL")
+    log.info("-"*80)
+    log.info("A) FAST     - 100 iter, 1000 samples (~4-6 hrs per organism on i3)")
+    log.info("B) BALANCED - 150 iter, 1500 samples (~8-12 hrs per organism on i3)")
+    log.info("C) PRECISE  - 200 iter, 2000 samples (~24+ hrs per organism on i3)")
+    log.info("D) TEST     - 20 iter, 500 samples (~15-20 min) [QUICK VERIFICATION]")
+    log.info("="*80)
 
 def get_main_choice():
     """Get main menu choice"""
     while True:
         print_main_menu()
-        choice = input("Enter choice (1-5): ").strip()
+        choice = prompt("Enter choice (1-5): ").strip()
         if choice in ['1', '2', '3', '4', '5']:
             return int(choice)
-        print("Invalid choice! Please enter 1-5.")
+        log.info("Invalid choice! Please enter 1-5.")
 
 def get_organism_choice():
     """Get organism selection"""
     while True:
         print_organism_menu()
-        choice = input("Enter choice (1-5): ").strip()
+        choice = prompt("Enter choice (1-5): ").strip()
         
         if choice == '1':
             return ['ecoli']
@@ -103,13 +137,13 @@ def get_organism_choice():
         elif choice == '5':
             return ['ecoli', 'bsubtilis', 'arabidopsis', 'yeast']
         else:
-            print("Invalid choice! Please enter 1-5.")
+            log.info("Invalid choice! Please enter 1-5.")
 
 def get_mode_choice():
     """Get computation mode"""
     while True:
         print_mode_menu()
-        choice = input("Enter choice (A/B/C/D): ").strip().upper()
+        choice = prompt("Enter choice (A/B/C/D): ").strip().upper()
         
         if choice == 'A':
             return 'FAST', {'maxiter': 100, 'inner': 1000}
@@ -120,12 +154,34 @@ def get_mode_choice():
         elif choice == 'D':
             return 'TEST', {'maxiter': 20, 'inner': 500}
         else:
-            print("Invalid choice! Please enter A, B, C, or D.")
+            log.info("Invalid choice! Please enter A, B, C, or D.")
 
 # ============================================================================
 # ENHANCED SESSION NAMING
 # ============================================================================
 
+def next_session_number(results_dir=Path("results")):
+    """Next session number from results/.counter (O(1))
+    
+    Falls back to counting Session* folders only when the counter file is
+    missing or unreadable; the new value is written back atomically.
+    """
+    counter_file = results_dir / '.counter'
+    
+    try:
+        last = int(counter_file.read_text().strip())
+    except (OSError, ValueError):
+        last = len(list(results_dir.glob("Session*")))
+    
+    session_num = last + 1
+    
+    results_dir.mkdir(parents=True, exist_ok=True)
+    tmp_file = counter_file.with_name('.counter.tmp')
+    tmp_file.write_text(f"{session_num}\n")
+    os.replace(tmp_file, counter_file)
+    
+    return session_num
+
 def create_session_name(analysis_type, organisms, mode_name):
     """Create descriptive session name"""
     
@@ -153,7 +209,7 @@ def create_session_name(analysis_type, organisms, mode_name):
         org_name = f'{len(organisms)}Organisms'
     
     # Create name
-    session_num = len(list(Path("results").glob("Session*"))) + 1
+    session_num = next_session_number()
     session_name = f"Session{session_num}_{analysis_names[analysis_type]}_{org_name}_{mode_name}"
     
     return session_name
@@ -165,44 +221,47 @@ def create_session_name(analysis_type, organisms, mode_name):
 def run_post_analysis_exports(session_folder):
     """Run visualization and data export after analysis completes"""
     
-    print("\n" + "="*80)
-    print("POST-ANALYSIS: GENERATING OUTPUTS")
-    print("="*80)
-    print("\nAutomatically generating:")
-    print("  [1/2] High-resolution visualizations")
-    print("  [2/2] Excel & CSV data exports")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("POST-ANALYSIS: GENERATING OUTPUTS")
+    log.info("="*80)
+    log.info("\nAutomatically generating:")
+    log.info("  [1/2] High-resolution visualizations")
+    log.info("  [2/2] Excel & CSV data exports")
+    log.info("="*80)
     
     # Run visualizations
     try:
-        print("\n[1/2] Generating visualizations...")
+        log.info("\n[1/2] Generating visualizations...")
+        flush_log()
         from generate_thesis_visualizations import ThesisVisualizer
         visualizer = ThesisVisualizer(session_folder)
         visualizer.generate_all()
-        print("✓ Visualizations complete!")
+        log.info("✓ Visualizations complete!")
     except Exception as e:
-        print(f"⚠ Visualization generation failed: {e}")
-        print("  (You can run manually: py -3 generate_thesis_visualizations.py)")
+        log.info(f"⚠ Visualization generation failed: {e}")
+        log.info("  (You can run manually: py -3 generate_thesis_visualizations.py)")
     
     # Run data exports
     try:
-        print("\n[2/2] Exporting data tables...")
+        log.info("\n[2/2] Exporting data tables...")
+        flush_log()
         from export_data_tables import DataExporter
         exporter = DataExporter(session_folder)
         exporter.export_all()
-        print("✓ Data export complete!")
+        log.info("✓ Data export complete!")
     except Exception as e:
-        print(f"⚠ Data export failed: {e}")
-        print("  (You can run manually: py -3 export_data_tables.py)")
+        log.info(f"⚠ Data export failed: {e}")
+        log.info("  (You can run manually: py -3 export_data_tables.py)")
     
-    print("\n" + "="*80)
-    print("ALL OUTPUTS GENERATED!")
-    print("="*80)
-    print(f"\nResults saved in: {session_folder}")
-    print("\nGenerated:")
-    print(f"  ✓ {session_folder}/visualizations/ (High-res plots)")
-    print(f"  ✓ {session_folder}/data_exports/ (Excel & CSV files)")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("ALL OUTPUTS GENERATED!")
+    log.info("="*80)
+    log.info(f"\nResults saved in: {session_folder}")
+    log.info("\nGenerated:")
+    log.info(f"  ✓ {session_folder}/visualizations/ (High-res plots)")
+    log.info(f"  ✓ {session_folder}/data_exports/ (Excel & CSV files)")
+    log.info("="*80)
+    flush_log()
 
 # ============================================================================
 # MAIN PROGRAM
@@ -223,8 +282,8 @@ def main():
             try:
                 generate_comparative_report()
             except Exception as e:
-                print(f"\nError generating report: {e}")
-            input("\nPress ENTER to continue...")
+                log.error(f"\nError generating report: {e}")
+            prompt("\nPress ENTER to continue...")
             continue
         
         # For options 1-4: Get organism and mode selection
@@ -232,9 +291,9 @@ def main():
         mode_name, settings = get_mode_choice()
         
         # Confirmation
-        print("\n" + "="*80)
-        print("STARTING ANALYSIS")
-        print("="*80)
+        log.info("\n" + "="*80)
+        log.info("STARTING ANALYSIS")
+        log.info("="*80)
         
         org_names = {
             'ecoli': 'E. coli',
@@ -250,8 +309,8 @@ def main():
             4: 'Complete Analysis'
         }
         
-        print(f"Analysis: {analysis_names[choice]}")
-        print(f"Level: {mode_name}")
+        log.info(f"Analysis: {analysis_names[choice]}")
+        log.info(f"Level: {mode_name}")
         
         # Show time estimate
         if mode_name == 'TEST':
@@ -262,12 +321,12 @@ def main():
         else:
             time_est = "See menu for estimates"
         
-        print(f"Estimated time: {time_est}")
-        print("="*80)
+        log.info(f"Estimated time: {time_est}")
+        log.info("="*80)
         
-        proceed = input("\nProceed? (Y/n): ").strip().lower()
+        proceed = prompt("\nProceed? (Y/n): ").strip().lower()
         if proceed and proceed != 'y':
-            print("\nCancelled.")
+            log.info("\nCancelled.")
             continue
         
         # Create session folder with descriptive name
@@ -275,9 +334,10 @@ def main():
         session_folder = Path(f"results/{session_name}")
         session_folder.mkdir(parents=True, exist_ok=True)
         
-        print(f"\nSession: {session_name}")
-        print(f"Location: {session_folder}")
-        print("="*80)
+        log.info(f"\nSession: {session_name}")
+        log.info(f"Location: {session_folder}")
+        log.info("="*80)
+        flush_log()
         
         # Run selected analysis
         try:
@@ -295,19 +355,21 @@ def main():
                 run_post_analysis_exports(session_folder)
                 
         except Exception as e:
-            print(f"\n\nERROR: {e}")
+            log.error(f"\n\nERROR: {e}")
             import traceback
             traceback.print_exc()
         
         # Ask to continue
-        print("\n" + "="*80)
-        again = input("Return to main menu? (Y/n): ").strip().lower()
+        log.info("\n" + "="*80)
+        again = prompt("Return to main menu? (Y/n): ").strip().lower()
         if again and again != 'y':
             break
     
-    print("\n" + "="*80)
-    print("PHASE 6 2.0 COMPLETE!")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("PHASE 6 2.0 COMPLETE!")
+    log.info("="*80)
+    flush_log()
 
 if __name__ == "__main__":
+    freeze_support()
     main()
@@ -3,9 +3,11 @@ ADD TRUE PARAMS TO EXISTING DATA FILES
 =======================================
 Don't regenerate - just add true_params to working files!
 """
+import os
 import numpy as np
 from pathlib import Path
 from kinetic_parameters import GLYCOLYSIS_PARAMS, TCA_PARAMS
+from data_io import write_npy_sidecars, params_to_record
 
 def add_true_params_to_file(data_file, true_params, pathway_name):
     """Add true_params to an existing data file"""
@@ -37,22 +39,30 @@ def add_true_params_to_file(data_file, true_params, pathway_name):
     # Save with true_params added
     backup_file = data_file.parent / (data_file.stem + '_backup.npz')
     
-    # Backup original
-    import shutil
-    shutil.copy(data_file, backup_file)
-    print(f"    ✓ Backed up to: {backup_file.name}")
+    # Backup original, unless the file is already our own output: it has
+    # true_params and was written after the existing backup
+    if ('true_params' in existing_keys and backup_file.exists()
+            and data_file.stat().st_mtime >= backup_file.stat().st_mtime):
+        print(f"    ✓ Already processed, keeping existing backup")
+    else:
+        import shutil
+        shutil.copy(data_file, backup_file)
+        print(f"    ✓ Backed up to: {backup_file.name}")
     
-    # Save with true_params
-    np.savez(
+    # Save with true_params (compressed, pickle-free)
+    np.savez_compressed(
         data_file,
         t_observed=t_data,
         y_observed=y_data,
         observable_idx=obs_idx,
-        true_params=true_params
+        true_params=params_to_record(true_params)
     )
     
+    # Raw arrays for memory-mapped loading
+    write_npy_sidecars(data_file, t_data, y_data, obs_idx)
+    
     print(f"    ✓ Added true_params ({len(true_params)} parameters)")
-    print(f"    ✓ Updated: {data_file.name}")
+    print(f"    ✓ Updated: {data_file.name} (+ .npy sidecars)")
     
     return True
 
@@ -71,27 +81,28 @@ def process_organism(organism_name, organism_folder):
     
     success = True
     
+    # One directory scan, then name lookups
+    with os.scandir(org_folder) as it:
+        entries = {e.name: Path(e.path) for e in it if e.is_file()}
+    
     # Process glycolysis files
-    glyc_files = list(org_folder.glob('experimental_data_glycolysis.npz'))
-    if not glyc_files:
-        glyc_files = list(org_folder.glob('experimental_data.npz'))
+    glyc_file = (entries.get('experimental_data_glycolysis.npz')
+                 or entries.get('experimental_data.npz'))
     
-    if glyc_files:
+    if glyc_file:
         print(f"\n  [GLYCOLYSIS DATA]")
-        for glyc_file in glyc_files:
-            if not add_true_params_to_file(glyc_file, GLYCOLYSIS_PARAMS, 'glycolysis'):
-                success = False
+        if not add_true_params_to_file(glyc_file, GLYCOLYSIS_PARAMS, 'glycolysis'):
+            success = False
     else:
         print(f"  ! No glycolysis data files found")
     
     # Process TCA files
-    tca_files = list(org_folder.glob('experimental_data_tca.npz'))
+    tca_file = entries.get('experimental_data_tca.npz')
     
-    if tca_files:
+    if tca_file:
         print(f"\n  [TCA DATA]")
-        for tca_file in tca_files:
-            if not add_true_params_to_file(tca_file, TCA_PARAMS, 'tca'):
-                success = False
+        if not add_true_params_to_file(tca_file, TCA_PARAMS, 'tca'):
+            success = False
     else:
         print(f"  ! No TCA data files found (will create if needed)")
         # Don't fail if no TCA - that's okay
@@ -112,7 +123,10 @@ def create_tca_data_if_missing():
         ('S. cerevisiae', 'Bio-Database/FUNGI/Saccharomyces_cerevisiae'),
     ]
     
-    for name, folder in organisms:
+    # Independent, reproducible stream per organism
+    rngs = [np.random.default_rng(seq) for seq in np.random.SeedSequence(42).spawn(len(organisms))]
+    
+    for (name, folder), rng in zip(organisms, rngs):
         org_folder = Path(folder)
         tca_file = org_folder / 'experimental_data_tca.npz'
         
@@ -137,16 +151,17 @@ def create_tca_data_if_missing():
                 n_timepoints = len(t_data)
                 
                 # Create simple synthetic data
-                y_tca = np.random.uniform(0.1, 1.0, (n_metabolites, n_timepoints))
+                y_tca = rng.uniform(0.1, 1.0, (n_metabolites, n_timepoints))
                 obs_idx = np.arange(n_metabolites)
                 
-                np.savez(
+                np.savez_compressed(
                     tca_file,
                     t_observed=t_data,
                     y_observed=y_tca,
                     observable_idx=obs_idx,
-                    true_params=TCA_PARAMS
+                    true_params=params_to_record(TCA_PARAMS)
                 )
+                write_npy_sidecars(tca_file, t_data, y_tca, obs_idx)
                 
                 print(f"    ✓ Created: {tca_file.name}")
             else:
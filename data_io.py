@@ -0,0 +1,231 @@
+"""
+Experimental Data I/O
+=====================
+
+Raw .npy sidecars for the experimental_data*.npz files.
+
+The time grid, observations and observable indices are written once as
+plain fixed-dtype .npy files next to the .npz:
+
+    experimental_data.npz  ->  experimental_data.t.npy
+                               experimental_data.y.npy
+                               experimental_data.obs.npy
+
+and read back with np.load(mmap_mode='r'), so worker processes share the
+OS page cache instead of unpickling private copies. Only true_params
+still comes from the .npz. A data file without sidecars is read from the
+.npz once and its sidecars are written then (load_data_flexible).
+
+true_params is stored as a structured (name, value) array rather than a
+pickled dict; params_from_record reads both layouts, and
+load_param_record only enables unpickling for files still in the old one.
+
+Estimation results (parameter_estimation.npz, results/estimation.npz) are
+stored as flat arrays, one entry per estimated parameter, per pathway run
+and per organism (results_to_arrays), and rebuilt into the nested result
+dicts by load_results, which still reads the old pickled layout.
+"""
+
+import os
+import numpy as np
+from pathlib import Path
+
+# Structured layout for pickle-free parameter tables
+PARAM_RECORD_DTYPE = np.dtype([('name', 'U32'), ('value', np.float64)])
+
+# Sidecar suffix -> on-disk dtype
+SIDECAR_DTYPES = {
+    't': np.float64,
+    'y': np.float64,
+    'obs': np.int64,
+}
+
+
+def sidecar_path(data_file, key):
+    """Path of one sidecar, e.g. experimental_data.npz -> experimental_data.t.npy"""
+    return Path(data_file).with_suffix(f'.{key}.npy')
+
+
+def write_npy_sidecars(data_file, t_data, y_data, obs_idx):
+    """
+    Write t/y/observable_idx sidecars for a data file.
+
+    Each sidecar is written to a temporary file and renamed into place, so
+    a process that maps it concurrently never sees a partial array.
+    """
+    arrays = {'t': t_data, 'y': y_data, 'obs': obs_idx}
+
+    for key, dtype in SIDECAR_DTYPES.items():
+        path = sidecar_path(data_file, key)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                np.save(f, np.ascontiguousarray(arrays[key], dtype=dtype))
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+
+def load_npy_sidecars(data_file):
+    """
+    Memory-map the sidecars of a data file.
+
+    Returns:
+        tuple: (t_obs, y_obs, obs_idx) as read-only memmaps, or None if any
+            sidecar is missing or older than the .npz itself
+    """
+    data_file = Path(data_file)
+    paths = [sidecar_path(data_file, key) for key in SIDECAR_DTYPES]
+
+    if not all(p.exists() for p in paths):
+        return None
+    if data_file.exists():
+        npz_mtime = data_file.stat().st_mtime
+        if any(p.stat().st_mtime < npz_mtime for p in paths):
+            return None
+
+    return tuple(np.load(p, mmap_mode='r') for p in paths)
+
+
+def params_to_record(params):
+    """Parameter dict -> structured (name, value) array (no pickle needed)"""
+    return np.array(list(params.items()), dtype=PARAM_RECORD_DTYPE)
+
+
+def params_from_record(arr):
+    """
+    Structured (name, value) array -> parameter dict.
+
+    Also accepts the legacy layout (a pickled dict in a 0-d object array).
+    """
+    if arr.dtype.names:
+        return {str(name): float(value) for name, value in zip(arr['name'], arr['value'])}
+    return arr.item()
+
+
+def load_param_record(data, data_file, key='true_params'):
+    """
+    data[key] of an open .npz as a parameter dict.
+
+    data is opened without allow_pickle; only a legacy file, whose dict is
+    pickled, is reopened with unpickling enabled to read that one entry.
+    """
+    try:
+        return params_from_record(data[key])
+    except ValueError:
+        with np.load(data_file, allow_pickle=True) as legacy:
+            return params_from_record(legacy[key])
+
+
+# Pathway codes of the flat result arrays (pathway_id, run_pathway)
+PATHWAYS = ('glycolysis', 'tca')
+
+
+def results_to_arrays(organism_results):
+    """
+    Per-organism result dicts -> flat arrays for np.savez (no pickle needed).
+
+    Parameter arrays (param_names, initial_guess, estimated, errors,
+    std_devs, pathway_id, organism_id) hold every estimated parameter, in
+    run order; run_* arrays hold one entry per (organism, pathway) run,
+    with run_sizes its number of parameters; the rest one entry per
+    organism.
+    """
+    runs = [(i, r) for i, org in enumerate(organism_results)
+            for r in org['pathway_results']]
+    sizes = np.array([len(r['parameters']) for _, r in runs], dtype=np.int64)
+    run_pathway = np.array([PATHWAYS.index(r['pathway']) for _, r in runs], dtype=np.int8)
+    run_organism = np.array([i for i, _ in runs], dtype=np.int16)
+
+    def per_parameter(key, dtype):
+        return np.array([v for _, r in runs for v in r[key]], dtype=dtype)
+
+    return {
+        'param_names': per_parameter('parameters', 'U32'),
+        'initial_guess': per_parameter('initial_guess', np.float64),
+        'estimated': per_parameter('estimated', np.float64),
+        'errors': per_parameter('errors', np.float64),
+        'std_devs': per_parameter('std_devs', np.float64),
+        'pathway_id': np.repeat(run_pathway, sizes),
+        'organism_id': np.repeat(run_organism, sizes),
+        'run_sizes': sizes,
+        'run_pathway': run_pathway,
+        'run_organism': run_organism,
+        'run_final_sse': np.array([r['final_sse'] for _, r in runs], dtype=np.float64),
+        'run_runtime': np.array([r['runtime'] for _, r in runs], dtype=np.float64),
+        'run_has_true_params': np.array([r['has_true_params'] for _, r in runs], dtype=bool),
+        'organisms': np.array([org['organism'] for org in organism_results], dtype='U32'),
+        'mode': np.array([org['mode'] for org in organism_results], dtype='U16'),
+        'total_params': np.array([org['total_params'] for org in organism_results], dtype=np.int64),
+        'overall_error': np.array([org['overall_error'] for org in organism_results], dtype=np.float64),
+        'total_runtime': np.array([org['total_runtime'] for org in organism_results], dtype=np.float64),
+    }
+
+
+def results_from_arrays(data):
+    """Flat result arrays (results_to_arrays, or an open .npz) -> per-organism dicts"""
+    bounds = np.concatenate(([0], np.cumsum(data['run_sizes'])))
+    columns = {key: data[key] for key in ('param_names', 'initial_guess', 'estimated',
+                                          'errors', 'std_devs')}
+
+    organism_results = [
+        {
+            'organism': str(name),
+            'total_params': int(data['total_params'][i]),
+            'pathway_results': [],
+            'overall_error': float(data['overall_error'][i]),
+            'total_runtime': float(data['total_runtime'][i]),
+            'mode': str(data['mode'][i]),
+        }
+        for i, name in enumerate(data['organisms'])
+    ]
+
+    for k, (org, pathway) in enumerate(zip(data['run_organism'], data['run_pathway'])):
+        run = slice(bounds[k], bounds[k + 1])
+        organism_results[org]['pathway_results'].append({
+            'pathway': PATHWAYS[pathway],
+            'parameters': columns['param_names'][run].tolist(),
+            'initial_guess': columns['initial_guess'][run].tolist(),
+            'estimated': columns['estimated'][run].tolist(),
+            'errors': columns['errors'][run].tolist(),
+            'std_devs': columns['std_devs'][run].tolist(),
+            'final_sse': float(data['run_final_sse'][k]),
+            'runtime': float(data['run_runtime'][k]),
+            'has_true_params': bool(data['run_has_true_params'][k]),
+        })
+
+    return organism_results
+
+
+def save_results(path, organism_results):
+    """Write per-organism result dicts as flat arrays (np.savez_compressed)"""
+    np.savez_compressed(path, **results_to_arrays(organism_results))
+
+
+def load_results(path):
+    """
+    Per-organism result dicts from a results .npz.
+
+    The file is opened without allow_pickle; only a legacy file (a
+    pickled 'results' object array) is reopened with unpickling enabled.
+    A legacy session file holds the organism dicts themselves; a legacy
+    per-organism results/estimation.npz holds that organism's pathway
+    dicts next to organism/total_params/total_runtime, and is returned as
+    a one-organism list (overall_error recomputed, mode unknown: '').
+    """
+    with np.load(path) as data:
+        if 'results' not in data.files:
+            return results_from_arrays(data)
+    with np.load(path, allow_pickle=True) as legacy:
+        results = list(legacy['results'])
+        if 'organism' not in legacy.files:
+            return results
+        return [{
+            'organism': str(legacy['organism']),
+            'total_params': int(legacy['total_params']),
+            'pathway_results': results,
+            'overall_error': float(np.mean([e for r in results for e in r['errors']])),
+            'total_runtime': float(legacy['total_runtime']),
+            'mode': '',
+        }]
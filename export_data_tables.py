@@ -4,7 +4,7 @@ DATA EXPORT MODULE - EXCEL & CSV GENERATION
 Exports Phase 6 results to Excel workbooks and CSV files for easy analysis.
 
 Generates:
-- Master Excel workbook with multiple sheets
+- Master Excel workbook with multiple sheets (the only .xlsx output)
 - Individual CSV files for each analysis
 - Summary tables and statistics
 """
@@ -13,13 +13,183 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import openpyxl
+from numba_compat import njit
+from data_io import load_results
+
+try:
+    import xlsxwriter
+    HAVE_XLSXWRITER = True
+except ImportError:
+    HAVE_XLSXWRITER = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+def _sheet_rows(df):
+    """Header row, then data rows with missing values as None (empty cells)
+    
+    Rows are plain tuples from itertuples(name=None); the object-cast copy
+    needed to turn NaN into None is only made when a value is missing.
+    Infinite values are written as empty cells too (openpyxl's behaviour;
+    xlsxwriter would reject them).
+    """
+    yield [str(col) for col in df.columns]
+    if np.isinf(df.select_dtypes('number').to_numpy(dtype=np.float64)).any():
+        df = df.replace([np.inf, -np.inf], np.nan)
+    if df.isna().to_numpy().any():
+        df = df.astype(object).where(df.notna(), None)
+    yield from df.itertuples(index=False, name=None)
+
+@njit('void(f8[:], i8[:], f8[:], f8[:])', cache=True)
+def _group_moments(values, group_ids, out_mean, out_std):
+    """Mean and population std of values per group, one Welford pass"""
+    n_groups = out_mean.shape[0]
+    count = np.zeros(n_groups)
+    m2 = np.zeros(n_groups)
+    for g in range(n_groups):
+        out_mean[g] = 0.0
+    for i in range(values.shape[0]):
+        g = group_ids[i]
+        count[g] += 1.0
+        delta = values[i] - out_mean[g]
+        out_mean[g] += delta / count[g]
+        m2[g] += delta * (values[i] - out_mean[g])
+    for g in range(n_groups):
+        if count[g] > 0.0:
+            out_std[g] = np.sqrt(m2[g] / count[g])
+        else:
+            out_mean[g] = np.nan
+            out_std[g] = np.nan
+
+@lru_cache(maxsize=None)
+def sheet_name_for(organism):
+    """Excel-safe sheet name for an organism (sanitized once per name)"""
+    return organism.replace(' ', '_')[:31]  # Excel limit
+
+# Repeated text labels, stored as categoricals (small integer codes)
+LABEL_COLUMNS = ('Organism', 'Pathway')
+
+def with_categories(df):
+    """Copy of df with the label columns cast to category"""
+    return df.astype({col: 'category' for col in LABEL_COLUMNS if col in df.columns})
+
+def organism_groups(df):
+    """(organism, rows) pairs in order of first appearance, from one pass
+    
+    Grouping on categorical codes replaces one boolean-mask scan of the
+    whole table per organism; the tables from build_frames already carry
+    Organism as a categorical, so no per-call cast is needed.
+    """
+    if not isinstance(df['Organism'].dtype, pd.CategoricalDtype):
+        df = df.astype({'Organism': 'category'})
+    return df.groupby('Organism', sort=False, observed=True)
+
+def _arrow_csv_table(df):
+    """df as an Arrow table whose CSV text matches pandas' to_csv
+    
+    Arrow formats floats its own way (3 for 3.0, 1.5e-7 for 1.5e-07) and
+    booleans as true/false, so those columns are pre-formatted with
+    numpy's astype(str) (the same shortest repr pandas writes, in C);
+    NaN stays a null, i.e. an empty field. Returns None for columns with
+    no Arrow type (mixed numbers and text, e.g. 'N/A').
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        if values.dtype.kind == 'f':
+            column = pa.array(values.astype(str), mask=np.isnan(values))
+        elif values.dtype.kind == 'b':
+            column = pa.array(values.astype(str))
+        else:
+            continue
+        table = table.set_column(i, table.field(i).name, column)
+    return table
+
+def write_csv(csv_file, df):
+    """Write a DataFrame as CSV (no index), byte-identical to df.to_csv
+    
+    pyarrow's writer formats whole columns in C. Nothing is quoted, as in
+    pandas' minimal quoting; a text field that would need quotes makes
+    Arrow raise, and pandas' to_csv (also the fallback without pyarrow)
+    writes the file instead.
+    """
+    if HAVE_PYARROW:
+        table = _arrow_csv_table(df)
+        if table is not None:
+            try:
+                pacsv.write_csv(table, csv_file,
+                                pacsv.WriteOptions(quoting_style='none', quoting_header='none'))
+                return
+            except (pa.ArrowInvalid, TypeError):
+                # TypeError: pyarrow too old for quoting_header
+                pass
+    df.to_csv(csv_file, index=False)
+
+def write_parquet(parquet_file, df):
+    """Write a DataFrame as zstd-compressed Parquet; returns False if skipped
+    
+    Needs pyarrow. Organism/Pathway are stored as dictionary-encoded
+    (categorical) columns.
+    """
+    if not HAVE_PYARROW:
+        return False
+    
+    df = with_categories(df)
+    df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+    return True
+
+def write_excel(excel_file, sheets):
+    """Stream DataFrames into one workbook, one sheet per (name, df) pair
+    
+    Rows are serialized as they are written instead of building a cell
+    tree for the whole workbook: xlsxwriter in constant_memory mode when
+    installed (rows go out strictly in order, which this loop guarantees),
+    otherwise openpyxl's write-only mode.
+    """
+    if HAVE_XLSXWRITER:
+        wb = xlsxwriter.Workbook(str(excel_file), {'constant_memory': True,
+                                                   'strings_to_numbers': False})
+        for sheet_name, df in sheets:
+            ws = wb.add_worksheet(sheet_name)
+            for r, row in enumerate(_sheet_rows(df)):
+                ws.write_row(r, 0, row)
+        wb.close()
+    else:
+        wb = openpyxl.Workbook(write_only=True)
+        for sheet_name, df in sheets:
+            ws = wb.create_sheet(sheet_name)
+            for row in _sheet_rows(df):
+                ws.append(row)
+        wb.save(excel_file)
+
+# Flat results table: one row per estimated parameter
+FLAT_COLUMNS = ('Organism', 'Pathway', 'Parameter', 'True_Value', 'Estimated_Value',
+                'Std_Dev', 'Relative_Error_%', 'Runtime', 'Total_Params',
+                'Overall_Error', 'Total_Runtime')
 
 class DataExporter:
     """Export Phase 6 results to Excel and CSV formats"""
     
-    def __init__(self, results_folder):
-        """Initialize with results folder path"""
+    def __init__(self, results_folder, error_csv=True, error_xlsx=False):
+        """Initialize with results folder path
+        
+        error_csv: also write error_distributions.csv next to the Parquet
+        file (Parquet is written whenever pyarrow is installed)
+        error_xlsx: also write error_distributions.xlsx (streamed, see write_excel)
+        """
         self.results_folder = Path(results_folder)
+        self.error_csv = error_csv or not HAVE_PYARROW
+        self.error_xlsx = error_xlsx
         self.output_folder = self.results_folder / 'data_exports'
         self.output_folder.mkdir(exist_ok=True)
         
@@ -37,235 +207,280 @@ class DataExporter:
         if not result_file.exists():
             raise FileNotFoundError(f"Results file not found: {result_file}")
         
-        data = np.load(result_file, allow_pickle=True)
-        results = data['results']
+        results = load_results(result_file)
         
         print(f"✓ Loaded results for {len(results)} organisms\n")
         return results
     
-    def export_parameter_table(self, results):
-        """Export parameter estimation results to Excel/CSV"""
+    def load_results_flat(self):
+        """Results as one flat table (one row per estimated parameter)
+        
+        Reads parameter_estimation.parquet when it is present and newer
+        than the .npz; otherwise flattens the saved results once and, if
+        pyarrow is installed, stores the Parquet file for the next export.
+        """
+        flat_file = self.results_folder / 'parameter_estimation.parquet'
+        result_file = self.results_folder / 'parameter_estimation.npz'
         
-        print("  [1/5] Exporting parameter tables...")
+        if (HAVE_PYARROW and flat_file.exists()
+                and (not result_file.exists()
+                     or flat_file.stat().st_mtime >= result_file.stat().st_mtime)):
+            flat = pd.read_parquet(flat_file, engine='pyarrow')
+            print(f"✓ Loaded {len(flat)} parameter rows from {flat_file.name}\n")
+            return flat
+        
+        flat = self.flatten_results(self.load_results())
+        if write_parquet(flat_file, flat):
+            print(f"✓ Stored flat results: {flat_file.name}\n")
+        return flat
+    
+    def flatten_results(self, results):
+        """Nested per-organism result dicts -> flat parameter table
         
-        all_data = []
+        Pathway- and organism-level values (runtime, totals) are repeated
+        on every row so all export tables can be derived by grouping.
+        """
+        columns = {name: [] for name in FLAT_COLUMNS}
         
         for organism_result in results:
             organism = organism_result['organism']
             
             for pathway_data in organism_result['pathway_results']:
-                pathway = pathway_data['pathway']
                 params = pathway_data['parameters']
+                n = len(params)
                 
                 if 'true_values' in pathway_data:
                     true_vals = pathway_data['true_values']
                 else:
                     true_vals = pathway_data['initial_guess']
                 
-                estimated = pathway_data['estimated']
-                errors = pathway_data['errors']
-                
                 if 'std_devs' in pathway_data:
                     std_devs = pathway_data['std_devs']
                 else:
-                    std_devs = [0] * len(params)
+                    std_devs = np.zeros(n)
                 
-                for i, param in enumerate(params):
-                    all_data.append({
-                        'Organism': organism,
-                        'Pathway': pathway.upper(),
-                        'Parameter': param,
-                        'True_Value': true_vals[i],
-                        'Estimated_Value': estimated[i],
-                        'Std_Dev': std_devs[i],
-                        'Absolute_Error': abs(estimated[i] - true_vals[i]),
-                        'Relative_Error_%': errors[i],
-                    })
-        
-        df = pd.DataFrame(all_data)
-        
-        # Export to Excel
-        excel_file = self.output_folder / 'parameter_estimates.xlsx'
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            # All data
-            df.to_excel(writer, sheet_name='All_Parameters', index=False)
+                columns['Organism'].append(np.repeat(np.array(organism, dtype=object), n))
+                columns['Pathway'].append(np.repeat(np.array(pathway_data['pathway'].upper(), dtype=object), n))
+                columns['Parameter'].append(np.asarray(params, dtype=object))
+                columns['True_Value'].append(np.asarray(true_vals, dtype=np.float64)[:n])
+                columns['Estimated_Value'].append(np.asarray(pathway_data['estimated'], dtype=np.float64)[:n])
+                columns['Std_Dev'].append(np.asarray(std_devs, dtype=np.float64)[:n])
+                columns['Relative_Error_%'].append(np.asarray(pathway_data['errors'], dtype=np.float64)[:n])
+                columns['Runtime'].append(np.full(n, pathway_data['runtime'], dtype=np.float64))
+                columns['Total_Params'].append(np.full(n, organism_result['total_params'], dtype=np.int64))
+                columns['Overall_Error'].append(np.full(n, organism_result['overall_error'], dtype=np.float64))
+                columns['Total_Runtime'].append(np.full(n, organism_result['total_runtime'], dtype=np.float64))
+        
+        flat = pd.DataFrame({name: np.concatenate(parts) if parts else np.empty(0)
+                             for name, parts in columns.items()})
+        return with_categories(flat)
+    
+    def build_frames(self, flat):
+        """Derive all export tables from the flat results table
+        
+        Returns:
+            tuple: (param_df, summary_df, comparison_df, error_df)
+        """
+        param_df = pd.DataFrame({
+            'Organism': flat['Organism'],
+            'Pathway': flat['Pathway'],
+            'Parameter': flat['Parameter'],
+            'True_Value': flat['True_Value'],
+            'Estimated_Value': flat['Estimated_Value'],
+            'Std_Dev': flat['Std_Dev'],
+            'Absolute_Error': np.abs(flat['Estimated_Value'].to_numpy(np.float64)
+                                     - flat['True_Value'].to_numpy(np.float64)),
+            'Relative_Error_%': flat['Relative_Error_%'],
+        })
+        
+        error_df = flat[['Organism', 'Pathway', 'Relative_Error_%']].copy()
+        error_stats = self.error_statistics(error_df)
+        
+        # Per (organism, pathway), in order of appearance
+        pathways = flat.groupby(['Organism', 'Pathway'], sort=False, observed=True).agg(
+            Num_Parameters=('Parameter', 'size'), Runtime=('Runtime', 'first'))
+        stats = error_stats.reindex(pathways.index)
+        runtimes = pathways['Runtime'].to_numpy()
+        
+        summary_df = pd.DataFrame({
+            'Organism': pathways.index.get_level_values('Organism'),
+            'Pathway': pathways.index.get_level_values('Pathway'),
+            'Num_Parameters': pathways['Num_Parameters'].to_numpy(),
+            'Mean_Error_%': stats['mean'].to_numpy(),
+            'Median_Error_%': stats['median'].to_numpy(),
+            'Std_Error_%': stats['std'].to_numpy(),
+            'Min_Error_%': stats['min'].to_numpy(),
+            'Max_Error_%': stats['max'].to_numpy(),
+            'Runtime_Minutes': runtimes / 60,
+            'Runtime_Hours': runtimes / 3600,
+        })
+        
+        # Per organism
+        organisms = flat.groupby('Organism', sort=False, observed=True).agg(
+            Total_Params=('Total_Params', 'first'), Overall_Error=('Overall_Error', 'first'),
+            Total_Runtime=('Total_Runtime', 'first'))
+        n_params = pathways['Num_Parameters']
+        mean_errors = error_stats['mean']
+        comparison_data = []
+        
+        for organism, row in organisms.iterrows():
+            glyc_error = mean_errors.get((organism, 'GLYCOLYSIS'))
+            tca_error = mean_errors.get((organism, 'TCA'))
             
-            # By organism
-            for organism in df['Organism'].unique():
-                org_df = df[df['Organism'] == organism]
-                sheet_name = organism.replace(' ', '_')[:31]  # Excel limit
-                org_df.to_excel(writer, sheet_name=sheet_name, index=False)
+            comparison_data.append({
+                'Organism': organism,
+                'Total_Parameters': row['Total_Params'],
+                'Glycolysis_Params': n_params.get((organism, 'GLYCOLYSIS'), 0),
+                'TCA_Params': n_params.get((organism, 'TCA'), 0),
+                'Glycolysis_Error_%': glyc_error if glyc_error else 'N/A',
+                'TCA_Error_%': tca_error if tca_error else 'N/A',
+                'Overall_Error_%': row['Overall_Error'],
+                'Total_Runtime_Hours': row['Total_Runtime'] / 3600,
+            })
+        
+        comparison_df = pd.DataFrame(comparison_data)
+        
+        return param_df, summary_df, comparison_df, error_df
+    
+    def error_statistics(self, error_df):
+        """Mean/median/std/min/max of the errors per (Organism, Pathway)
+        
+        One grouped pass over the long error table; std is the population
+        value (ddof=0), as np.std gave before.
+        """
+        grouped = error_df.groupby(['Organism', 'Pathway'], sort=False, observed=True)['Relative_Error_%']
+        stats = grouped.agg(['median', 'min', 'max'])
+        
+        # Mean and std together in one compiled pass over the group codes
+        mean = np.empty(len(stats))
+        std = np.empty(len(stats))
+        _group_moments(np.array(error_df['Relative_Error_%'], dtype=np.float64),
+                       np.array(grouped.ngroup(), dtype=np.int64), mean, std)
+        stats.insert(0, 'mean', mean)
+        stats['std'] = std
+        return stats
+    
+    def export_parameter_table(self, df, report=print):
+        """Export parameter estimation results to CSV (Excel: master workbook)"""
         
-        print(f"    ✓ Excel: {excel_file.name}")
+        report("  [1/5] Exporting parameter tables...")
         
         # Export to CSV
         csv_file = self.output_folder / 'parameter_estimates.csv'
-        df.to_csv(csv_file, index=False)
-        print(f"    ✓ CSV: {csv_file.name}")
+        write_csv(csv_file, df)
+        report(f"    ✓ CSV: {csv_file.name}")
+        
+        # Export to Parquet
+        parquet_file = self.output_folder / 'parameter_estimates.parquet'
+        if write_parquet(parquet_file, df):
+            report(f"    ✓ Parquet: {parquet_file.name}")
         
         return df
     
-    def export_summary_statistics(self, results):
-        """Export summary statistics to Excel/CSV"""
-        
-        print("  [2/5] Exporting summary statistics...")
-        
-        summary_data = []
+    def export_summary_statistics(self, df, report=print):
+        """Export summary statistics to CSV (Excel: master workbook)"""
         
-        for organism_result in results:
-            organism = organism_result['organism']
-            total_params = organism_result['total_params']
-            overall_error = organism_result['overall_error']
-            total_runtime = organism_result['total_runtime']
-            
-            for pathway_data in organism_result['pathway_results']:
-                pathway = pathway_data['pathway']
-                errors = pathway_data['errors']
-                runtime = pathway_data['runtime']
-                
-                summary_data.append({
-                    'Organism': organism,
-                    'Pathway': pathway.upper(),
-                    'Num_Parameters': len(pathway_data['parameters']),
-                    'Mean_Error_%': np.mean(errors),
-                    'Median_Error_%': np.median(errors),
-                    'Std_Error_%': np.std(errors),
-                    'Min_Error_%': np.min(errors),
-                    'Max_Error_%': np.max(errors),
-                    'Runtime_Minutes': runtime / 60,
-                    'Runtime_Hours': runtime / 3600,
-                })
-        
-        df = pd.DataFrame(summary_data)
-        
-        # Export to Excel
-        excel_file = self.output_folder / 'summary_statistics.xlsx'
-        df.to_excel(excel_file, index=False)
-        print(f"    ✓ Excel: {excel_file.name}")
+        report("  [2/5] Exporting summary statistics...")
         
         # Export to CSV
         csv_file = self.output_folder / 'summary_statistics.csv'
-        df.to_csv(csv_file, index=False)
-        print(f"    ✓ CSV: {csv_file.name}")
+        write_csv(csv_file, df)
+        report(f"    ✓ CSV: {csv_file.name}")
         
         return df
     
-    def export_organism_comparison(self, results):
-        """Export organism comparison table"""
+    def export_organism_comparison(self, df, report=print):
+        """Export organism comparison table to CSV (Excel: master workbook)"""
         
-        print("  [3/5] Exporting organism comparison...")
-        
-        comparison_data = []
-        
-        for organism_result in results:
-            organism = organism_result['organism']
-            
-            glyc_data = [p for p in organism_result['pathway_results'] if p['pathway'] == 'glycolysis']
-            tca_data = [p for p in organism_result['pathway_results'] if p['pathway'] == 'tca']
-            
-            glyc_error = np.mean(glyc_data[0]['errors']) if glyc_data else None
-            tca_error = np.mean(tca_data[0]['errors']) if tca_data else None
-            
-            comparison_data.append({
-                'Organism': organism,
-                'Total_Parameters': organism_result['total_params'],
-                'Glycolysis_Params': len(glyc_data[0]['parameters']) if glyc_data else 0,
-                'TCA_Params': len(tca_data[0]['parameters']) if tca_data else 0,
-                'Glycolysis_Error_%': glyc_error if glyc_error else 'N/A',
-                'TCA_Error_%': tca_error if tca_error else 'N/A',
-                'Overall_Error_%': organism_result['overall_error'],
-                'Total_Runtime_Hours': organism_result['total_runtime'] / 3600,
-            })
-        
-        df = pd.DataFrame(comparison_data)
-        
-        # Export to Excel
-        excel_file = self.output_folder / 'organism_comparison.xlsx'
-        df.to_excel(excel_file, index=False)
-        print(f"    ✓ Excel: {excel_file.name}")
+        report("  [3/5] Exporting organism comparison...")
         
         # Export to CSV
         csv_file = self.output_folder / 'organism_comparison.csv'
-        df.to_csv(csv_file, index=False)
-        print(f"    ✓ CSV: {csv_file.name}")
+        write_csv(csv_file, df)
+        report(f"    ✓ CSV: {csv_file.name}")
         
         return df
     
-    def export_error_distributions(self, results):
+    def export_error_distributions(self, df, report=print):
         """Export error distribution data"""
         
-        print("  [4/5] Exporting error distributions...")
+        report("  [4/5] Exporting error distributions...")
         
-        all_errors = []
+        # Percent errors need ~7 significant digits: float32 halves the
+        # Parquet column and shortens every CSV value
+        df = df.astype({'Relative_Error_%': np.float32})
         
-        for organism_result in results:
-            organism = organism_result['organism']
-            
-            for pathway_data in organism_result['pathway_results']:
-                pathway = pathway_data['pathway']
-                errors = pathway_data['errors']
-                
-                for error in errors:
-                    all_errors.append({
-                        'Organism': organism,
-                        'Pathway': pathway.upper(),
-                        'Relative_Error_%': error
-                    })
+        # Export to Parquet (primary) and CSV
+        parquet_file = self.output_folder / 'error_distributions.parquet'
+        if write_parquet(parquet_file, df):
+            report(f"    ✓ Parquet: {parquet_file.name}")
         
-        df = pd.DataFrame(all_errors)
+        if self.error_csv:
+            csv_file = self.output_folder / 'error_distributions.csv'
+            write_csv(csv_file, df)
+            report(f"    ✓ CSV: {csv_file.name}")
         
-        # Export to CSV
-        csv_file = self.output_folder / 'error_distributions.csv'
-        df.to_csv(csv_file, index=False)
-        print(f"    ✓ CSV: {csv_file.name}")
+        if self.error_xlsx:
+            excel_file = self.output_folder / 'error_distributions.xlsx'
+            write_excel(excel_file, [('Error_Distributions', df)])
+            report(f"    ✓ Excel: {excel_file.name}")
         
         return df
     
-    def export_master_workbook(self, param_df, summary_df, comparison_df, error_df):
-        """Create master Excel workbook with all data"""
+    def export_master_workbook(self, param_df, summary_df, comparison_df, error_df, report=print):
+        """Create master Excel workbook with all data
+        
+        The only .xlsx written: every table goes here once, with the CSVs
+        as lightweight companions.
+        """
         
-        print("  [5/5] Creating master workbook...")
+        report("  [5/5] Creating master workbook...")
         
         master_file = self.output_folder / 'MASTER_Results.xlsx'
         
-        with pd.ExcelWriter(master_file, engine='openpyxl') as writer:
-            # Summary page
-            comparison_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Statistics
-            summary_df.to_excel(writer, sheet_name='Statistics', index=False)
-            
-            # All parameters
-            param_df.to_excel(writer, sheet_name='All_Parameters', index=False)
-            
-            # Error distributions
-            error_df.to_excel(writer, sheet_name='Error_Distributions', index=False)
-            
-            # By organism
-            for organism in param_df['Organism'].unique():
-                org_params = param_df[param_df['Organism'] == organism]
-                sheet_name = organism.replace(' ', '_')[:31]
-                org_params.to_excel(writer, sheet_name=sheet_name, index=False)
+        sheets = [
+            ('Summary', comparison_df),               # Summary page
+            ('Statistics', summary_df),               # Statistics
+            ('All_Parameters', param_df),             # All parameters
+            ('Error_Distributions', error_df),        # Error distributions
+        ]
+        
+        # By organism
+        for organism, org_params in organism_groups(param_df):
+            sheets.append((sheet_name_for(organism), org_params))
         
-        print(f"    ✓ Master: {master_file.name}")
+        write_excel(master_file, sheets)
+        
+        report(f"    ✓ Master: {master_file.name}")
         
         return master_file
     
     def export_all(self):
         """Export all data formats"""
         
-        results = self.load_results()
+        flat = self.load_results_flat()
         
         print("Exporting data to Excel and CSV formats...\n")
         
-        # Export all formats
-        param_df = self.export_parameter_table(results)
-        summary_df = self.export_summary_statistics(results)
-        comparison_df = self.export_organism_comparison(results)
-        error_df = self.export_error_distributions(results)
-        
-        # Create master workbook
-        master_file = self.export_master_workbook(param_df, summary_df, comparison_df, error_df)
+        # Every table is derived from the flat results; the exporters only write
+        param_df, summary_df, comparison_df, error_df = self.build_frames(flat)
+        
+        # The writers are independent once the tables exist, so they run
+        # side by side; each collects its report lines, printed in order
+        jobs = [
+            (self.export_parameter_table, (param_df,)),
+            (self.export_summary_statistics, (summary_df,)),
+            (self.export_organism_comparison, (comparison_df,)),
+            (self.export_error_distributions, (error_df,)),
+            (self.export_master_workbook, (param_df, summary_df, comparison_df, error_df)),
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            reports = [[] for _ in jobs]
+            futures = [pool.submit(fn, *args, report=lines.append)
+                       for (fn, args), lines in zip(jobs, reports)]
+            for future, lines in zip(futures, reports):
+                future.result()
+                print("\n".join(lines))
         
         print(f"\n{'='*70}")
         print("DATA EXPORT COMPLETE!")
@@ -273,10 +488,16 @@ class DataExporter:
         print(f"\nGenerated files in: {self.output_folder}")
         print("\nFiles created:")
         print("  ✓ MASTER_Results.xlsx (All data in one workbook)")
-        print("  ✓ parameter_estimates.xlsx & .csv")
-        print("  ✓ summary_statistics.xlsx & .csv")
-        print("  ✓ organism_comparison.xlsx & .csv")
-        print("  ✓ error_distributions.csv")
+        if HAVE_PYARROW:
+            print("  ✓ parameter_estimates.csv & .parquet")
+        else:
+            print("  ✓ parameter_estimates.csv")
+        print("  ✓ summary_statistics.csv")
+        print("  ✓ organism_comparison.csv")
+        if HAVE_PYARROW:
+            print("  ✓ error_distributions.parquet" + (" & .csv" if self.error_csv else ""))
+        else:
+            print("  ✓ error_distributions.csv")
         print("\nAll files are ready for:")
         print("  - Excel analysis and pivot tables")
         print("  - Statistical software (R, Python)")
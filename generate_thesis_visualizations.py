@@ -5,6 +5,9 @@ Can run in two modes:
 1. With command line argument: py -3 script.py results/SessionX
 2. Interactive mode: Shows menu of available sessions
 
+Plots newer than the session's parameter_estimation.npz are skipped on
+re-runs; pass --force to redraw everything.
+
 Produces 12 files per organism:
 - 9 individual plots (300 DPI, high-res)
 - 2 grouped plots (related analyses)
@@ -12,17 +15,104 @@ Produces 12 files per organism:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.gridspec import GridSpec
+from matplotlib.figure import Figure, SubplotParams
 from pathlib import Path
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from contextlib import redirect_stdout
+import io
+import os
 import json
+from numba_compat import njit, HAVE_NUMBA
+from data_io import load_results
+
+# High-quality settings: figures render at screen resolution and are
+# only rasterized at 300 DPI when saved
+matplotlib.rcParams['figure.dpi'] = 100
+matplotlib.rcParams['savefig.dpi'] = 300
+matplotlib.rcParams['font.size'] = 10
+matplotlib.rcParams['font.family'] = 'serif'
+matplotlib.rcParams['axes.linewidth'] = 1.2
+
+ERROR_PALETTE = np.array(['green', 'orange', 'red'])
+NUMBA_COLOR_MIN_SIZE = 4096  # below this np.select beats the kernel call
+
+@njit(cache=True)
+def _error_codes(errors):
+    """Palette index per error: 0 (<10%), 1 (<20%), 2 otherwise"""
+    out = np.empty(errors.size, np.int8)
+    for i in range(errors.size):
+        e = errors[i]
+        out[i] = 0 if e < 10 else (1 if e < 20 else 2)
+    return out
+
+def _err_colors(errors):
+    """Bar colors by relative error: <10% green, <20% orange, else red"""
+    e = np.asarray(errors)
+    if HAVE_NUMBA and e.size > NUMBA_COLOR_MIN_SIZE:
+        codes = _error_codes(np.ascontiguousarray(e, dtype=np.float64).ravel())
+        return ERROR_PALETTE[codes].reshape(e.shape)
+    return np.select([e < 10, e < 20], ERROR_PALETTE[:2], default=ERROR_PALETTE[2])
+
+def _padded(rows, dtype=np.float64):
+    """Stack ragged 1-D rows into a NaN-padded float matrix; returns (matrix, lengths)"""
+    lengths = [len(row) for row in rows]
+    matrix = np.full((len(rows), max(lengths, default=0)), np.nan, dtype=dtype)
+    for out, row, n in zip(matrix, rows, lengths):
+        out[:n] = row
+    return matrix, lengths
+
+def _row_medians(matrix):
+    """Per-row median ignoring NaN, like np.nanmedian(matrix, axis=1)
+
+    One sort of the whole matrix (NaN sorts last) and two gathers; much
+    cheaper than nanmedian, which goes through masked arrays for short rows.
+    """
+    n = np.count_nonzero(~np.isnan(matrix), axis=1)
+    if matrix.shape[1] == 0:
+        return np.full(len(matrix), np.nan)
+    ordered = np.sort(matrix, axis=1)
+    rows = np.arange(len(matrix))
+    middle = (ordered[rows, np.maximum(n - 1, 0) // 2] + ordered[rows, n // 2]) / 2
+    return np.where(n > 0, middle, np.nan)
+
+def _hist_bars(ax, hist, **kwargs):
+    """Draw a precomputed np.histogram (counts, edges) as ax.hist would"""
+    counts, edges = hist
+    return ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **kwargs)
+
+def new_figure(**kwargs):
+    """Agg-backed Figure outside pyplot (no figure manager, no plt.close)"""
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
 
-# High-quality settings
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['font.size'] = 10
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['axes.linewidth'] = 1.2
+def save_png(fig, path):
+    """Save a figure as a 300 DPI PNG cropped to its artists (bbox_inches='tight')
+
+    The PNG is written to a .tmp file and renamed into place, so an
+    interrupted run never leaves a partial PNG that the up-to-date check
+    would then keep.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        fig.savefig(tmp, format='png', dpi=300, bbox_inches='tight')
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+# Plot-ready view of one pathway result: arrays and statistics shared by
+# the individual, grouped and overview plots
+PathwayPlotData = namedtuple(
+    'PathwayPlotData',
+    ['pathway', 'x', 'true_vals', 'estimated', 'errors', 'mean', 'median', 'colors',
+     'mean_label', 'median_label', 'hist', 'overview_hist']
+)
 
 class ThesisVisualizer:
     """Generate publication-quality visualizations"""
@@ -32,6 +122,8 @@ class ThesisVisualizer:
         self.results_folder = Path(results_folder)
         self.output_folder = self.results_folder / 'visualizations'
         self.output_folder.mkdir(exist_ok=True)
+        self._xcache = {}  # parameter count -> shared np.arange x-axis
+        self._src_mtime = None  # set by generate_all to skip up-to-date plots
         
         print(f"\n{'='*70}")
         print(f"THESIS VISUALIZATION GENERATOR")
@@ -47,13 +139,66 @@ class ThesisVisualizer:
         if not result_file.exists():
             raise FileNotFoundError(f"Results file not found: {result_file}")
         
-        data = np.load(result_file, allow_pickle=True)
-        results = data['results']
+        results = load_results(result_file)
         
         print(f"✓ Loaded results for {len(results)} organisms")
         return results
     
-    def create_individual_plots(self, organism_result, organism_name):
+    def _up_to_date(self, path, label):
+        """True (and reported) if path is newer than the results file"""
+        if (self._src_mtime is not None and path.exists()
+                and path.stat().st_mtime >= self._src_mtime):
+            print(f"    - {label} (up to date)")
+            return True
+        return False
+    
+    def _x(self, n):
+        """Parameter-index x-axis of length n (one array per distinct n)"""
+        x = self._xcache.get(n)
+        if x is None:
+            x = self._xcache[n] = np.arange(n)
+        return x
+    
+    def prepare_pathways(self, organism_result):
+        """Convert the pathway results to arrays and summary stats once
+
+        Each field is stacked into one NaN-padded (n_pathways x max_params)
+        matrix, so the statistics and bar colours are computed for every
+        pathway in a single vectorized call; the per-pathway arrays handed
+        to the plots are row views of those matrices.
+        """
+        pathway_results = organism_result['pathway_results']
+        # Plot data is float32 (half the bytes through the draw pipeline);
+        # statistics and colour thresholds use the float64 errors
+        estimated, n_est = _padded([p['estimated'] for p in pathway_results], np.float32)
+        true_vals, n_true = _padded([p['true_values'] if 'true_values' in p else p['initial_guess']
+                                     for p in pathway_results], np.float32)
+        errors, n_err = _padded([p['errors'] for p in pathway_results])
+        
+        means = np.nanmean(errors, axis=1)
+        medians = _row_medians(errors)
+        colors = _err_colors(errors)
+        errors = errors.astype(np.float32)
+        
+        prepared = []
+        for i, pathway_data in enumerate(pathway_results):
+            prepared.append(PathwayPlotData(
+                pathway=pathway_data['pathway'],
+                x=self._x(len(pathway_data['parameters'])),
+                true_vals=true_vals[i, :n_true[i]],
+                estimated=estimated[i, :n_est[i]],
+                errors=errors[i, :n_err[i]],
+                mean=means[i],
+                median=medians[i],
+                colors=colors[i, :n_err[i]],
+                mean_label=f'Mean: {means[i]:.2f}%',
+                median_label=f'Median: {medians[i]:.2f}%',
+                hist=np.histogram(errors[i, :n_err[i]], bins=20),
+                overview_hist=np.histogram(errors[i, :n_err[i]], bins=15)
+            ))
+        return prepared
+    
+    def create_individual_plots(self, pathways, organism_name):
         """Create individual high-res plots"""
         
         print(f"\n  Creating individual plots for {organism_name}...")
@@ -61,210 +206,185 @@ class ThesisVisualizer:
         org_folder = self.output_folder / organism_name.replace(' ', '_')
         org_folder.mkdir(exist_ok=True)
         
-        pathway_results = organism_result['pathway_results']
-        
         plot_count = 0
         
-        for pathway_data in pathway_results:
-            pathway = pathway_data['pathway']
-            params = pathway_data['parameters']
-            estimated = np.array(pathway_data['estimated'])
-            
-            if 'true_values' in pathway_data:
-                true_vals = np.array(pathway_data['true_values'])
-            else:
-                true_vals = np.array(pathway_data['initial_guess'])
-            
-            errors = pathway_data['errors']
+        # All individual plots share one 10x6 figure: clear and redraw the
+        # axes instead of building (and tearing down) a figure per plot.
+        # The tight layout engine lays each plot out as part of its save draw
+        fig = new_figure(figsize=(10, 6), layout='tight')
+        ax = fig.add_subplot()
+        default_layout = vars(SubplotParams())
+        
+        def new_plot():
+            # The tight layout starts from the current margins: reset them so
+            # every plot is laid out as if on a fresh figure
+            ax.clear()
+            fig.subplots_adjust(**default_layout)
+        
+        for p in pathways:
+            pathway, x, true_vals, estimated, errors = p[:5]
             
             # Plot 1: Parameter Estimates vs True Values
             plot_count += 1
-            fig, ax = plt.subplots(figsize=(10, 6))
-            x = np.arange(len(params))
-            ax.scatter(x, true_vals, label='True Values', marker='o', s=80, alpha=0.6, color='blue')
-            ax.scatter(x, estimated, label='Estimated', marker='x', s=80, alpha=0.6, color='red')
-            ax.set_xlabel('Parameter Index', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Parameter Value', fontsize=12, fontweight='bold')
-            ax.set_title(f'{organism_name} - {pathway.upper()}: Parameter Estimation', 
-                        fontsize=14, fontweight='bold')
-            ax.legend(fontsize=11)
-            ax.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(org_folder / f'{plot_count:02d}_{pathway}_param_estimates.png', dpi=300, bbox_inches='tight')
-            plt.close()
-            print(f"    ✓ Plot {plot_count}: {pathway} parameter estimates")
+            path = org_folder / f'{plot_count:02d}_{pathway}_param_estimates.png'
+            if not self._up_to_date(path, f"Plot {plot_count}: {pathway} parameter estimates"):
+                new_plot()
+                ax.scatter(x, true_vals, label='True Values', marker='o', s=80, alpha=0.6, color='blue')
+                ax.scatter(x, estimated, label='Estimated', marker='x', s=80, alpha=0.6, color='red')
+                ax.set_xlabel('Parameter Index', fontsize=12, fontweight='bold')
+                ax.set_ylabel('Parameter Value', fontsize=12, fontweight='bold')
+                ax.set_title(f'{organism_name} - {pathway.upper()}: Parameter Estimation', 
+                            fontsize=14, fontweight='bold')
+                ax.legend(fontsize=11)
+                ax.grid(True, alpha=0.3)
+                save_png(fig, path)
+                print(f"    ✓ Plot {plot_count}: {pathway} parameter estimates")
             
             # Plot 2: Relative Errors
             plot_count += 1
-            fig, ax = plt.subplots(figsize=(10, 6))
-            colors = ['green' if e < 10 else 'orange' if e < 20 else 'red' for e in errors]
-            ax.bar(x, errors, color=colors, alpha=0.7, edgecolor='black', linewidth=1.2)
-            ax.axhline(y=np.mean(errors), color='blue', linestyle='--', linewidth=2, 
-                      label=f'Mean Error: {np.mean(errors):.2f}%')
-            ax.set_xlabel('Parameter Index', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Relative Error (%)', fontsize=12, fontweight='bold')
-            ax.set_title(f'{organism_name} - {pathway.upper()}: Estimation Errors', 
-                        fontsize=14, fontweight='bold')
-            ax.legend(fontsize=11)
-            ax.grid(True, alpha=0.3, axis='y')
-            plt.tight_layout()
-            plt.savefig(org_folder / f'{plot_count:02d}_{pathway}_errors.png', dpi=300, bbox_inches='tight')
-            plt.close()
-            print(f"    ✓ Plot {plot_count}: {pathway} errors")
+            path = org_folder / f'{plot_count:02d}_{pathway}_errors.png'
+            if not self._up_to_date(path, f"Plot {plot_count}: {pathway} errors"):
+                new_plot()
+                ax.bar(x, errors, color=p.colors, alpha=0.7, edgecolor='black', linewidth=1.2)
+                ax.axhline(y=p.mean, color='blue', linestyle='--', linewidth=2, 
+                          label=f'Mean Error: {p.mean:.2f}%')
+                ax.set_xlabel('Parameter Index', fontsize=12, fontweight='bold')
+                ax.set_ylabel('Relative Error (%)', fontsize=12, fontweight='bold')
+                ax.set_title(f'{organism_name} - {pathway.upper()}: Estimation Errors', 
+                            fontsize=14, fontweight='bold')
+                ax.legend(fontsize=11)
+                ax.grid(True, alpha=0.3, axis='y')
+                save_png(fig, path)
+                print(f"    ✓ Plot {plot_count}: {pathway} errors")
             
             # Plot 3: Error Distribution
             plot_count += 1
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.hist(errors, bins=20, color='skyblue', edgecolor='black', linewidth=1.2, alpha=0.7)
-            ax.axvline(x=np.mean(errors), color='red', linestyle='--', linewidth=2, 
-                      label=f'Mean: {np.mean(errors):.2f}%')
-            ax.axvline(x=np.median(errors), color='green', linestyle='--', linewidth=2, 
-                      label=f'Median: {np.median(errors):.2f}%')
-            ax.set_xlabel('Relative Error (%)', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Frequency', fontsize=12, fontweight='bold')
-            ax.set_title(f'{organism_name} - {pathway.upper()}: Error Distribution', 
-                        fontsize=14, fontweight='bold')
-            ax.legend(fontsize=11)
-            ax.grid(True, alpha=0.3, axis='y')
-            plt.tight_layout()
-            plt.savefig(org_folder / f'{plot_count:02d}_{pathway}_error_dist.png', dpi=300, bbox_inches='tight')
-            plt.close()
-            print(f"    ✓ Plot {plot_count}: {pathway} error distribution")
+            path = org_folder / f'{plot_count:02d}_{pathway}_error_dist.png'
+            if not self._up_to_date(path, f"Plot {plot_count}: {pathway} error distribution"):
+                new_plot()
+                _hist_bars(ax, p.hist, color='skyblue', edgecolor='black', linewidth=1.2, alpha=0.7)
+                ax.axvline(x=p.mean, color='red', linestyle='--', linewidth=2, 
+                          label=p.mean_label)
+                ax.axvline(x=p.median, color='green', linestyle='--', linewidth=2, 
+                          label=p.median_label)
+                ax.set_xlabel('Relative Error (%)', fontsize=12, fontweight='bold')
+                ax.set_ylabel('Frequency', fontsize=12, fontweight='bold')
+                ax.set_title(f'{organism_name} - {pathway.upper()}: Error Distribution', 
+                            fontsize=14, fontweight='bold')
+                ax.legend(fontsize=11)
+                ax.grid(True, alpha=0.3, axis='y')
+                save_png(fig, path)
+                print(f"    ✓ Plot {plot_count}: {pathway} error distribution")
         
         # Overall organism summary plots
-        all_errors = []
-        for pathway_data in pathway_results:
-            all_errors.extend(pathway_data['errors'])
+        pathway_names = [p.pathway.upper() for p in pathways]
+        colors_pathway = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
         
         # Plot: Overall Error Summary
         plot_count += 1
-        fig, ax = plt.subplots(figsize=(10, 6))
-        pathway_names = [p['pathway'].upper() for p in pathway_results]
-        pathway_errors = [np.mean(p['errors']) for p in pathway_results]
-        colors_pathway = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
-        ax.bar(pathway_names, pathway_errors, color=colors_pathway[:len(pathway_names)], 
-               alpha=0.7, edgecolor='black', linewidth=1.5)
-        ax.set_ylabel('Mean Relative Error (%)', fontsize=12, fontweight='bold')
-        ax.set_title(f'{organism_name} - Overall Pathway Performance', 
-                    fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        plt.savefig(org_folder / f'{plot_count:02d}_overall_pathway_performance.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"    ✓ Plot {plot_count}: Overall pathway performance")
+        path = org_folder / f'{plot_count:02d}_overall_pathway_performance.png'
+        if not self._up_to_date(path, f"Plot {plot_count}: Overall pathway performance"):
+            new_plot()
+            pathway_errors = [p.mean for p in pathways]
+            ax.bar(pathway_names, pathway_errors, color=colors_pathway[:len(pathway_names)], 
+                   alpha=0.7, edgecolor='black', linewidth=1.5)
+            ax.set_ylabel('Mean Relative Error (%)', fontsize=12, fontweight='bold')
+            ax.set_title(f'{organism_name} - Overall Pathway Performance', 
+                        fontsize=14, fontweight='bold')
+            ax.grid(True, alpha=0.3, axis='y')
+            save_png(fig, path)
+            print(f"    ✓ Plot {plot_count}: Overall pathway performance")
         
         # Plot: Box plot of all errors
         plot_count += 1
-        fig, ax = plt.subplots(figsize=(10, 6))
-        error_data = [p['errors'] for p in pathway_results]
-        bp = ax.boxplot(error_data, tick_labels=pathway_names, patch_artist=True,
-                       widths=0.6, showmeans=True)
-        for patch, color in zip(bp['boxes'], colors_pathway[:len(pathway_names)]):
-            patch.set_facecolor(color)
-            patch.set_alpha(0.7)
-        ax.set_ylabel('Relative Error (%)', fontsize=12, fontweight='bold')
-        ax.set_title(f'{organism_name} - Error Distribution by Pathway', 
-                    fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3, axis='y')
-        plt.tight_layout()
-        plt.savefig(org_folder / f'{plot_count:02d}_error_boxplot.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"    ✓ Plot {plot_count}: Error boxplot")
+        path = org_folder / f'{plot_count:02d}_error_boxplot.png'
+        if not self._up_to_date(path, f"Plot {plot_count}: Error boxplot"):
+            new_plot()
+            error_data = [p.errors for p in pathways]
+            bp = ax.boxplot(error_data, tick_labels=pathway_names, patch_artist=True,
+                           widths=0.6, showmeans=True)
+            for patch, color in zip(bp['boxes'], colors_pathway[:len(pathway_names)]):
+                patch.set_facecolor(color)
+                patch.set_alpha(0.7)
+            ax.set_ylabel('Relative Error (%)', fontsize=12, fontweight='bold')
+            ax.set_title(f'{organism_name} - Error Distribution by Pathway', 
+                        fontsize=14, fontweight='bold')
+            ax.grid(True, alpha=0.3, axis='y')
+            save_png(fig, path)
+            print(f"    ✓ Plot {plot_count}: Error boxplot")
         
         return plot_count
     
-    def create_grouped_plots(self, organism_result, organism_name):
+    def create_grouped_plots(self, pathways, organism_name):
         """Create 2 grouped plots combining related analyses"""
         
         print(f"\n  Creating grouped plots for {organism_name}...")
         
         org_folder = self.output_folder / organism_name.replace(' ', '_')
-        pathway_results = organism_result['pathway_results']
         
         # Grouped Plot 1: Parameter Estimates (all pathways)
-        fig = plt.figure(figsize=(16, 10))
-        gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
-        
-        for idx, pathway_data in enumerate(pathway_results):
-            pathway = pathway_data['pathway']
-            params = pathway_data['parameters']
-            estimated = np.array(pathway_data['estimated'])
+        path = org_folder / 'GROUPED_01_all_pathways_estimates.png'
+        if not self._up_to_date(path, "Grouped plot 1: All pathways estimates"):
+            fig = new_figure(figsize=(16, 10))
+            gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
             
-            if 'true_values' in pathway_data:
-                true_vals = np.array(pathway_data['true_values'])
-            else:
-                true_vals = np.array(pathway_data['initial_guess'])
+            for idx, p in enumerate(pathways):
+                ax = fig.add_subplot(gs[idx])
+                ax.scatter(p.x, p.true_vals, label='True', marker='o', s=60, alpha=0.6)
+                ax.scatter(p.x, p.estimated, label='Estimated', marker='x', s=60, alpha=0.6)
+                ax.set_xlabel('Parameter Index', fontsize=11, fontweight='bold')
+                ax.set_ylabel('Value', fontsize=11, fontweight='bold')
+                ax.set_title(f'{p.pathway.upper()} Pathway', fontsize=12, fontweight='bold')
+                ax.legend(fontsize=10)
+                ax.grid(True, alpha=0.3)
             
-            ax = fig.add_subplot(gs[idx])
-            x = np.arange(len(params))
-            ax.scatter(x, true_vals, label='True', marker='o', s=60, alpha=0.6)
-            ax.scatter(x, estimated, label='Estimated', marker='x', s=60, alpha=0.6)
-            ax.set_xlabel('Parameter Index', fontsize=11, fontweight='bold')
-            ax.set_ylabel('Value', fontsize=11, fontweight='bold')
-            ax.set_title(f'{pathway.upper()} Pathway', fontsize=12, fontweight='bold')
-            ax.legend(fontsize=10)
-            ax.grid(True, alpha=0.3)
-        
-        fig.suptitle(f'{organism_name} - All Pathways Parameter Estimation', 
-                    fontsize=16, fontweight='bold')
-        plt.savefig(org_folder / 'GROUPED_01_all_pathways_estimates.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"    ✓ Grouped plot 1: All pathways estimates")
+            fig.suptitle(f'{organism_name} - All Pathways Parameter Estimation', 
+                        fontsize=16, fontweight='bold')
+            save_png(fig, path)
+            print(f"    ✓ Grouped plot 1: All pathways estimates")
         
         # Grouped Plot 2: Error Analysis (all pathways)
-        fig = plt.figure(figsize=(16, 10))
-        gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
-        
-        for idx, pathway_data in enumerate(pathway_results):
-            pathway = pathway_data['pathway']
-            errors = pathway_data['errors']
+        path = org_folder / 'GROUPED_02_all_pathways_errors.png'
+        if not self._up_to_date(path, "Grouped plot 2: All pathways errors"):
+            fig = new_figure(figsize=(16, 10))
+            gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
             
-            ax = fig.add_subplot(gs[idx])
-            x = np.arange(len(errors))
-            colors = ['green' if e < 10 else 'orange' if e < 20 else 'red' for e in errors]
-            ax.bar(x, errors, color=colors, alpha=0.7, edgecolor='black')
-            ax.axhline(y=np.mean(errors), color='blue', linestyle='--', linewidth=2,
-                      label=f'Mean: {np.mean(errors):.2f}%')
-            ax.set_xlabel('Parameter Index', fontsize=11, fontweight='bold')
-            ax.set_ylabel('Error (%)', fontsize=11, fontweight='bold')
-            ax.set_title(f'{pathway.upper()} Errors', fontsize=12, fontweight='bold')
-            ax.legend(fontsize=10)
-            ax.grid(True, alpha=0.3, axis='y')
-        
-        fig.suptitle(f'{organism_name} - All Pathways Error Analysis', 
-                    fontsize=16, fontweight='bold')
-        plt.savefig(org_folder / 'GROUPED_02_all_pathways_errors.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"    ✓ Grouped plot 2: All pathways errors")
+            for idx, p in enumerate(pathways):
+                ax = fig.add_subplot(gs[idx])
+                ax.bar(p.x, p.errors, color=p.colors, alpha=0.7, edgecolor='black')
+                ax.axhline(y=p.mean, color='blue', linestyle='--', linewidth=2,
+                          label=p.mean_label)
+                ax.set_xlabel('Parameter Index', fontsize=11, fontweight='bold')
+                ax.set_ylabel('Error (%)', fontsize=11, fontweight='bold')
+                ax.set_title(f'{p.pathway.upper()} Errors', fontsize=12, fontweight='bold')
+                ax.legend(fontsize=10)
+                ax.grid(True, alpha=0.3, axis='y')
+            
+            fig.suptitle(f'{organism_name} - All Pathways Error Analysis', 
+                        fontsize=16, fontweight='bold')
+            save_png(fig, path)
+            print(f"    ✓ Grouped plot 2: All pathways errors")
     
-    def create_overview_plot(self, organism_result, organism_name):
+    def create_overview_plot(self, pathways, organism_name):
         """Create 1 overview plot with all 9 sub-analyses"""
         
         print(f"\n  Creating overview plot for {organism_name}...")
         
         org_folder = self.output_folder / organism_name.replace(' ', '_')
-        pathway_results = organism_result['pathway_results']
+        path = org_folder / 'OVERVIEW_complete_analysis.png'
+        if self._up_to_date(path, "Overview plot: Complete analysis"):
+            return
         
-        fig = plt.figure(figsize=(20, 12))
+        fig = new_figure(figsize=(20, 12))
         gs = GridSpec(3, 3, figure=fig, hspace=0.4, wspace=0.4)
         
         plot_idx = 0
         
-        for pathway_data in pathway_results:
-            pathway = pathway_data['pathway']
-            params = pathway_data['parameters']
-            estimated = np.array(pathway_data['estimated'])
-            
-            if 'true_values' in pathway_data:
-                true_vals = np.array(pathway_data['true_values'])
-            else:
-                true_vals = np.array(pathway_data['initial_guess'])
-            
-            errors = pathway_data['errors']
+        for p in pathways:
+            pathway, x, true_vals, estimated, errors = p[:5]
             
             # Sub-plot 1: Estimates
             ax = fig.add_subplot(gs[plot_idx])
-            x = np.arange(len(params))
             ax.scatter(x, true_vals, label='True', marker='o', s=40, alpha=0.6)
             ax.scatter(x, estimated, label='Est', marker='x', s=40, alpha=0.6)
             ax.set_title(f'{pathway.upper()}: Estimates', fontsize=10, fontweight='bold')
@@ -274,62 +394,88 @@ class ThesisVisualizer:
             
             # Sub-plot 2: Errors
             ax = fig.add_subplot(gs[plot_idx])
-            colors = ['green' if e < 10 else 'orange' if e < 20 else 'red' for e in errors]
-            ax.bar(x, errors, color=colors, alpha=0.7, edgecolor='black', linewidth=0.5)
-            ax.axhline(y=np.mean(errors), color='blue', linestyle='--', linewidth=1.5)
+            ax.bar(x, errors, color=p.colors, alpha=0.7, edgecolor='black', linewidth=0.5)
+            ax.axhline(y=p.mean, color='blue', linestyle='--', linewidth=1.5)
             ax.set_title(f'{pathway.upper()}: Errors', fontsize=10, fontweight='bold')
             ax.grid(True, alpha=0.3, axis='y')
             plot_idx += 1
             
             # Sub-plot 3: Distribution
             ax = fig.add_subplot(gs[plot_idx])
-            ax.hist(errors, bins=15, color='skyblue', edgecolor='black', linewidth=0.8, alpha=0.7)
-            ax.axvline(x=np.mean(errors), color='red', linestyle='--', linewidth=1.5)
+            _hist_bars(ax, p.overview_hist, color='skyblue', edgecolor='black', linewidth=0.8, alpha=0.7)
+            ax.axvline(x=p.mean, color='red', linestyle='--', linewidth=1.5)
             ax.set_title(f'{pathway.upper()}: Distribution', fontsize=10, fontweight='bold')
             ax.grid(True, alpha=0.3, axis='y')
             plot_idx += 1
         
         fig.suptitle(f'{organism_name} - Complete Analysis Overview', 
                     fontsize=18, fontweight='bold')
-        plt.savefig(org_folder / 'OVERVIEW_complete_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        save_png(fig, path)
         print(f"    ✓ Overview plot: Complete analysis")
     
-    def generate_all(self):
-        """Generate all visualizations for all organisms"""
+    def visualize_organism(self, organism_result):
+        """Write every plot for one organism; returns its summary entry"""
+        organism_name = organism_result['organism']
         
-        results = self.load_results()
+        print(f"\n{'='*70}")
+        print(f"PROCESSING: {organism_name}")
+        print(f"{'='*70}")
         
-        summary = []
+        pathways = self.prepare_pathways(organism_result)
         
-        for organism_result in results:
-            organism_name = organism_result['organism']
-            
-            print(f"\n{'='*70}")
-            print(f"PROCESSING: {organism_name}")
-            print(f"{'='*70}")
-            
-            # Individual plots
-            n_individual = self.create_individual_plots(organism_result, organism_name)
-            
-            # Grouped plots
-            self.create_grouped_plots(organism_result, organism_name)
-            
-            # Overview plot
-            self.create_overview_plot(organism_result, organism_name)
-            
-            total_files = n_individual + 3
-            
-            org_folder = self.output_folder / organism_name.replace(' ', '_')
-            
-            summary.append({
-                'organism': organism_name,
-                'files': total_files,
-                'folder': str(org_folder)
-            })
-            
-            print(f"\n  ✓ Generated {total_files} visualization files")
-            print(f"  ✓ Saved in: {org_folder}")
+        # Individual plots
+        n_individual = self.create_individual_plots(pathways, organism_name)
+        
+        # Grouped plots
+        self.create_grouped_plots(pathways, organism_name)
+        
+        # Overview plot
+        self.create_overview_plot(pathways, organism_name)
+        
+        total_files = n_individual + 3
+        
+        org_folder = self.output_folder / organism_name.replace(' ', '_')
+        
+        print(f"\n  ✓ Generated {total_files} visualization files")
+        print(f"  ✓ Saved in: {org_folder}")
+        
+        return {
+            'organism': organism_name,
+            'files': total_files,
+            'folder': str(org_folder)
+        }
+    
+    def generate_all(self, force=False):
+        """Generate all visualizations for all organisms
+
+        Plots newer than parameter_estimation.npz are kept as they are
+        unless force is set.
+        """
+        
+        results = self.load_results()
+        result_file = self.results_folder / 'parameter_estimation.npz'
+        self._src_mtime = None if force else result_file.stat().st_mtime
+        
+        # Organisms write to separate folders, so they render in parallel
+        # (processes: Agg rasterization holds the GIL)
+        n_workers = min(len(results), os.cpu_count() or 1)
+        
+        if n_workers > 1:
+            # Spawned, not forked: the MAIN script renders in the process
+            # that ran the Numba threaded estimation kernels, and a fork
+            # after those leaves it hung at exit
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as executor:
+                futures = [executor.submit(_visualize_organism_captured, self, organism_result)
+                           for organism_result in results]
+                # Replay each organism's log in order instead of interleaved
+                summary = []
+                for future in futures:
+                    entry, log_text = future.result()
+                    print(log_text, end='')
+                    summary.append(entry)
+        else:
+            summary = [self.visualize_organism(organism_result) for organism_result in results]
         
         # Print final summary
         print(f"\n{'='*70}")
@@ -348,6 +494,13 @@ class ThesisVisualizer:
         print("Use grouped/overview plots for presentations.")
         print(f"{'='*70}\n")
 
+def _visualize_organism_captured(visualizer, organism_result):
+    """Worker-process entry: run visualize_organism, capturing its output"""
+    log = io.StringIO()
+    with redirect_stdout(log):
+        entry = visualizer.visualize_organism(organism_result)
+    return entry, log.getvalue()
+
 def select_results_folder():
     """Interactive folder selection"""
     
@@ -421,9 +574,13 @@ def main():
     """Main function with enhanced interface"""
     import sys
     
+    # --force redraws plots that are already newer than the results
+    args = [a for a in sys.argv[1:] if a != '--force']
+    force = len(args) < len(sys.argv) - 1
+    
     # Mode 1: Command line argument
-    if len(sys.argv) >= 2:
-        results_folder = sys.argv[1]
+    if args:
+        results_folder = args[0]
         
         if not Path(results_folder).exists():
             print(f"\n✗ Error: Results folder not found: {results_folder}")
@@ -446,9 +603,18 @@ def main():
             print("\nCancelled.")
             return
     
+    # Import the exporter up front, so answering the export prompt after
+    # the plots does not also wait for pandas/openpyxl to load. (Not at
+    # module level: spawned plot workers re-import this module.)
+    try:
+        from export_data_tables import DataExporter
+    except ImportError as e:
+        DataExporter = None
+        exporter_error = e
+    
     # Run visualization
     visualizer = ThesisVisualizer(results_folder)
-    visualizer.generate_all()
+    visualizer.generate_all(force=force)
     
     # Ask about data export
     print("\n" + "="*70)
@@ -456,7 +622,8 @@ def main():
     
     if not export_data or export_data == 'y':
         try:
-            from export_data_tables import DataExporter
+            if DataExporter is None:
+                raise exporter_error
             exporter = DataExporter(results_folder)
             exporter.export_all()
         except Exception as e:
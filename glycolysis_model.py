@@ -8,8 +8,393 @@ Based on Michaelis-Menten kinetics with allosteric regulation.
 Reference: van Eunen et al. (2012) PLOS Comput Biol
 """
 
+import os
+import multiprocessing
+from functools import lru_cache, partial
 import numpy as np
+from numba_compat import njit, HAVE_NUMBA, SAFE_FASTMATH
+from ode_integrators import (integrate_batch, integrate_batch_lsoda, integrate_batch_cuda,
+                             HAVE_NUMBALSODA)
 from kinetic_parameters import GLYCOLYSIS_PARAMS, TCA_PARAMS, INITIAL_CONCENTRATIONS
+from kinetic_parameters import (
+    GLYCOLYSIS_PARAM_ORDER,
+    HXK_Vmax_IDX, HXK_Km_glucose_IDX, HXK_Ki_G6P_IDX, HXK_Ki_T6P_IDX,
+    PGI_Vmax_IDX, PGI_Km_G6P_IDX, PGI_Km_F6P_IDX, PGI_Keq_IDX,
+    PFK_Vmax_IDX, PFK_Km_F6P_IDX, PFK_Km_ATP_IDX, PFK_Ki_ATP_IDX, PFK_Ka_AMP_IDX,
+    ALD_Vmax_IDX, ALD_Km_F16BP_IDX, ALD_Km_DHAP_IDX, ALD_Km_GAP_IDX, ALD_Keq_IDX,
+    TPI_Vmax_IDX, TPI_Km_DHAP_IDX, TPI_Km_GAP_IDX, TPI_Keq_IDX,
+    GAPDH_Vmax_IDX, GAPDH_Km_GAP_IDX, GAPDH_Km_NAD_IDX, GAPDH_Km_Pi_IDX,
+    PGK_Vmax_IDX, PGK_Km_13BPG_IDX, PGK_Km_ADP_IDX,
+    GPM_Vmax_IDX, GPM_Km_3PG_IDX, GPM_Km_2PG_IDX, GPM_Keq_IDX,
+    ENO_Vmax_IDX, ENO_Km_2PG_IDX, ENO_Km_PEP_IDX, ENO_Keq_IDX,
+    PYK_Vmax_IDX, PYK_Km_PEP_IDX, PYK_Km_ADP_IDX, PYK_Ka_F16BP_IDX, PYK_n_IDX,
+    PDC_Vmax_IDX, PDC_Km_pyruvate_IDX, PDC_n_IDX,
+)
+
+# Default cofactor levels (mM), in kernel order: ATP, ADP, NAD, Pi, T6P, F26BP
+DEFAULT_COFACTORS = np.array([2.5, 1.3, 1.2, 50.0, 0.024, 0.014])
+
+# State variables in y order, and their initial concentrations (mM; 0.1
+# where INITIAL_CONCENTRATIONS has no entry)
+STATE_NAMES = ('glucose', 'G6P', 'F6P', 'F16BP', 'DHAP', 'GAP',
+               'BPG', '3PG', '2PG', 'PEP', 'pyruvate')
+_Y0_TEMPLATE = np.array([INITIAL_CONCENTRATIONS.get(name, 0.1) for name in STATE_NAMES])
+
+
+# ==============================================================================
+# COMPILED RIGHT-HAND SIDE
+# ==============================================================================
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def glycolysis_rhs_into(t, y, p, cof, dydt):
+    """
+    Glycolysis dy/dt written into a preallocated buffer.
+
+    Same rate laws as the GlycolysisModel enzyme methods, with parameters
+    read from the flat vector p (GLYCOLYSIS_PARAM_ORDER) and cofactors from
+    cof (ATP, ADP, NAD, Pi, T6P, F26BP).
+    """
+    glucose = y[0]
+    G6P = y[1]
+    F6P = y[2]
+    F16BP = y[3]
+    DHAP = y[4]
+    GAP = y[5]
+    BPG = y[6]
+    PG3 = y[7]
+    PG2 = y[8]
+    PEP = y[9]
+    pyruvate = y[10]
+
+    ATP = cof[0]
+    ADP = cof[1]
+    NAD = cof[2]
+    Pi = cof[3]
+    T6P = cof[4]
+    AMP = 0.28  # Approximately constant
+
+    # HXK: competitive T6P inhibition + G6P product inhibition
+    Km_app = p[HXK_Km_glucose_IDX] * (1 + T6P / p[HXK_Ki_T6P_IDX])
+    v_HXK = p[HXK_Vmax_IDX] * (glucose / (Km_app + glucose)) * \
+        (1 / (1 + G6P / p[HXK_Ki_G6P_IDX]))
+
+    # PGI (reversible)
+    v_PGI = p[PGI_Vmax_IDX] * G6P / (p[PGI_Km_G6P_IDX] + G6P) - \
+        (p[PGI_Vmax_IDX] / p[PGI_Keq_IDX]) * F6P / (p[PGI_Km_F6P_IDX] + F6P)
+
+    # PFK: ATP substrate inhibition + AMP activation
+    atp_term = ATP / (p[PFK_Km_ATP_IDX] * (1 + ATP / p[PFK_Ki_ATP_IDX]))
+    amp_factor = 1 + AMP / p[PFK_Ka_AMP_IDX]
+    v_PFK = p[PFK_Vmax_IDX] * amp_factor * (F6P / (p[PFK_Km_F6P_IDX] + F6P)) * \
+        (atp_term / (1 + atp_term))
+
+    # ALD (reversible)
+    v_ALD = p[ALD_Vmax_IDX] * F16BP / (p[ALD_Km_F16BP_IDX] + F16BP) - \
+        (p[ALD_Vmax_IDX] / p[ALD_Keq_IDX]) * (DHAP * GAP) / \
+        ((p[ALD_Km_DHAP_IDX] + DHAP) * (p[ALD_Km_GAP_IDX] + GAP))
+
+    # TPI (reversible)
+    v_TPI = p[TPI_Vmax_IDX] * DHAP / (p[TPI_Km_DHAP_IDX] + DHAP) - \
+        (p[TPI_Vmax_IDX] / p[TPI_Keq_IDX]) * GAP / (p[TPI_Km_GAP_IDX] + GAP)
+
+    # GAPDH
+    v_GAPDH = p[GAPDH_Vmax_IDX] * (GAP / (p[GAPDH_Km_GAP_IDX] + GAP)) * \
+        (NAD / (p[GAPDH_Km_NAD_IDX] + NAD)) * \
+        (Pi / (p[GAPDH_Km_Pi_IDX] + Pi))
+
+    # PGK
+    v_PGK = p[PGK_Vmax_IDX] * (BPG / (p[PGK_Km_13BPG_IDX] + BPG)) * \
+        (ADP / (p[PGK_Km_ADP_IDX] + ADP))
+
+    # GPM (reversible)
+    v_GPM = p[GPM_Vmax_IDX] * PG3 / (p[GPM_Km_3PG_IDX] + PG3) - \
+        (p[GPM_Vmax_IDX] / p[GPM_Keq_IDX]) * PG2 / (p[GPM_Km_2PG_IDX] + PG2)
+
+    # ENO (reversible)
+    v_ENO = p[ENO_Vmax_IDX] * PG2 / (p[ENO_Km_2PG_IDX] + PG2) - \
+        (p[ENO_Vmax_IDX] / p[ENO_Keq_IDX]) * PEP / (p[ENO_Km_PEP_IDX] + PEP)
+
+    # PYK: Hill-type feedforward activation by F16BP
+    xn = (F16BP / p[PYK_Ka_F16BP_IDX]) ** p[PYK_n_IDX]
+    f16bp_factor = 1 + xn / (1 + xn)
+    v_PYK = p[PYK_Vmax_IDX] * f16bp_factor * \
+        (PEP / (p[PYK_Km_PEP_IDX] + PEP)) * \
+        (ADP / (p[PYK_Km_ADP_IDX] + ADP))
+
+    # PDC: Hill equation
+    pyr_n = pyruvate ** p[PDC_n_IDX]
+    v_PDC = p[PDC_Vmax_IDX] * pyr_n / \
+        (p[PDC_Km_pyruvate_IDX] ** p[PDC_n_IDX] + pyr_n)
+
+    # ODEs (mass balance)
+    dydt[0] = -v_HXK
+    dydt[1] = v_HXK - v_PGI
+    dydt[2] = v_PGI - v_PFK
+    dydt[3] = v_PFK - v_ALD
+    dydt[4] = v_ALD - v_TPI
+    dydt[5] = v_ALD + v_TPI - v_GAPDH
+    dydt[6] = v_GAPDH - v_PGK
+    dydt[7] = v_PGK - v_GPM
+    dydt[8] = v_GPM - v_ENO
+    dydt[9] = v_ENO - v_PYK
+    dydt[10] = v_PYK - v_PDC
+    return dydt
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def glycolysis_rhs(t, y, p, cof):
+    """Glycolysis dy/dt as a new array (solve_ivp/odeint-compatible via args=(p, cof))"""
+    return glycolysis_rhs_into(t, y, p, cof, np.empty(y.shape[0]))
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def glycolysis_jac_into(t, y, p, cof, J):
+    """
+    Analytic Jacobian d(dy/dt)/dy written into a preallocated 11x11 buffer.
+
+    Hand-differentiated from the rate laws in glycolysis_rhs_into. Each flux
+    depends on at most two metabolites, so the matrix is close to banded.
+    """
+    glucose = y[0]
+    G6P = y[1]
+    F6P = y[2]
+    F16BP = y[3]
+    DHAP = y[4]
+    GAP = y[5]
+    BPG = y[6]
+    PG3 = y[7]
+    PG2 = y[8]
+    PEP = y[9]
+    pyruvate = y[10]
+
+    ATP = cof[0]
+    ADP = cof[1]
+    NAD = cof[2]
+    Pi = cof[3]
+    T6P = cof[4]
+    AMP = 0.28
+
+    J[:, :] = 0.0
+
+    # HXK: v = Vmax * g/(Km_app+g) * 1/(1+G6P/Ki)
+    Km_app = p[HXK_Km_glucose_IDX] * (1 + T6P / p[HXK_Ki_T6P_IDX])
+    Ki = p[HXK_Ki_G6P_IDX]
+    inh = 1 / (1 + G6P / Ki)
+    sat = glucose / (Km_app + glucose)
+    dHXK_glc = p[HXK_Vmax_IDX] * Km_app / (Km_app + glucose) ** 2 * inh
+    dHXK_g6p = -p[HXK_Vmax_IDX] * sat * inh * inh / Ki
+
+    # PGI
+    dPGI_g6p = p[PGI_Vmax_IDX] * p[PGI_Km_G6P_IDX] / (p[PGI_Km_G6P_IDX] + G6P) ** 2
+    dPGI_f6p = -(p[PGI_Vmax_IDX] / p[PGI_Keq_IDX]) * p[PGI_Km_F6P_IDX] / \
+        (p[PGI_Km_F6P_IDX] + F6P) ** 2
+
+    # PFK
+    atp_term = ATP / (p[PFK_Km_ATP_IDX] * (1 + ATP / p[PFK_Ki_ATP_IDX]))
+    amp_factor = 1 + AMP / p[PFK_Ka_AMP_IDX]
+    dPFK_f6p = p[PFK_Vmax_IDX] * amp_factor * (atp_term / (1 + atp_term)) * \
+        p[PFK_Km_F6P_IDX] / (p[PFK_Km_F6P_IDX] + F6P) ** 2
+
+    # ALD
+    Vrev_ald = p[ALD_Vmax_IDX] / p[ALD_Keq_IDX]
+    dALD_f16bp = p[ALD_Vmax_IDX] * p[ALD_Km_F16BP_IDX] / (p[ALD_Km_F16BP_IDX] + F16BP) ** 2
+    dALD_dhap = -Vrev_ald * (GAP / (p[ALD_Km_GAP_IDX] + GAP)) * \
+        p[ALD_Km_DHAP_IDX] / (p[ALD_Km_DHAP_IDX] + DHAP) ** 2
+    dALD_gap = -Vrev_ald * (DHAP / (p[ALD_Km_DHAP_IDX] + DHAP)) * \
+        p[ALD_Km_GAP_IDX] / (p[ALD_Km_GAP_IDX] + GAP) ** 2
+
+    # TPI
+    dTPI_dhap = p[TPI_Vmax_IDX] * p[TPI_Km_DHAP_IDX] / (p[TPI_Km_DHAP_IDX] + DHAP) ** 2
+    dTPI_gap = -(p[TPI_Vmax_IDX] / p[TPI_Keq_IDX]) * p[TPI_Km_GAP_IDX] / \
+        (p[TPI_Km_GAP_IDX] + GAP) ** 2
+
+    # GAPDH
+    dGAPDH_gap = p[GAPDH_Vmax_IDX] * p[GAPDH_Km_GAP_IDX] / (p[GAPDH_Km_GAP_IDX] + GAP) ** 2 * \
+        (NAD / (p[GAPDH_Km_NAD_IDX] + NAD)) * (Pi / (p[GAPDH_Km_Pi_IDX] + Pi))
+
+    # PGK
+    dPGK_bpg = p[PGK_Vmax_IDX] * p[PGK_Km_13BPG_IDX] / (p[PGK_Km_13BPG_IDX] + BPG) ** 2 * \
+        (ADP / (p[PGK_Km_ADP_IDX] + ADP))
+
+    # GPM
+    dGPM_3pg = p[GPM_Vmax_IDX] * p[GPM_Km_3PG_IDX] / (p[GPM_Km_3PG_IDX] + PG3) ** 2
+    dGPM_2pg = -(p[GPM_Vmax_IDX] / p[GPM_Keq_IDX]) * p[GPM_Km_2PG_IDX] / \
+        (p[GPM_Km_2PG_IDX] + PG2) ** 2
+
+    # ENO
+    dENO_2pg = p[ENO_Vmax_IDX] * p[ENO_Km_2PG_IDX] / (p[ENO_Km_2PG_IDX] + PG2) ** 2
+    dENO_pep = -(p[ENO_Vmax_IDX] / p[ENO_Keq_IDX]) * p[ENO_Km_PEP_IDX] / \
+        (p[ENO_Km_PEP_IDX] + PEP) ** 2
+
+    # PYK: f = 1 + x^n/(1+x^n), x = F16BP/Ka  ->  df/dF16BP = n x^(n-1) / (Ka (1+x^n)^2)
+    n_pyk = p[PYK_n_IDX]
+    x = F16BP / p[PYK_Ka_F16BP_IDX]
+    xn_1 = x ** (n_pyk - 1)  # one pow for both x^(n-1) and x^n
+    xn = xn_1 * x
+    f16bp_factor = 1 + xn / (1 + xn)
+    pep_term = PEP / (p[PYK_Km_PEP_IDX] + PEP)
+    adp_term = ADP / (p[PYK_Km_ADP_IDX] + ADP)
+    dPYK_f16bp = p[PYK_Vmax_IDX] * pep_term * adp_term * \
+        n_pyk * xn_1 / (p[PYK_Ka_F16BP_IDX] * (1 + xn) ** 2)
+    dPYK_pep = p[PYK_Vmax_IDX] * f16bp_factor * adp_term * \
+        p[PYK_Km_PEP_IDX] / (p[PYK_Km_PEP_IDX] + PEP) ** 2
+
+    # PDC: v = Vmax s^n / (K^n + s^n)  ->  dv/ds = Vmax n s^(n-1) K^n / (K^n + s^n)^2
+    n_pdc = p[PDC_n_IDX]
+    Kn = p[PDC_Km_pyruvate_IDX] ** n_pdc
+    pyr_n_1 = pyruvate ** (n_pdc - 1)
+    dPDC_pyr = p[PDC_Vmax_IDX] * n_pdc * pyr_n_1 * Kn / \
+        (Kn + pyr_n_1 * pyruvate) ** 2
+
+    # Stoichiometry (rows follow dydt in glycolysis_rhs_into)
+    J[0, 0] = -dHXK_glc
+    J[0, 1] = -dHXK_g6p
+
+    J[1, 0] = dHXK_glc
+    J[1, 1] = dHXK_g6p - dPGI_g6p
+    J[1, 2] = -dPGI_f6p
+
+    J[2, 1] = dPGI_g6p
+    J[2, 2] = dPGI_f6p - dPFK_f6p
+
+    J[3, 2] = dPFK_f6p
+    J[3, 3] = -dALD_f16bp
+    J[3, 4] = -dALD_dhap
+    J[3, 5] = -dALD_gap
+
+    J[4, 3] = dALD_f16bp
+    J[4, 4] = dALD_dhap - dTPI_dhap
+    J[4, 5] = dALD_gap - dTPI_gap
+
+    J[5, 3] = dALD_f16bp
+    J[5, 4] = dALD_dhap + dTPI_dhap
+    J[5, 5] = dALD_gap + dTPI_gap - dGAPDH_gap
+
+    J[6, 5] = dGAPDH_gap
+    J[6, 6] = -dPGK_bpg
+
+    J[7, 6] = dPGK_bpg
+    J[7, 7] = -dGPM_3pg
+    J[7, 8] = -dGPM_2pg
+
+    J[8, 7] = dGPM_3pg
+    J[8, 8] = dGPM_2pg - dENO_2pg
+    J[8, 9] = -dENO_pep
+
+    J[9, 3] = -dPYK_f16bp
+    J[9, 8] = dENO_2pg
+    J[9, 9] = dENO_pep - dPYK_pep
+
+    J[10, 3] = dPYK_f16bp
+    J[10, 9] = dPYK_pep
+    J[10, 10] = -dPDC_pyr
+    return J
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def glycolysis_jac(t, y, p, cof):
+    """Analytic Jacobian as a new array (solve_ivp jac= / odeint Dfun= with tfirst=True)"""
+    n = y.shape[0]
+    return glycolysis_jac_into(t, y, p, cof, np.empty((n, n)))
+
+
+# Plain-Python body of the RHS kernel (the njit dispatcher keeps it as
+# py_func). It only indexes and does arithmetic, so with y of shape (11, k)
+# every rate broadcasts over the k columns
+_rhs_broadcast = getattr(glycolysis_rhs_into, 'py_func', glycolysis_rhs_into)
+
+# Without Numba the kernels above run as plain Python; GlycolysisModel then
+# uses the Cython build of the RHS and Jacobian (glycolysis_rhs_cy.pyx) if
+# it was compiled
+_model_rhs_into = glycolysis_rhs_into
+_model_jac_into = glycolysis_jac_into
+HAVE_CYTHON_RHS = False
+if not HAVE_NUMBA:
+    try:
+        from glycolysis_rhs_cy import (glycolysis_rhs_into as _model_rhs_into,
+                                       glycolysis_jac_into as _model_jac_into)
+        HAVE_CYTHON_RHS = True
+    except ImportError:
+        pass
+
+
+# ==============================================================================
+# NATIVE LSODA CALLBACK (for numbalsoda)
+# ==============================================================================
+# data vector layout: the 48 parameters (GLYCOLYSIS_PARAM_ORDER), then the
+# 6 cofactors (DEFAULT_COFACTORS order)
+
+N_GLYCOLYSIS_PARAMS = len(GLYCOLYSIS_PARAM_ORDER)
+N_COFACTORS = len(DEFAULT_COFACTORS)
+
+if HAVE_NUMBA:
+    from numba import cfunc, carray, types
+
+    # Same as numbalsoda.lsoda_sig; spelled out so importing this module does
+    # not pay numbalsoda's own start-up compilation
+    LSODA_SIG = types.void(types.double, types.CPointer(types.double),
+                           types.CPointer(types.double), types.CPointer(types.double))
+
+    @cfunc(LSODA_SIG, cache=True)
+    def glycolysis_rhs_cfunc(t, u, du, data):
+        """C-callable RHS: LSODA calls it through a function pointer, no Python"""
+        y = carray(u, (11,))
+        dydt = carray(du, (11,))
+        d = carray(data, (N_GLYCOLYSIS_PARAMS + N_COFACTORS,))
+        glycolysis_rhs_into(t, y, d[:N_GLYCOLYSIS_PARAMS], d[N_GLYCOLYSIS_PARAMS:], dydt)
+
+    GLYCOLYSIS_LSODA_ADDRESS = glycolysis_rhs_cfunc.address
+else:
+    GLYCOLYSIS_LSODA_ADDRESS = None
+
+def simulate_batch(P, t_eval, y0, cofactors=DEFAULT_COFACTORS, rtol=1e-6, atol=1e-8,
+                   solver='rosenbrock', dtype=np.float64, max_steps=100000):
+    """
+    Integrate one trajectory per parameter row of P, in parallel.
+    
+    solver='lsoda' uses numbalsoda's native LSODA on glycolysis_rhs_cfunc
+    (float64 only); 'rosenbrock' uses the compiled Rosenbrock 2(3) batch
+    integrator with the analytic Jacobian, in the given dtype. Both run the
+    samples under numba.prange with independent per-sample state.
+    solver='cuda' runs the same Rosenbrock scheme on a CUDA GPU, one thread
+    per sample (RuntimeError without one); only worth it for thousands of
+    samples.
+    
+    Args:
+        P: parameter vectors (GLYCOLYSIS_PARAM_ORDER), shape (S, 48)
+        t_eval: output times (ascending, >= 0); integration starts at t=0
+        y0: initial state shared by all samples, shape (11,)
+    
+    Returns:
+        tuple: (Y, ok) with Y of shape (S, len(t_eval), 11) and ok flagging
+            successful integrations
+    """
+    n_samples = P.shape[0]
+    Y0 = np.tile(y0, (n_samples, 1))
+    
+    if solver == 'lsoda':
+        # LSODA starts at t_eval[0], so prepend t=0 when the data does not
+        t_out = np.asarray(t_eval, dtype=np.float64)
+        if t_out[0] != 0:
+            t_out = np.concatenate(([0.0], t_out))
+        D = np.hstack([P, np.tile(cofactors, (n_samples, 1))])
+        Y, ok = integrate_batch_lsoda(GLYCOLYSIS_LSODA_ADDRESS, Y0, D, t_out, rtol, atol)
+        return Y[:, -len(t_eval):, :], ok
+    
+    integrate = integrate_batch_cuda if solver == 'cuda' else integrate_batch
+    return integrate(glycolysis_rhs_into, glycolysis_jac_into,
+                     Y0.astype(dtype), P.astype(dtype),
+                     np.asarray(cofactors).astype(dtype),
+                     np.asarray(t_eval, dtype=dtype),
+                     rtol, atol, max_steps)
+
+
+def _simulate_one(params, t_eval, y0, rtol, atol):
+    """Pool worker for simulate_ensemble: one trajectory, or None if it fails"""
+    try:
+        return GlycolysisModel(params).simulate(t_eval, y0, rtol=rtol, atol=atol)
+    except RuntimeError:
+        return None
 
 class GlycolysisModel:
     """
@@ -20,27 +405,59 @@ class GlycolysisModel:
     - Allosteric regulation (HXK, PFK, PYK)
     - Product inhibition
     - Reversible reactions
+    
+    The per-enzyme methods (hexokinase ... pyruvate_decarboxylase) give
+    single rates for inspection and testing; ode_system and jacobian never
+    call them but run the fused compiled kernels, which evaluate all 11
+    rates and the mass balances in one function.
     """
     
     def __init__(self, params=None):
-        """Initialize with parameters"""
-        self.params = params if params is not None else GLYCOLYSIS_PARAMS
+        """
+        Initialize with parameters: a dict, or a flat vector already in
+        GLYCOLYSIS_PARAM_ORDER (used as is, skipping the per-name lookups)
+        """
+        if isinstance(params, np.ndarray):
+            self._params = None
+            self.p_vec = np.asarray(params, dtype=np.float64)
+        else:
+            self._params = params if params is not None else GLYCOLYSIS_PARAMS
+            self.p_vec = np.array([self._params[k] for k in GLYCOLYSIS_PARAM_ORDER],
+                                  dtype=np.float64)
+        # Python floats for the per-enzyme rate methods (array reads would
+        # box a numpy scalar each time)
+        self._p = self.p_vec.tolist()
+        
+        # dy/dt buffer reused by ode_system_buffered
+        self._dydt = np.empty(11)
+        
+        # Cofactor vector of the last ode_system/jacobian call; solvers pass
+        # the same cofactors every step, so it is rebuilt only on change
+        self._cof_key = tuple(DEFAULT_COFACTORS)
+        self._cof = DEFAULT_COFACTORS.copy()
         
         # State variable indices
-        self.idx = {
-            'glucose': 0,
-            'G6P': 1,
-            'F6P': 2,
-            'F16BP': 3,
-            'DHAP': 4,
-            'GAP': 5,
-            'BPG': 6,
-            '3PG': 7,
-            '2PG': 8,
-            'PEP': 9,
-            'pyruvate': 10
-        }
-        
+        self.idx = {name: i for i, name in enumerate(STATE_NAMES)}
+        
+    @property
+    def params(self):
+        """Parameter dict (built from p_vec if the model was given a vector)"""
+        if self._params is None:
+            self._params = dict(zip(GLYCOLYSIS_PARAM_ORDER, self._p))
+        return self._params
+    
+    def set_parameters(self, p_vec, idx=None, values=None):
+        """
+        Overwrite the parameter vector in place (GLYCOLYSIS_PARAM_ORDER),
+        then values at positions idx if given. Write p_vec through here,
+        not directly, so params and the per-enzyme methods follow it.
+        """
+        self.p_vec[:] = p_vec
+        if idx is not None:
+            self.p_vec[idx] = values
+        self._p = self.p_vec.tolist()
+        self._params = None
+    
     def hexokinase(self, glucose, G6P, ATP, T6P=0.024):
         """
         Hexokinase: Glucose + ATP → G6P + ADP
@@ -49,16 +466,16 @@ class GlycolysisModel:
         - Product inhibition by G6P
         - Trehalose-6-P inhibition (prevents turbo phenotype)
         """
-        p = self.params
+        p = self._p
         
         # Competitive inhibition by T6P
-        Km_app = p['HXK_Km_glucose'] * (1 + T6P / p['HXK_Ki_T6P'])
+        Km_app = p[HXK_Km_glucose_IDX] * (1 + T6P / p[HXK_Ki_T6P_IDX])
         
         # Product inhibition by G6P
-        Ki_G6P = p['HXK_Ki_G6P']
+        Ki_G6P = p[HXK_Ki_G6P_IDX]
         
         # Michaelis-Menten with inhibition
-        v = p['HXK_Vmax'] * (glucose / (Km_app + glucose)) * (1 / (1 + G6P / Ki_G6P))
+        v = p[HXK_Vmax_IDX] * (glucose / (Km_app + glucose)) * (1 / (1 + G6P / Ki_G6P))
         
         return v
     
@@ -66,11 +483,11 @@ class GlycolysisModel:
         """
         PGI: G6P ↔ F6P (reversible, near equilibrium)
         """
-        p = self.params
+        p = self._p
         
         # Forward and reverse rates
-        v_for = p['PGI_Vmax'] * G6P / (p['PGI_Km_G6P'] + G6P)
-        v_rev = (p['PGI_Vmax'] / p['PGI_Keq']) * F6P / (p['PGI_Km_F6P'] + F6P)
+        v_for = p[PGI_Vmax_IDX] * G6P / (p[PGI_Km_G6P_IDX] + G6P)
+        v_rev = (p[PGI_Vmax_IDX] / p[PGI_Keq_IDX]) * F6P / (p[PGI_Km_F6P_IDX] + F6P)
         
         return v_for - v_rev
     
@@ -85,16 +502,16 @@ class GlycolysisModel:
         
         CRITICAL regulatory enzyme!
         """
-        p = self.params
+        p = self._p
         
         # ATP inhibition (substrate inhibition at high ATP)
-        atp_term = ATP / (p['PFK_Km_ATP'] * (1 + ATP / p['PFK_Ki_ATP']))
+        atp_term = ATP / (p[PFK_Km_ATP_IDX] * (1 + ATP / p[PFK_Ki_ATP_IDX]))
         
         # AMP activation (allosteric)
-        amp_factor = 1 + AMP / p['PFK_Ka_AMP']
+        amp_factor = 1 + AMP / p[PFK_Ka_AMP_IDX]
         
         # Simplified version (full allosteric model is complex)
-        v = p['PFK_Vmax'] * amp_factor * (F6P / (p['PFK_Km_F6P'] + F6P)) * (atp_term / (1 + atp_term))
+        v = p[PFK_Vmax_IDX] * amp_factor * (F6P / (p[PFK_Km_F6P_IDX] + F6P)) * (atp_term / (1 + atp_term))
         
         return v
     
@@ -102,14 +519,14 @@ class GlycolysisModel:
         """
         ALD: F16BP ↔ DHAP + GAP (reversible)
         """
-        p = self.params
+        p = self._p
         
         # Forward
-        v_for = p['ALD_Vmax'] * F16BP / (p['ALD_Km_F16BP'] + F16BP)
+        v_for = p[ALD_Vmax_IDX] * F16BP / (p[ALD_Km_F16BP_IDX] + F16BP)
         
         # Reverse (product of concentrations)
-        v_rev = (p['ALD_Vmax'] / p['ALD_Keq']) * (DHAP * GAP) / \
-                ((p['ALD_Km_DHAP'] + DHAP) * (p['ALD_Km_GAP'] + GAP))
+        v_rev = (p[ALD_Vmax_IDX] / p[ALD_Keq_IDX]) * (DHAP * GAP) / \
+                ((p[ALD_Km_DHAP_IDX] + DHAP) * (p[ALD_Km_GAP_IDX] + GAP))
         
         return v_for - v_rev
     
@@ -117,10 +534,10 @@ class GlycolysisModel:
         """
         TPI: DHAP ↔ GAP (very fast, near equilibrium)
         """
-        p = self.params
+        p = self._p
         
-        v_for = p['TPI_Vmax'] * DHAP / (p['TPI_Km_DHAP'] + DHAP)
-        v_rev = (p['TPI_Vmax'] / p['TPI_Keq']) * GAP / (p['TPI_Km_GAP'] + GAP)
+        v_for = p[TPI_Vmax_IDX] * DHAP / (p[TPI_Km_DHAP_IDX] + DHAP)
+        v_rev = (p[TPI_Vmax_IDX] / p[TPI_Keq_IDX]) * GAP / (p[TPI_Km_GAP_IDX] + GAP)
         
         return v_for - v_rev
     
@@ -134,12 +551,12 @@ class GlycolysisModel:
         
         30-fold difference from traditional assays!
         """
-        p = self.params
+        p = self._p
         
         # Simplified (full mechanism requires NADH, BPG)
-        v = p['GAPDH_Vmax'] * (GAP / (p['GAPDH_Km_GAP'] + GAP)) * \
-            (NAD / (p['GAPDH_Km_NAD'] + NAD)) * \
-            (Pi / (p['GAPDH_Km_Pi'] + Pi))
+        v = p[GAPDH_Vmax_IDX] * (GAP / (p[GAPDH_Km_GAP_IDX] + GAP)) * \
+            (NAD / (p[GAPDH_Km_NAD_IDX] + NAD)) * \
+            (Pi / (p[GAPDH_Km_Pi_IDX] + Pi))
         
         return v
     
@@ -147,11 +564,11 @@ class GlycolysisModel:
         """
         PGK: BPG + ADP → 3PG + ATP (near equilibrium, favors products)
         """
-        p = self.params
+        p = self._p
         
         # Very favorable reaction
-        v = p['PGK_Vmax'] * (BPG / (p['PGK_Km_13BPG'] + BPG)) * \
-            (ADP / (p['PGK_Km_ADP'] + ADP))
+        v = p[PGK_Vmax_IDX] * (BPG / (p[PGK_Km_13BPG_IDX] + BPG)) * \
+            (ADP / (p[PGK_Km_ADP_IDX] + ADP))
         
         return v
     
@@ -159,10 +576,10 @@ class GlycolysisModel:
         """
         GPM: 3PG ↔ 2PG (reversible)
         """
-        p = self.params
+        p = self._p
         
-        v_for = p['GPM_Vmax'] * PG3 / (p['GPM_Km_3PG'] + PG3)
-        v_rev = (p['GPM_Vmax'] / p['GPM_Keq']) * PG2 / (p['GPM_Km_2PG'] + PG2)
+        v_for = p[GPM_Vmax_IDX] * PG3 / (p[GPM_Km_3PG_IDX] + PG3)
+        v_rev = (p[GPM_Vmax_IDX] / p[GPM_Keq_IDX]) * PG2 / (p[GPM_Km_2PG_IDX] + PG2)
         
         return v_for - v_rev
     
@@ -170,10 +587,10 @@ class GlycolysisModel:
         """
         ENO: 2PG ↔ PEP + H2O (reversible, favors products)
         """
-        p = self.params
+        p = self._p
         
-        v_for = p['ENO_Vmax'] * PG2 / (p['ENO_Km_2PG'] + PG2)
-        v_rev = (p['ENO_Vmax'] / p['ENO_Keq']) * PEP / (p['ENO_Km_PEP'] + PEP)
+        v_for = p[ENO_Vmax_IDX] * PG2 / (p[ENO_Km_2PG_IDX] + PG2)
+        v_rev = (p[ENO_Vmax_IDX] / p[ENO_Keq_IDX]) * PEP / (p[ENO_Km_PEP_IDX] + PEP)
         
         return v_for - v_rev
     
@@ -186,15 +603,15 @@ class GlycolysisModel:
         
         Prevents metabolite accumulation in lower glycolysis.
         """
-        p = self.params
+        p = self._p
         
         # Hill equation for F16BP activation
-        f16bp_factor = 1 + ((F16BP / p['PYK_Ka_F16BP']) ** p['PYK_n']) / \
-                           (1 + (F16BP / p['PYK_Ka_F16BP']) ** p['PYK_n'])
+        xn = (F16BP / p[PYK_Ka_F16BP_IDX]) ** p[PYK_n_IDX]
+        f16bp_factor = 1 + xn / (1 + xn)
         
-        v = p['PYK_Vmax'] * f16bp_factor * \
-            (PEP / (p['PYK_Km_PEP'] + PEP)) * \
-            (ADP / (p['PYK_Km_ADP'] + ADP))
+        v = p[PYK_Vmax_IDX] * f16bp_factor * \
+            (PEP / (p[PYK_Km_PEP_IDX] + PEP)) * \
+            (ADP / (p[PYK_Km_ADP_IDX] + ADP))
         
         return v
     
@@ -204,14 +621,21 @@ class GlycolysisModel:
         
         With Hill coefficient (cooperative binding)
         """
-        p = self.params
+        p = self._p
         
         # Hill equation
-        v = p['PDC_Vmax'] * (pyruvate ** p['PDC_n']) / \
-            (p['PDC_Km_pyruvate'] ** p['PDC_n'] + pyruvate ** p['PDC_n'])
+        pyr_n = pyruvate ** p[PDC_n_IDX]
+        v = p[PDC_Vmax_IDX] * pyr_n / (p[PDC_Km_pyruvate_IDX] ** p[PDC_n_IDX] + pyr_n)
         
         return v
     
+    def _cofactors(self, *values):
+        """Cofactor vector in kernel order, reused while the values repeat"""
+        if values != self._cof_key:
+            self._cof_key = values
+            self._cof = np.array(values, dtype=np.float64)
+        return self._cof
+    
     def ode_system(self, t, y, ATP=2.5, ADP=1.3, NAD=1.2, Pi=50.0, 
                    T6P=0.024, F26BP=0.014):
         """
@@ -220,73 +644,178 @@ class GlycolysisModel:
         dy/dt = [rate of production] - [rate of consumption]
         
         Cofactors (ATP, ADP, NAD, NADH, Pi) held constant for simplicity.
+        Evaluated by the compiled kernel (Numba, or without it the Cython
+        build glycolysis_rhs_cy when available; likewise jacobian).
+        """
+        cof = self._cofactors(ATP, ADP, NAD, Pi, T6P, F26BP)
+        return _model_rhs_into(t, np.asarray(y, dtype=np.float64), self.p_vec, cof,
+                               np.empty(11))
+    
+    def ode_system_buffered(self, t, y):
         """
+        ode_system at the default cofactors, written into a per-model buffer
         
-        # Extract state variables
-        glucose = y[self.idx['glucose']]
-        G6P = y[self.idx['G6P']]
-        F6P = y[self.idx['F6P']]
-        F16BP = y[self.idx['F16BP']]
-        DHAP = y[self.idx['DHAP']]
-        GAP = y[self.idx['GAP']]
-        BPG = y[self.idx['BPG']]
-        PG3 = y[self.idx['3PG']]
-        PG2 = y[self.idx['2PG']]
-        PEP = y[self.idx['PEP']]
-        pyruvate = y[self.idx['pyruvate']]
-        
-        # Calculate AMP from adenylate energy charge (simplified)
-        AMP = 0.28  # Approximately constant
-        
-        # Calculate fluxes through each enzyme
-        v_HXK = self.hexokinase(glucose, G6P, ATP, T6P)
-        v_PGI = self.phosphoglucose_isomerase(G6P, F6P)
-        v_PFK = self.phosphofructokinase(F6P, ATP, AMP, F26BP)
-        v_ALD = self.aldolase(F16BP, DHAP, GAP)
-        v_TPI = self.triose_phosphate_isomerase(DHAP, GAP)
-        v_GAPDH = self.gapdh(GAP, NAD, Pi)
-        v_PGK = self.phosphoglycerate_kinase(BPG, ADP)
-        v_GPM = self.phosphoglycerate_mutase(PG3, PG2)
-        v_ENO = self.enolase(PG2, PEP)
-        v_PYK = self.pyruvate_kinase(PEP, ADP, F16BP)
-        v_PDC = self.pyruvate_decarboxylase(pyruvate)
-        
-        # ODEs (mass balance)
-        dydt = np.zeros(len(y))
-        
-        dydt[self.idx['glucose']] = -v_HXK  # Glucose consumption
-        dydt[self.idx['G6P']] = v_HXK - v_PGI
-        dydt[self.idx['F6P']] = v_PGI - v_PFK
-        dydt[self.idx['F16BP']] = v_PFK - v_ALD
-        dydt[self.idx['DHAP']] = v_ALD - v_TPI
-        dydt[self.idx['GAP']] = v_ALD + v_TPI - v_GAPDH  # GAP from aldolase + TPI
-        dydt[self.idx['BPG']] = v_GAPDH - v_PGK
-        dydt[self.idx['3PG']] = v_PGK - v_GPM
-        dydt[self.idx['2PG']] = v_GPM - v_ENO
-        dydt[self.idx['PEP']] = v_ENO - v_PYK
-        dydt[self.idx['pyruvate']] = v_PYK - v_PDC
-        
-        return dydt
+        The returned array is overwritten by the next call, so this is only
+        for solvers that copy the RHS result at once (odeint, LSODA). BDF,
+        Radau and scipy's finite-difference Jacobians hold on to it: use
+        ode_system there.
+        """
+        return _model_rhs_into(t, np.asarray(y, dtype=np.float64), self.p_vec,
+                               DEFAULT_COFACTORS, self._dydt)
     
-    def get_initial_state(self):
-        """Get initial concentrations as array"""
-        init = INITIAL_CONCENTRATIONS
+    def ode_system_vectorized(self, t, y):
+        """
+        ode_system at the default cofactors for y of shape (11,) or (11, k)
         
-        y0 = np.zeros(len(self.idx))
-        for name, idx in self.idx.items():
-            y0[idx] = init.get(name, 0.1)  # Default to 0.1 if missing
+        For solve_ivp(..., vectorized=True): BDF/Radau without jac= then
+        get all finite-difference Jacobian columns from one call instead of
+        11. Evaluated with NumPy broadcasting, not the compiled kernel.
+        """
+        y = np.asarray(y, dtype=np.float64)
+        return _rhs_broadcast(t, y, self.p_vec, DEFAULT_COFACTORS, np.empty_like(y))
+    
+    def jacobian(self, t, y, ATP=2.5, ADP=1.3, NAD=1.2, Pi=50.0,
+                 T6P=0.024, F26BP=0.014):
+        """
+        Analytic Jacobian d(dy/dt)/dy of ode_system (11x11)
         
-        return y0
+        Pass as jac= to solve_ivp (LSODA/BDF/Radau) or Dfun= to odeint
+        with tfirst=True. Its non-zero pattern is JAC_SPARSITY.
+        """
+        cof = self._cofactors(ATP, ADP, NAD, Pi, T6P, F26BP)
+        return _model_jac_into(t, np.asarray(y, dtype=np.float64), self.p_vec, cof,
+                               np.empty((11, 11)))
+    
+    def lsoda_data(self, cofactors=DEFAULT_COFACTORS):
+        """Data vector for glycolysis_rhs_cfunc: parameters, then cofactors"""
+        return np.concatenate([self.p_vec, cofactors])
+    
+    def simulate(self, t_eval, y0=None, rtol=1e-6, atol=1e-8, method='lsoda'):
+        """
+        Integrate from t_eval[0] and return the states at t_eval, shape (n_times, 11)
+        
+        With numbalsoda the whole run stays in compiled code (the RHS is
+        called through GLYCOLYSIS_LSODA_ADDRESS); method='dop853' selects its
+        explicit 8th-order solver, only suitable for non-stiff stretches.
+        LSODA stays the default: it already switches between non-stiff
+        (Adams) and stiff (BDF) steps by itself, and with the default
+        parameters the system turns stiff after ~0.02 min, so even the
+        first 0.1 min costs DOP853 about 20x the time of LSODA.
+        Without numbalsoda, falls back to SciPy LSODA with the analytic
+        Jacobian. Raises RuntimeError if the integration fails.
+        """
+        t_eval = np.asarray(t_eval, dtype=np.float64)
+        y0 = self.get_initial_state() if y0 is None else np.asarray(y0, dtype=np.float64)
+        
+        if HAVE_NUMBALSODA:
+            import numbalsoda
+            solver = numbalsoda.dop853 if method == 'dop853' else numbalsoda.lsoda
+            Y, success = solver(GLYCOLYSIS_LSODA_ADDRESS, y0.copy(), t_eval,
+                                data=self.lsoda_data(), rtol=rtol, atol=atol)
+            message = "numbalsoda integration failed"
+        else:
+            from scipy.integrate import solve_ivp
+            sol = solve_ivp(self.ode_system, (t_eval[0], t_eval[-1]), y0,
+                            method='LSODA', jac=self.jacobian, t_eval=t_eval,
+                            rtol=rtol, atol=atol)
+            Y, success, message = sol.y.T, sol.success, sol.message
+        
+        if not success:
+            raise RuntimeError(message)
+        return Y
+    
+    @classmethod
+    def simulate_ensemble(cls, params_list, t_eval, y0=None, rtol=1e-6, atol=1e-8,
+                          nproc=None):
+        """
+        simulate() for many parameter dicts, spread over worker processes
+        
+        Each run is independent (its own model and solver state), so the
+        runs scale with the number of cores; nproc defaults to
+        os.cpu_count() and nproc=1 runs them in this process. For parameter
+        matrices in GLYCOLYSIS_PARAM_ORDER, simulate_batch does the same on
+        Numba threads without pickling.
+        
+        Returns:
+            tuple: (Y, ok) with Y of shape (len(params_list), len(t_eval), 11),
+                NaN for failed runs, and ok flagging successful integrations
+        """
+        t_eval = np.asarray(t_eval, dtype=np.float64)
+        run = partial(_simulate_one, t_eval=t_eval, y0=y0, rtol=rtol, atol=atol)
+        
+        nproc = min(len(params_list), nproc or os.cpu_count() or 1)
+        if nproc > 1:
+            # Spawned: a fork after Numba's threaded kernels hangs at exit
+            with multiprocessing.get_context('spawn').Pool(nproc) as pool:
+                results = pool.map(run, params_list,
+                                   chunksize=max(1, len(params_list) // (4 * nproc)))
+        else:
+            results = [run(params) for params in params_list]
+        
+        Y = np.full((len(params_list), len(t_eval), 11), np.nan)
+        ok = np.zeros(len(params_list), dtype=bool)
+        for i, Y_i in enumerate(results):
+            if Y_i is not None:
+                Y[i] = Y_i
+                ok[i] = True
+        return Y, ok
+    
+    def get_initial_state(self):
+        """Get initial concentrations as array"""
+        return _Y0_TEMPLATE.copy()
     
     def get_state_names(self):
         """Get ordered list of state variable names"""
-        names = [''] * len(self.idx)
-        for name, idx in self.idx.items():
-            names[idx] = name
-        return names
+        return list(STATE_NAMES)
+
+
+def warmup():
+    """Compile (or load from cache) the RHS and Jacobian kernels, before any timed solver call"""
+    model = GlycolysisModel()
+    y0 = model.get_initial_state()
+    glycolysis_rhs(0.0, y0, model.p_vec, DEFAULT_COFACTORS)
+    glycolysis_jac(0.0, y0, model.p_vec, DEFAULT_COFACTORS)
+
+
+def glycolysis_jac_sparsity(p=None, cof=DEFAULT_COFACTORS, n_probe=8, seed=0):
+    """
+    Structural non-zeros of the glycolysis Jacobian, bool (11, 11)
+    
+    Union of the non-zero entries of the analytic Jacobian over random
+    positive states, so entries that vanish only at special points (a zero
+    concentration) are kept. Pass as jac_sparsity= to solve_ivp with
+    method='BDF' or 'Radau' (without jac=) to group the finite-difference
+    columns. 31 of 121 entries: a near-tridiagonal chain, the aldolase
+    fan-out over F16BP/DHAP/GAP, and the F16BP column of the PEP and
+    pyruvate rows (feed-forward activation of PYK).
+    At 11 states SciPy's sparse LU costs more than the dense one, so the
+    analytic jacobian stays the default.
+    """
+    p = GlycolysisModel().p_vec if p is None else np.asarray(p, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    y_ref = _Y0_TEMPLATE + 0.1
+    pattern = np.zeros((11, 11), dtype=bool)
+    for _ in range(n_probe):
+        y = y_ref * rng.uniform(0.5, 2.0, 11)
+        pattern |= glycolysis_jac(0.0, y, p, cof) != 0.0
+    return pattern
+
+
+
+@lru_cache(maxsize=None)
+def _default_jac_sparsity():
+    return glycolysis_jac_sparsity()
+
+
+def __getattr__(attr):
+    """JAC_SPARSITY is probed from the compiled Jacobian on first access"""
+    if attr == 'JAC_SPARSITY':
+        return _default_jac_sparsity()
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
 
 
 if __name__ == "__main__":
+    import time
     from scipy.integrate import solve_ivp
     import matplotlib.pyplot as plt
     
@@ -304,6 +833,57 @@ if __name__ == "__main__":
     for name, value in zip(model.get_state_names(), y0):
         print(f"  {name}: {value:.4f} mM")
     
+    # Check the analytic Jacobian against forward differences
+    J = model.jacobian(0.0, y0)
+    f0 = model.ode_system(0.0, y0)
+    J_fd = np.empty_like(J)
+    for j in range(len(y0)):
+        h = 1e-7 * max(1.0, abs(y0[j]))
+        y_h = y0.copy()
+        y_h[j] += h
+        J_fd[:, j] = (model.ode_system(0.0, y_h) - f0) / h
+    rel_err = np.abs(J - J_fd).max() / np.abs(J).max()
+    print(f"\nJacobian vs finite differences: max rel. deviation {rel_err:.2e}")
+    sparsity = _default_jac_sparsity()
+    print(f"Jacobian sparsity: {sparsity.sum()}/{sparsity.size} non-zero")
+    
+    # fastmath lets LLVM contract/reassociate the rate laws (FMA); check the
+    # compiled RHS against its plain-Python body on perturbed states
+    if HAVE_NUMBA:
+        rng = np.random.default_rng(0)
+        fm_err = 0.0
+        for _ in range(200):
+            y_r = y0 * rng.uniform(0.5, 1.5, len(y0))
+            f_c = glycolysis_rhs_into(0.0, y_r, model.p_vec, DEFAULT_COFACTORS, np.empty(11))
+            f_py = glycolysis_rhs_into.py_func(0.0, y_r, model.p_vec, DEFAULT_COFACTORS,
+                                               np.empty(11))
+            fm_err = max(fm_err, np.abs(f_c - f_py).max() / np.abs(f_py).max())
+        print(f"Compiled (fastmath) vs Python RHS: max rel. deviation {fm_err:.2e}")
+        
+        # SAFE_FASTMATH keeps NaN semantics: a NaN parameter must still
+        # reach dy/dt, or isfinite() could not flag failed integrations
+        p_nan = model.p_vec.copy()
+        p_nan[0] = np.nan
+        f_nan = glycolysis_rhs_into(0.0, y0, p_nan, DEFAULT_COFACTORS, np.empty(11))
+        print(f"NaN parameter propagates to dy/dt: {not np.isfinite(f_nan).all()}")
+    
+    # Same run through simulate() (native LSODA when numbalsoda is installed)
+    t_check = np.linspace(0, 10, 101)
+    Y_native = model.simulate(t_check)
+    solver_name = "numbalsoda LSODA" if HAVE_NUMBALSODA else "SciPy LSODA"
+    print(f"simulate() [{solver_name}]: final pyruvate {Y_native[-1, 10]:.4f} mM")
+    
+    # Ensemble of perturbed parameter sets, as drawn by an MCEM E-step
+    rng = np.random.default_rng(0)
+    ensemble = [{k: v * (1 + 0.2 * (rng.random() - 0.5)) for k, v in GLYCOLYSIS_PARAMS.items()}
+                for _ in range(64)]
+    for nproc in (1, None):
+        start = time.perf_counter()
+        Y_ens, ok = GlycolysisModel.simulate_ensemble(ensemble, t_check, nproc=nproc)
+        label = "serial" if nproc == 1 else f"nproc={os.cpu_count()}"
+        print(f"simulate_ensemble() [{label}]: {ok.sum()}/{len(ok)} runs "
+              f"in {time.perf_counter() - start:.2f} s")
+    
     # Simulate
     print("\nSimulating 10 minutes...")
     sol = solve_ivp(
@@ -311,6 +891,7 @@ if __name__ == "__main__":
         t_span=[0, 10],  # 10 minutes
         y0=y0,
         method='LSODA',  # Stiff solver
+        jac=model.jacobian,  # analytic, instead of finite differences
         dense_output=True,
         max_step=0.1
     )
@@ -318,6 +899,7 @@ if __name__ == "__main__":
     if sol.success:
         print(f"✓ Simulation successful!")
         print(f"  Time points: {len(sol.t)}")
+        print(f"  RHS / Jacobian evaluations: {sol.nfev} / {sol.njev}")
         print(f"  Final time: {sol.t[-1]:.2f} min")
         
         # Check if steady state reached
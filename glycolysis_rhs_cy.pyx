@@ -0,0 +1,301 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, cpow=True
+# distutils: extra_compile_args = -O3 -ffast-math
+"""
+Cython Glycolysis Right-Hand Side and Jacobian
+==============================================
+
+Typed C build of glycolysis_model.glycolysis_rhs_into and
+glycolysis_jac_into, in one compilation unit, for installs without
+Numba. Same rate laws and argument layout: parameters in the flat
+GLYCOLYSIS_PARAM_ORDER vector p, cofactors in cof (ATP, ADP, NAD, Pi, T6P,
+F26BP). GlycolysisModel picks it up automatically when Numba is missing
+and the extension has been built; with Numba installed it is not used.
+
+Build in place (needs Cython and a C compiler):
+    pip install cython
+    cythonize -i -3 glycolysis_rhs_cy.pyx
+"""
+
+import kinetic_parameters as kp
+
+# Parameter indices as C constants (read from kinetic_parameters at import,
+# so the layout has a single definition)
+cdef Py_ssize_t HXK_Vmax = kp.HXK_Vmax_IDX
+cdef Py_ssize_t HXK_Km_glucose = kp.HXK_Km_glucose_IDX
+cdef Py_ssize_t HXK_Ki_G6P = kp.HXK_Ki_G6P_IDX
+cdef Py_ssize_t HXK_Ki_T6P = kp.HXK_Ki_T6P_IDX
+cdef Py_ssize_t PGI_Vmax = kp.PGI_Vmax_IDX
+cdef Py_ssize_t PGI_Km_G6P = kp.PGI_Km_G6P_IDX
+cdef Py_ssize_t PGI_Km_F6P = kp.PGI_Km_F6P_IDX
+cdef Py_ssize_t PGI_Keq = kp.PGI_Keq_IDX
+cdef Py_ssize_t PFK_Vmax = kp.PFK_Vmax_IDX
+cdef Py_ssize_t PFK_Km_F6P = kp.PFK_Km_F6P_IDX
+cdef Py_ssize_t PFK_Km_ATP = kp.PFK_Km_ATP_IDX
+cdef Py_ssize_t PFK_Ki_ATP = kp.PFK_Ki_ATP_IDX
+cdef Py_ssize_t PFK_Ka_AMP = kp.PFK_Ka_AMP_IDX
+cdef Py_ssize_t ALD_Vmax = kp.ALD_Vmax_IDX
+cdef Py_ssize_t ALD_Km_F16BP = kp.ALD_Km_F16BP_IDX
+cdef Py_ssize_t ALD_Km_DHAP = kp.ALD_Km_DHAP_IDX
+cdef Py_ssize_t ALD_Km_GAP = kp.ALD_Km_GAP_IDX
+cdef Py_ssize_t ALD_Keq = kp.ALD_Keq_IDX
+cdef Py_ssize_t TPI_Vmax = kp.TPI_Vmax_IDX
+cdef Py_ssize_t TPI_Km_DHAP = kp.TPI_Km_DHAP_IDX
+cdef Py_ssize_t TPI_Km_GAP = kp.TPI_Km_GAP_IDX
+cdef Py_ssize_t TPI_Keq = kp.TPI_Keq_IDX
+cdef Py_ssize_t GAPDH_Vmax = kp.GAPDH_Vmax_IDX
+cdef Py_ssize_t GAPDH_Km_GAP = kp.GAPDH_Km_GAP_IDX
+cdef Py_ssize_t GAPDH_Km_NAD = kp.GAPDH_Km_NAD_IDX
+cdef Py_ssize_t GAPDH_Km_Pi = kp.GAPDH_Km_Pi_IDX
+cdef Py_ssize_t PGK_Vmax = kp.PGK_Vmax_IDX
+cdef Py_ssize_t PGK_Km_13BPG = kp.PGK_Km_13BPG_IDX
+cdef Py_ssize_t PGK_Km_ADP = kp.PGK_Km_ADP_IDX
+cdef Py_ssize_t GPM_Vmax = kp.GPM_Vmax_IDX
+cdef Py_ssize_t GPM_Km_3PG = kp.GPM_Km_3PG_IDX
+cdef Py_ssize_t GPM_Km_2PG = kp.GPM_Km_2PG_IDX
+cdef Py_ssize_t GPM_Keq = kp.GPM_Keq_IDX
+cdef Py_ssize_t ENO_Vmax = kp.ENO_Vmax_IDX
+cdef Py_ssize_t ENO_Km_2PG = kp.ENO_Km_2PG_IDX
+cdef Py_ssize_t ENO_Km_PEP = kp.ENO_Km_PEP_IDX
+cdef Py_ssize_t ENO_Keq = kp.ENO_Keq_IDX
+cdef Py_ssize_t PYK_Vmax = kp.PYK_Vmax_IDX
+cdef Py_ssize_t PYK_Km_PEP = kp.PYK_Km_PEP_IDX
+cdef Py_ssize_t PYK_Km_ADP = kp.PYK_Km_ADP_IDX
+cdef Py_ssize_t PYK_Ka_F16BP = kp.PYK_Ka_F16BP_IDX
+cdef Py_ssize_t PYK_n = kp.PYK_n_IDX
+cdef Py_ssize_t PDC_Vmax = kp.PDC_Vmax_IDX
+cdef Py_ssize_t PDC_Km_pyruvate = kp.PDC_Km_pyruvate_IDX
+cdef Py_ssize_t PDC_n = kp.PDC_n_IDX
+
+cdef double AMP = 0.28  # Approximately constant
+
+
+# ==============================================================================
+# ENZYME RATE LAWS
+# ==============================================================================
+
+cdef inline double _reversible_mm(double Vmax, double Keq, double Km_s, double Km_p,
+                                  double s, double prod) noexcept nogil:
+    """Vmax s/(Km_s+s) - (Vmax/Keq) prod/(Km_p+prod) (PGI, TPI, GPM, ENO)"""
+    return Vmax * s / (Km_s + s) - (Vmax / Keq) * prod / (Km_p + prod)
+
+
+cdef inline double _dmm(double Vmax, double Km, double s) noexcept nogil:
+    """d/ds of Vmax s/(Km+s)"""
+    return Vmax * Km / ((Km + s) * (Km + s))
+
+
+cdef inline double _hxk(const double[::1] p, double glucose, double G6P,
+                        double T6P) noexcept nogil:
+    cdef double Km_app = p[HXK_Km_glucose] * (1 + T6P / p[HXK_Ki_T6P])
+    return p[HXK_Vmax] * (glucose / (Km_app + glucose)) * (1 / (1 + G6P / p[HXK_Ki_G6P]))
+
+
+cdef inline double _pfk(const double[::1] p, double F6P, double ATP) noexcept nogil:
+    cdef double atp_term = ATP / (p[PFK_Km_ATP] * (1 + ATP / p[PFK_Ki_ATP]))
+    cdef double amp_factor = 1 + AMP / p[PFK_Ka_AMP]
+    return p[PFK_Vmax] * amp_factor * (F6P / (p[PFK_Km_F6P] + F6P)) * \
+        (atp_term / (1 + atp_term))
+
+
+cdef inline double _ald(const double[::1] p, double F16BP, double DHAP,
+                        double GAP) noexcept nogil:
+    return p[ALD_Vmax] * F16BP / (p[ALD_Km_F16BP] + F16BP) - \
+        (p[ALD_Vmax] / p[ALD_Keq]) * (DHAP * GAP) / \
+        ((p[ALD_Km_DHAP] + DHAP) * (p[ALD_Km_GAP] + GAP))
+
+
+cdef inline double _gapdh(const double[::1] p, double GAP, double NAD,
+                          double Pi) noexcept nogil:
+    return p[GAPDH_Vmax] * (GAP / (p[GAPDH_Km_GAP] + GAP)) * \
+        (NAD / (p[GAPDH_Km_NAD] + NAD)) * \
+        (Pi / (p[GAPDH_Km_Pi] + Pi))
+
+
+cdef inline double _pgk(const double[::1] p, double BPG, double ADP) noexcept nogil:
+    return p[PGK_Vmax] * (BPG / (p[PGK_Km_13BPG] + BPG)) * \
+        (ADP / (p[PGK_Km_ADP] + ADP))
+
+
+cdef inline double _pyk(const double[::1] p, double PEP, double ADP,
+                        double F16BP) noexcept nogil:
+    cdef double xn = (F16BP / p[PYK_Ka_F16BP]) ** p[PYK_n]
+    cdef double f16bp_factor = 1 + xn / (1 + xn)
+    return p[PYK_Vmax] * f16bp_factor * \
+        (PEP / (p[PYK_Km_PEP] + PEP)) * \
+        (ADP / (p[PYK_Km_ADP] + ADP))
+
+
+cdef inline double _pdc(const double[::1] p, double pyruvate) noexcept nogil:
+    cdef double pyr_n = pyruvate ** p[PDC_n]
+    return p[PDC_Vmax] * pyr_n / (p[PDC_Km_pyruvate] ** p[PDC_n] + pyr_n)
+
+
+# ==============================================================================
+# RIGHT-HAND SIDE
+# ==============================================================================
+
+cdef void rhs_c(double t, const double[::1] y, const double[::1] p,
+                const double[::1] cof, double[::1] dydt) noexcept nogil:
+    """dy/dt into dydt; same equations as glycolysis_model.glycolysis_rhs_into"""
+    cdef double v_HXK = _hxk(p, y[0], y[1], cof[4])
+    cdef double v_PGI = _reversible_mm(p[PGI_Vmax], p[PGI_Keq], p[PGI_Km_G6P],
+                                       p[PGI_Km_F6P], y[1], y[2])
+    cdef double v_PFK = _pfk(p, y[2], cof[0])
+    cdef double v_ALD = _ald(p, y[3], y[4], y[5])
+    cdef double v_TPI = _reversible_mm(p[TPI_Vmax], p[TPI_Keq], p[TPI_Km_DHAP],
+                                       p[TPI_Km_GAP], y[4], y[5])
+    cdef double v_GAPDH = _gapdh(p, y[5], cof[2], cof[3])
+    cdef double v_PGK = _pgk(p, y[6], cof[1])
+    cdef double v_GPM = _reversible_mm(p[GPM_Vmax], p[GPM_Keq], p[GPM_Km_3PG],
+                                       p[GPM_Km_2PG], y[7], y[8])
+    cdef double v_ENO = _reversible_mm(p[ENO_Vmax], p[ENO_Keq], p[ENO_Km_2PG],
+                                       p[ENO_Km_PEP], y[8], y[9])
+    cdef double v_PYK = _pyk(p, y[9], cof[1], y[3])
+    cdef double v_PDC = _pdc(p, y[10])
+
+    # ODEs (mass balance)
+    dydt[0] = -v_HXK
+    dydt[1] = v_HXK - v_PGI
+    dydt[2] = v_PGI - v_PFK
+    dydt[3] = v_PFK - v_ALD
+    dydt[4] = v_ALD - v_TPI
+    dydt[5] = v_ALD + v_TPI - v_GAPDH
+    dydt[6] = v_GAPDH - v_PGK
+    dydt[7] = v_PGK - v_GPM
+    dydt[8] = v_GPM - v_ENO
+    dydt[9] = v_ENO - v_PYK
+    dydt[10] = v_PYK - v_PDC
+
+
+def glycolysis_rhs_into(double t, const double[::1] y, const double[::1] p,
+                        const double[::1] cof, dydt):
+    """Python entry point, same call as the Numba kernel; returns dydt"""
+    cdef double[::1] out = dydt
+    rhs_c(t, y, p, cof, out)
+    return dydt
+
+
+# ==============================================================================
+# ANALYTIC JACOBIAN
+# ==============================================================================
+
+cdef void jac_c(double t, const double[::1] y, const double[::1] p,
+                const double[::1] cof, double[:, ::1] J) noexcept nogil:
+    """d(dy/dt)/dy into J; same derivatives as glycolysis_model.glycolysis_jac_into"""
+    cdef Py_ssize_t i, j
+    cdef double glucose = y[0], G6P = y[1], F6P = y[2], F16BP = y[3]
+    cdef double DHAP = y[4], GAP = y[5], BPG = y[6], PG3 = y[7]
+    cdef double PG2 = y[8], PEP = y[9], pyruvate = y[10]
+    cdef double ATP = cof[0], ADP = cof[1], NAD = cof[2], Pi = cof[3], T6P = cof[4]
+
+    for i in range(11):
+        for j in range(11):
+            J[i, j] = 0.0
+
+    # HXK
+    cdef double Km_app = p[HXK_Km_glucose] * (1 + T6P / p[HXK_Ki_T6P])
+    cdef double Ki = p[HXK_Ki_G6P]
+    cdef double inh = 1 / (1 + G6P / Ki)
+    cdef double sat = glucose / (Km_app + glucose)
+    cdef double dHXK_glc = p[HXK_Vmax] * Km_app / ((Km_app + glucose) * (Km_app + glucose)) * inh
+    cdef double dHXK_g6p = -p[HXK_Vmax] * sat * inh * inh / Ki
+
+    # Reversible Michaelis-Menten steps: d/ds and d/dprod
+    cdef double dPGI_g6p = _dmm(p[PGI_Vmax], p[PGI_Km_G6P], G6P)
+    cdef double dPGI_f6p = -_dmm(p[PGI_Vmax] / p[PGI_Keq], p[PGI_Km_F6P], F6P)
+    cdef double dTPI_dhap = _dmm(p[TPI_Vmax], p[TPI_Km_DHAP], DHAP)
+    cdef double dTPI_gap = -_dmm(p[TPI_Vmax] / p[TPI_Keq], p[TPI_Km_GAP], GAP)
+    cdef double dGPM_3pg = _dmm(p[GPM_Vmax], p[GPM_Km_3PG], PG3)
+    cdef double dGPM_2pg = -_dmm(p[GPM_Vmax] / p[GPM_Keq], p[GPM_Km_2PG], PG2)
+    cdef double dENO_2pg = _dmm(p[ENO_Vmax], p[ENO_Km_2PG], PG2)
+    cdef double dENO_pep = -_dmm(p[ENO_Vmax] / p[ENO_Keq], p[ENO_Km_PEP], PEP)
+
+    # PFK
+    cdef double atp_term = ATP / (p[PFK_Km_ATP] * (1 + ATP / p[PFK_Ki_ATP]))
+    cdef double amp_factor = 1 + AMP / p[PFK_Ka_AMP]
+    cdef double dPFK_f6p = amp_factor * (atp_term / (1 + atp_term)) * \
+        _dmm(p[PFK_Vmax], p[PFK_Km_F6P], F6P)
+
+    # ALD
+    cdef double Vrev_ald = p[ALD_Vmax] / p[ALD_Keq]
+    cdef double dALD_f16bp = _dmm(p[ALD_Vmax], p[ALD_Km_F16BP], F16BP)
+    cdef double dALD_dhap = -(GAP / (p[ALD_Km_GAP] + GAP)) * \
+        _dmm(Vrev_ald, p[ALD_Km_DHAP], DHAP)
+    cdef double dALD_gap = -(DHAP / (p[ALD_Km_DHAP] + DHAP)) * \
+        _dmm(Vrev_ald, p[ALD_Km_GAP], GAP)
+
+    # GAPDH, PGK
+    cdef double dGAPDH_gap = _dmm(p[GAPDH_Vmax], p[GAPDH_Km_GAP], GAP) * \
+        (NAD / (p[GAPDH_Km_NAD] + NAD)) * (Pi / (p[GAPDH_Km_Pi] + Pi))
+    cdef double dPGK_bpg = _dmm(p[PGK_Vmax], p[PGK_Km_13BPG], BPG) * \
+        (ADP / (p[PGK_Km_ADP] + ADP))
+
+    # PYK: f = 1 + x^n/(1+x^n), x = F16BP/Ka  ->  df/dF16BP = n x^(n-1) / (Ka (1+x^n)^2)
+    cdef double n_pyk = p[PYK_n]
+    cdef double x = F16BP / p[PYK_Ka_F16BP]
+    cdef double xn_1 = x ** (n_pyk - 1)  # one pow for both x^(n-1) and x^n
+    cdef double xn = xn_1 * x
+    cdef double f16bp_factor = 1 + xn / (1 + xn)
+    cdef double pep_term = PEP / (p[PYK_Km_PEP] + PEP)
+    cdef double adp_term = ADP / (p[PYK_Km_ADP] + ADP)
+    cdef double dPYK_f16bp = p[PYK_Vmax] * pep_term * adp_term * \
+        n_pyk * xn_1 / (p[PYK_Ka_F16BP] * (1 + xn) * (1 + xn))
+    cdef double dPYK_pep = f16bp_factor * adp_term * _dmm(p[PYK_Vmax], p[PYK_Km_PEP], PEP)
+
+    # PDC: v = Vmax s^n / (K^n + s^n)  ->  dv/ds = Vmax n s^(n-1) K^n / (K^n + s^n)^2
+    cdef double n_pdc = p[PDC_n]
+    cdef double Kn = p[PDC_Km_pyruvate] ** n_pdc
+    cdef double pyr_n_1 = pyruvate ** (n_pdc - 1)
+    cdef double denom = Kn + pyr_n_1 * pyruvate
+    cdef double dPDC_pyr = p[PDC_Vmax] * n_pdc * pyr_n_1 * Kn / (denom * denom)
+
+    # Stoichiometry (rows follow dydt in rhs_c)
+    J[0, 0] = -dHXK_glc
+    J[0, 1] = -dHXK_g6p
+
+    J[1, 0] = dHXK_glc
+    J[1, 1] = dHXK_g6p - dPGI_g6p
+    J[1, 2] = -dPGI_f6p
+
+    J[2, 1] = dPGI_g6p
+    J[2, 2] = dPGI_f6p - dPFK_f6p
+
+    J[3, 2] = dPFK_f6p
+    J[3, 3] = -dALD_f16bp
+    J[3, 4] = -dALD_dhap
+    J[3, 5] = -dALD_gap
+
+    J[4, 3] = dALD_f16bp
+    J[4, 4] = dALD_dhap - dTPI_dhap
+    J[4, 5] = dALD_gap - dTPI_gap
+
+    J[5, 3] = dALD_f16bp
+    J[5, 4] = dALD_dhap + dTPI_dhap
+    J[5, 5] = dALD_gap + dTPI_gap - dGAPDH_gap
+
+    J[6, 5] = dGAPDH_gap
+    J[6, 6] = -dPGK_bpg
+
+    J[7, 6] = dPGK_bpg
+    J[7, 7] = -dGPM_3pg
+    J[7, 8] = -dGPM_2pg
+
+    J[8, 7] = dGPM_3pg
+    J[8, 8] = dGPM_2pg - dENO_2pg
+    J[8, 9] = -dENO_pep
+
+    J[9, 3] = -dPYK_f16bp
+    J[9, 8] = dENO_2pg
+    J[9, 9] = dENO_pep - dPYK_pep
+
+    J[10, 3] = dPYK_f16bp
+    J[10, 9] = dPYK_pep
+    J[10, 10] = -dPDC_pyr
+
+
+def glycolysis_jac_into(double t, const double[::1] y, const double[::1] p,
+                        const double[::1] cof, J):
+    """Python entry point, same call as the Numba kernel; returns J"""
+    cdef double[:, ::1] out = J
+    jac_c(t, y, p, cof, out)
+    return J
@@ -214,6 +214,43 @@ INITIAL_CONCENTRATIONS = {
 
 ALL_PARAMETERS = {**GLYCOLYSIS_PARAMS, **TCA_PARAMS}
 
+# ==============================================================================
+# FLAT PARAMETER VECTORS (for compiled ODE kernels)
+# Dict lookups are replaced by integer indexing into a contiguous float64 array
+# ==============================================================================
+
+GLYCOLYSIS_PARAM_ORDER = tuple(GLYCOLYSIS_PARAMS)
+GLYCOLYSIS_PARAM_INDEX = {name: i for i, name in enumerate(GLYCOLYSIS_PARAM_ORDER)}
+
+(HXK_Vmax_IDX, HXK_Km_glucose_IDX, HXK_Ki_G6P_IDX, HXK_Ki_T6P_IDX,
+ PGI_Vmax_IDX, PGI_Km_G6P_IDX, PGI_Km_F6P_IDX, PGI_Keq_IDX,
+ PFK_Vmax_IDX, PFK_Km_F6P_IDX, PFK_Km_ATP_IDX, PFK_Ki_ATP_IDX, PFK_Ka_AMP_IDX,
+ ALD_Vmax_IDX, ALD_Km_F16BP_IDX, ALD_Km_DHAP_IDX, ALD_Km_GAP_IDX, ALD_Keq_IDX,
+ TPI_Vmax_IDX, TPI_Km_DHAP_IDX, TPI_Km_GAP_IDX, TPI_Keq_IDX,
+ GAPDH_Vmax_IDX, GAPDH_Km_GAP_IDX, GAPDH_Km_NAD_IDX, GAPDH_Km_Pi_IDX, GAPDH_Ka_NAD_IDX,
+ PGK_Vmax_IDX, PGK_Km_13BPG_IDX, PGK_Km_ADP_IDX, PGK_Keq_IDX,
+ GPM_Vmax_IDX, GPM_Km_3PG_IDX, GPM_Km_2PG_IDX, GPM_Keq_IDX,
+ ENO_Vmax_IDX, ENO_Km_2PG_IDX, ENO_Km_PEP_IDX, ENO_Keq_IDX,
+ PYK_Vmax_IDX, PYK_Km_PEP_IDX, PYK_Km_ADP_IDX, PYK_Ka_F16BP_IDX, PYK_n_IDX,
+ PFK_n_IDX,
+ PDC_Vmax_IDX, PDC_Km_pyruvate_IDX, PDC_n_IDX) = range(len(GLYCOLYSIS_PARAM_ORDER))
+
+TCA_PARAM_ORDER = tuple(TCA_PARAMS)
+TCA_PARAM_INDEX = {name: i for i, name in enumerate(TCA_PARAM_ORDER)}
+
+(PYR_transport_Vmax_IDX, PYR_transport_Km_IDX,
+ PDH_Vmax_IDX, PDH_Km_pyruvate_IDX, PDH_Km_NAD_IDX, PDH_Km_CoA_IDX,
+ CS_Vmax_IDX, CS_Km_AcCoA_IDX, CS_Km_OAA_IDX, CS_Ki_ATP_IDX, CS_Ki_citrate_IDX,
+ ACO_Vmax_IDX, ACO_Km_citrate_IDX, ACO_Km_isocitrate_IDX, ACO_Keq_IDX,
+ ICDH_Vmax_IDX, ICDH_Km_isocitrate_IDX, ICDH_Km_NAD_IDX, ICDH_Ka_ADP_IDX, ICDH_Ka_Ca_IDX,
+ KGDH_Vmax_IDX, KGDH_Km_aKG_IDX, KGDH_Km_NAD_IDX, KGDH_Km_CoA_IDX,
+ KGDH_Ki_SucCoA_IDX, KGDH_Ki_NADH_IDX, KGDH_Ka_Ca_IDX,
+ SCS_Vmax_IDX, SCS_Km_SucCoA_IDX, SCS_Km_GDP_IDX, SCS_Km_Pi_IDX,
+ SDH_Vmax_IDX, SDH_Km_succinate_IDX, SDH_Km_FAD_IDX,
+ FH_Vmax_IDX, FH_Km_fumarate_IDX, FH_Km_malate_IDX, FH_Keq_IDX,
+ MDH_Vmax_IDX, MDH_Km_malate_IDX, MDH_Km_NAD_IDX, MDH_Km_OAA_IDX,
+ MDH_Km_NADH_IDX, MDH_Keq_IDX) = range(len(TCA_PARAM_ORDER))
+
 # Print summary
 if __name__ == "__main__":
     print("="*70)
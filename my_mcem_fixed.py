@@ -24,6 +24,16 @@ import os
 import warnings
 import numpy as np
 import multiprocessing
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from numba_compat import njit, set_num_threads, HAVE_NUMBA, MAX_THREADS, SAFE_FASTMATH
+
+# Optional: tqdm draws the progress bar with its own rate limiting
+try:
+    from tqdm import tqdm
+    HAVE_TQDM = True
+except ImportError:
+    HAVE_TQDM = False
 
 warnings.filterwarnings('ignore')
 
@@ -36,6 +46,142 @@ class ProcGlobal:
 
 proc_global = ProcGlobal()
 
+# Per-process state for pooled likelihood evaluation (set by _init_worker)
+_WORKER = {}
+
+
+def _init_worker(likelihood, args):
+    """Pool initializer: ship the likelihood and its args once per worker"""
+    _WORKER['likelihood'] = likelihood
+    _WORKER['args'] = args
+
+
+def _init_chain_worker(n_threads):
+    """Chain pool initializer: split the Numba threads between the chains"""
+    set_num_threads(n_threads)
+
+
+def _run_chain(r_rand, maxiter, inner_loop, n_pars, positive_only, likelihood,
+               args, thr, initial_guess, batch_likelihood, full_covariance,
+               score_mean, coarse_likelihood, coarse_iters):
+    """One MCEM chain inside a chain-pool worker (no progress bar)"""
+    return exptn_maxtn([], r_rand, maxiter, inner_loop, n_pars, positive_only,
+                       likelihood, args, thr, show_progress=False,
+                       initial_guess=initial_guess,
+                       batch_likelihood=batch_likelihood,
+                       full_covariance=full_covariance,
+                       score_mean=score_mean,
+                       coarse_likelihood=coarse_likelihood,
+                       coarse_iters=coarse_iters)
+
+
+def _sample_loglike(item):
+    """Evaluate one (index, parameters) proposal inside a pool worker"""
+    i, ks_var = item
+    return i, log_likelihood(ks_var, _WORKER['likelihood'], _WORKER['args'])
+
+
+# Sum of squared residuals. The compiled kernels fuse square and sum into one
+# pass with no temporary; reassociation lets the reduction vectorize, while
+# NaN/inf semantics are kept so failed simulations are still rejected.
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=SAFE_FASTMATH)
+    def sum_squares(r):
+        """Sum of squares of a 1-D float64 array"""
+        s = 0.0
+        for i in range(r.shape[0]):
+            s += r[i] * r[i]
+        return s
+
+    @njit(cache=True, fastmath=SAFE_FASTMATH)
+    def sum_squares_rows(R):
+        """Row-wise sum of squares of a 2-D float64 array"""
+        out = np.empty(R.shape[0])
+        for i in range(R.shape[0]):
+            s = 0.0
+            for j in range(R.shape[1]):
+                s += R[i, j] * R[i, j]
+            out[i] = s
+        return out
+else:
+    def sum_squares(r):
+        """Sum of squares of a 1-D float64 array"""
+        return np.dot(r, r)
+
+    def sum_squares_rows(R):
+        """Row-wise sum of squares of a 2-D float64 array"""
+        return np.einsum('ij,ij->i', R, R)
+
+
+@njit(cache=True)
+def metropolis_scan(lks, log_u):
+    """Sequential Metropolis accept/reject over precomputed log-likelihoods
+
+    Sample 0 is always accepted; sample i > 0 replaces the current one
+    when lks[i] - lk_current > log_u[i - 1], i.e. exp(lks[i] - lk_current)
+    > u without the exp (no overflow, no transcendental per step). NaN
+    log-likelihoods are never accepted.
+
+    Returns:
+        array: index of the sample held after each step, shape (len(lks),)
+    """
+    n = lks.shape[0]
+    held = np.empty(n, dtype=np.int64)
+    cur = 0
+    lkold = lks[0]
+    held[0] = 0
+    for i in range(1, n):
+        if lks[i] - lkold > log_u[i - 1]:
+            cur = i
+            lkold = lks[i]
+        held[i] = cur
+    return held
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class CachedLikelihood:
+    """LRU memo for a likelihood/residual function
+
+    Keys are the parameter vector rounded to `decimals`, so proposals that
+    repeat (a collapsed sampler whose standard deviations reach zero,
+    re-evaluating the current mean) reuse the stored residuals instead of
+    integrating again. The args tuple is assumed fixed for the lifetime of
+    the wrapper (one estimation run).
+
+    Picklable, so it can be handed to worker pools; each worker then keeps
+    its own cache.
+    """
+    def __init__(self, custom_function, maxsize=8192, decimals=10):
+        self.custom_function = custom_function
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, ks_var, args=None):
+        key = tuple(np.round(np.asarray(ks_var, dtype=float), self.decimals))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+        self.misses += 1
+        result = self.custom_function(ks_var, args)
+        self._cache[key] = result
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self):
+        """Same fields as functools.lru_cache().cache_info()"""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        self._cache.clear()
+        self.hits = self.misses = 0
+
 
 def log_likelihood(ks_var, custom_function, args=None):
     """This function evaluates the loglikelihood based on the definitons
@@ -53,10 +199,31 @@ def log_likelihood(ks_var, custom_function, args=None):
         float: loglikelihood value
     """
     result = custom_function(ks_var, args)
-    loglike = -1.0 * np.sum(result ** 2)
+    loglike = -1.0 * sum_squares(np.asarray(result, dtype=np.float64).ravel())
     return loglike
 
 
+def log_likelihood_batch(ks_matrix, batch_function, args=None):
+    """Vectorized log-likelihood: one call for a whole set of samples.
+
+    Same definition as log_likelihood, evaluated row-wise, so it follows
+    the vectorized log-probability contract of ensemble samplers
+    (theta of shape (n_samples, n_pars) -> shape (n_samples,)).
+
+    Args:
+        ks_matrix (array): parameter samples, shape (n_samples, n_pars)
+        batch_function (function): f(ks_matrix, args) returning residuals
+            of shape (n_samples, n_residuals)
+        args (tuple, optional): tuple of arguments needed by the
+            batch_function. Defaults to None.
+
+    Returns:
+        array: loglikelihood value of each sample
+    """
+    residuals = np.asarray(batch_function(ks_matrix, args), dtype=np.float64)
+    return -1.0 * sum_squares_rows(residuals.reshape(len(residuals), -1))
+
+
 def cost_value(ks_var, custom_function, args=None):
     """This function evaluates the cost function or objective function
     based on the definitions provided in the custom_function. Here, it
@@ -73,18 +240,62 @@ def cost_value(ks_var, custom_function, args=None):
         float: sum of squared error
     """
     result = custom_function(ks_var, args)
-    value = np.sum(result ** 2)
+    value = sum_squares(np.asarray(result, dtype=np.float64).ravel())
     return value
 
 
+# Floor for lognormal means (the smallest normal float64)
+_TINY = np.finfo(np.float64).tiny
+
+
+def correlated_proposals(mn_lst, cov, n_samples, positive_only, rng):
+    """Draw proposals with the given mean vector and full covariance
+
+    For positive_only the proposals are multivariate lognormal, with the
+    log-space mean and covariance matched to (mn_lst, cov); with a
+    diagonal cov this is the per-parameter lognormal of exptn_maxtn.
+    Falls back to the diagonal of cov if the matched covariance is not
+    positive definite.
+
+    Args:
+        mn_lst (array): mean of each parameter
+        cov (array): covariance matrix, shape (n_pars, n_pars)
+        n_samples (int): number of proposals
+        positive_only (bool): lognormal (True) or normal (False) proposals
+        rng (np.random.Generator): random number generator of the chain
+
+    Returns:
+        array: proposals, shape (n_samples, n_pars)
+    """
+    n_pars = len(mn_lst)
+    if positive_only:
+        mn_lst = np.maximum(mn_lst, _TINY)
+        cov = np.log1p(cov / mn_lst[:, None] / mn_lst[None, :])
+        loc = np.log(mn_lst) - 0.5 * np.diag(cov)
+    else:
+        loc = mn_lst
+    try:
+        L = np.linalg.cholesky(cov + 1e-12 * np.eye(n_pars))
+    except np.linalg.LinAlgError:
+        L = np.diag(np.sqrt(np.maximum(np.diag(cov), 0.0)))
+    z = rng.standard_normal((n_samples, n_pars))
+    draws = loc + z @ L.T
+    return np.exp(draws) if positive_only else draws
+
+
 def exptn_maxtn(LST, r_rand, maxiter, inner_loop, n_pars, positive_only,
-                likelihood, args, thr, show_progress=True, initial_guess=None):
+                likelihood, args, thr, show_progress=True, initial_guess=None,
+                n_workers=1, batch_likelihood=None, full_covariance=False,
+                score_mean=True, coarse_likelihood=None, coarse_iters=0):
     """The expectation maximization algorithm with progress tracking
 
     Args:
         LST (list): multiprocessing.Manager().list(). Empty List to store
             data from  each chain
-        r_rand (float): Seeding  np.random.uniform(0, 1)  to each chain
+        r_rand (int, float or np.random.SeedSequence): seed  of this
+            chain's own  np.random.Generator (a float in [0, 1) is scaled
+            to an integer). run_mcem passes independent children  of one
+            SeedSequence, so chains never share a stream
         maxiter (int): Max number of iteration. Here, it is the product
             of the parameter  maxiter from run_mcem function  and  chain
             number
@@ -102,12 +313,45 @@ def exptn_maxtn(LST, r_rand, maxiter, inner_loop, n_pars, positive_only,
             Defaults to 1.0e-10.
         show_progress (bool): Show progress bar
         initial_guess (array): Initial parameter guess
+        n_workers (int, optional): Processes used to evaluate the inner
+            samples. Proposals are drawn from  the current  lognormal and
+            do not depend on the chain state, so each EM step draws  all
+            of them up front, evaluates the likelihoods (in a pool  when
+            n_workers > 1), then runs the Metropolis accept/reject scan in
+            order. The likelihood must then be picklable (module-level).
+            Defaults to 1 (serial).
+        batch_likelihood (function, optional): vectorized  counterpart of
+            likelihood, called  once per EM  step as  f(proposals, args)
+            with proposals of  shape (inner_loop, n_pars)  and returning
+            residuals of shape (inner_loop, n_residuals). Takes precedence
+            over n_workers. Defaults to None.
+        full_covariance (bool, optional): Draw the proposals  of each EM
+            step with the full covariance of the previous step's accepted
+            samples  (see correlated_proposals) instead of independent
+            per-parameter spreads,  so correlated parameters are proposed
+            along their ridge. Defaults to False.
+        score_mean (bool, optional): Evaluate  the mean of the accepted
+            samples after  each EM step  and return the best  such mean
+            (one extra likelihood call per step). If False, return the
+            best single sample evaluated in the E-steps instead, scored
+            from the likelihoods already computed (in  batch_likelihood
+            precision when that is used). Defaults to True.
+        coarse_likelihood (function, optional): cheaper batch_likelihood
+            (e.g. looser  integrator tolerances) used  instead for  the
+            first coarse_iters EM steps, while the proposals are  still
+            broad. Samples scored by it are not candidates for the best
+            single sample (score_mean=False). Defaults to None.
+        coarse_iters (int, optional): number  of EM  steps that  use
+            coarse_likelihood. Defaults to 0.
 
     Returns:
         tuple: final parameter values and minimum error/cost function
     """
     
-    np.random.seed(int(r_rand * 100))
+    # a float in [0, 1) is the older per-chain seed convention
+    if isinstance(r_rand, float):
+        r_rand = int(r_rand * 1e9)
+    rng = np.random.default_rng(r_rand)
     
     # Use provided initial guess or default
     if initial_guess is not None:
@@ -118,86 +362,141 @@ def exptn_maxtn(LST, r_rand, maxiter, inner_loop, n_pars, positive_only,
         # Fallback to generic initialization
         mn_lst = np.array([3.0] * n_pars)
         sd_lst = np.array([1.5] * n_pars)
+    cov_lst = np.diag(sd_lst ** 2)
     
     # initialize variables
     er_min = 1.0e10
+    # fraction of proposals accepted in the last E-step (shown with progress)
+    accept_rate = 0.0
     
     # ====================================================================
     # BUG FIX: Initialize ks_var BEFORE the loop!
     # This prevents UnboundLocalError if optimization never improves
+    # (no copy needed: mn_lst is a fresh array that is only ever rebound,
+    # never modified in place)
     # ====================================================================
-    ks_var = mn_lst.copy()  # Start with initial guess
+    ks_var = mn_lst  # Start with initial guess
+    
+    # mean of the previous EM step, for the convergence check
+    prev_mn = None
     
-    # initialize storage
-    chk_lst = []
+    # worker pool for the inner samples (None -> serial loop); spawned like
+    # the chain pool, since forking after Numba's threaded kernels have run
+    # hangs the parent at exit
+    pool = None
+    if n_workers > 1 and batch_likelihood is None:
+        pool = proc_global.mp.get_context('spawn').Pool(
+            n_workers, initializer=_init_worker, initargs=(likelihood, args))
+        chunksize = max(1, inner_loop // (4 * n_workers))
+    
+    # progress bar: tqdm if installed, else a printed bar refreshed at
+    # most ~100 times per run (every 5th iteration for short runs)
+    bar_length = 40
+    pbar = None
+    if show_progress and HAVE_TQDM:
+        pbar = tqdm(total=maxiter, desc="  MCEM Progress", ncols=100)
+    print_every = max(5, maxiter // 100)
     
     iterz = 0
     # begin iteration
     while iterz < maxiter:
         # Progress indicator
-        if show_progress and iterz % 5 == 0:
+        if show_progress and pbar is None and iterz % print_every == 0:
             progress_pct = (iterz / maxiter) * 100
-            bar_length = 40
             filled = int(bar_length * iterz / maxiter)
             bar = '█' * filled + '░' * (bar_length - filled)
-            print(f"\r  MCEM Progress: [{bar}] {progress_pct:.0f}% (Iter {iterz}/{maxiter}, SSE: {er_min:.2e})", end='', flush=True)
+            print(f"\r  MCEM Progress: [{bar}] {progress_pct:.0f}% (Iter {iterz}/{maxiter}, SSE: {er_min:.2e}, acc: {accept_rate:.0%})", end='', flush=True)
         
-        # stores samples with final optimized likelihood
-        xacept = []
+        # Proposals come from the current lognormal/normal and do not depend
+        # on the chain state, so the whole inner loop is drawn in one call,
+        # evaluated (batched, pooled or one by one), then scanned in order
+        if full_covariance:
+            proposals = correlated_proposals(mn_lst, cov_lst, inner_loop, positive_only,
+                                             rng)
+        elif positive_only:
+            # a zero mean (e.g. a zero initial guess) would make these NaN
+            mn_pos = np.maximum(mn_lst, _TINY)
+            cv2 = (sd_lst / mn_pos) ** 2
+            proposals = rng.lognormal(
+                mean=np.log(mn_pos / np.sqrt(1 + cv2)),
+                sigma=np.sqrt(np.log(1 + cv2)),
+                size=(inner_loop, n_pars)
+            )
+        else:
+            proposals = rng.normal(mn_lst, sd_lst, size=(inner_loop, n_pars))
         
-        smpl_ik = 0
-        mnew_lst = []
-        sdnew_lst = []
-        while smpl_ik < inner_loop:
-            # sample new values from log-normal distribution
-            if positive_only:
-                ksnew_var = np.random.lognormal(
-                    mean=np.log(mn_lst / np.sqrt(1 + (sd_lst / mn_lst) ** 2)),
-                    sigma=np.sqrt(np.log(1 + (sd_lst / mn_lst) ** 2))
-                )
-            else:
-                ksnew_var = np.random.normal(mn_lst, sd_lst)
-            
-            # calculate log-likelihood with new parameters
-            lknew = log_likelihood(ksnew_var, likelihood, args)
-            
-            # metropolis acceptance
-            if smpl_ik == 0 or np.exp(lknew - lkold) > np.random.uniform(0, 1):
-                ksold_var = ksnew_var
-                lkold = lknew
-            
-            #collect accepted parameters
-            xacept.append(ksold_var)
-            smpl_ik += 1
+        coarse = coarse_likelihood is not None and iterz < coarse_iters
+        if coarse:
+            lk_all = log_likelihood_batch(proposals, coarse_likelihood, args)
+        elif batch_likelihood is not None:
+            lk_all = log_likelihood_batch(proposals, batch_likelihood, args)
+        elif pool is not None:
+            lk_all = np.empty(inner_loop)
+            for i, lk in pool.imap_unordered(_sample_loglike, enumerate(proposals),
+                                             chunksize=chunksize):
+                lk_all[i] = lk
+        else:
+            lk_all = np.fromiter((log_likelihood(ks_new, likelihood, args)
+                                  for ks_new in proposals),
+                                 dtype=np.float64, count=inner_loop)
         
-        # expectation step : calculate mean and standard dev of parameters
-        xacept = np.array(xacept)
-        mn_lst = np.mean(xacept, axis=0)
-        sd_lst = np.std(xacept, axis=0)
+        if not score_mean and not coarse:
+            # best sample so far, from the likelihoods just computed (NaN
+            # marks a failed simulation)
+            best = np.argmax(np.where(np.isnan(lk_all), -np.inf, lk_all))
+            if -lk_all[best] < er_min:
+                er_min = -lk_all[best]
+                ks_var = proposals[best]
         
-        # keep track of parameters for convergence
-        chk_lst.append(mn_lst)
+        # metropolis acceptance (one uniform per sample after the first)
+        log_u = np.log(rng.uniform(0, 1, inner_loop - 1))
+        held = metropolis_scan(lk_all, log_u)
+        xacept = proposals[held]
+        accept_rate = np.count_nonzero(np.diff(held)) / max(1, inner_loop - 1)
+        
+        # expectation step : calculate mean and standard dev of parameters
+        mn_lst = xacept.mean(axis=0)
+        sd_lst = xacept.std(axis=0)
+        if full_covariance:
+            cov_lst = np.cov(xacept, rowvar=False, bias=True)
         
         # Check for convergence
         if iterz >= 2:
-            diff = np.sum(np.abs(chk_lst[-1] - chk_lst[-2]))
+            diff = np.sum(np.abs(mn_lst - prev_mn))
             if diff <= thr:
-                if show_progress:
+                if pbar is not None:
+                    pbar.close()
+                    print(f"  MCEM: CONVERGED at iteration {iterz}!")
+                elif show_progress:
                     print(f"\r  MCEM Progress: [{'█'*bar_length}] 100% - CONVERGED at iteration {iterz}!" + " "*20)
                 # Update ks_var with converged value
-                ks_var = mn_lst
+                if score_mean:
+                    ks_var = mn_lst
                 break
         
+        prev_mn = mn_lst
+        
         # calculate minimum error with current mean parameters
-        er_cur = cost_value(mn_lst, likelihood, args)
-        if er_cur < er_min:
-            er_min = er_cur
-            ks_var = mn_lst  # Update best parameters
+        if score_mean:
+            er_cur = cost_value(mn_lst, likelihood, args)
+            if er_cur < er_min:
+                er_min = er_cur
+                ks_var = mn_lst  # Update best parameters
         
         iterz += 1
+        if pbar is not None:
+            pbar.set_postfix(SSE=f"{er_min:.2e}", acc=f"{accept_rate:.0%}", refresh=False)
+            pbar.update(1)
+    
+    if pool is not None:
+        pool.close()
+        pool.join()
     
     # Final progress update
-    if show_progress:
+    if pbar is not None:
+        pbar.close()
+        print(f"  MCEM: Completed {iterz} iterations!")
+    elif show_progress:
         print(f"\r  MCEM Progress: [{'█'*bar_length}] 100% - Completed {iterz} iterations!" + " "*20)
         print()  # New line
     
@@ -207,13 +506,16 @@ def exptn_maxtn(LST, r_rand, maxiter, inner_loop, n_pars, positive_only,
 
 
 def run_mcem(ks_lst, chains=1, maxiter=300, inner_loop=500,
-             positive_only=True, likelihood=None, args=None):
+             positive_only=True, likelihood=None, args=None, n_workers=1,
+             batch_likelihood=None, full_covariance=False, score_mean=True,
+             coarse_likelihood=None, coarse_iters=0, n_threads=None):
     """Run MCEM with multiple chains
 
     Args:
         ks_lst (list): list of initial parameter values
         chains (int, optional): Number of parallel chains to run for the
-            MCEM. Defaults to 1.
+            MCEM, one process each (n_workers is then ignored). Defaults
+            to 1.
         maxiter (int, optional): Number  of iteration steps for the EM.
             Defaults to 300.
         inner_loop (int, optional): Sample size per EM  iteration. 
@@ -226,67 +528,98 @@ def run_mcem(ks_lst, chains=1, maxiter=300, inner_loop=500,
             r_dict,  p_dict,  v_stoich,  c_miss,  k_miss, molar, rfile).
             Defaults  to None. See param_estimate module for  the proper
             definition of variables.
+        n_workers (int, optional): Processes used to evaluate the inner
+            samples of each EM step. Defaults to 1 (serial).
+        batch_likelihood (function, optional): vectorized likelihood that
+            evaluates all  inner samples of an EM step in one call.  See
+            exptn_maxtn. Defaults to None.
+        full_covariance (bool, optional): correlated proposals from  the
+            accepted samples' covariance. See exptn_maxtn. Defaults to
+            False.
+        score_mean (bool, optional): return the best mean of accepted
+            samples (True) or the best single sample, which saves one
+            likelihood call per EM step. See exptn_maxtn. Defaults to
+            True.
+        coarse_likelihood (function, optional): cheaper batch likelihood
+            for the first coarse_iters EM steps. See exptn_maxtn.
+            Defaults to None.
+        coarse_iters (int, optional): EM steps on coarse_likelihood (for
+            chain ih, scaled by ih+1 like maxiter). Defaults to 0.
+        n_threads (int, optional): Numba threads the chains share for
+            their batched E-steps (each chain gets n_threads // chains,
+            at least 1). Defaults to None (MAX_THREADS).
 
     Returns:
         tuple: (best_parameters, minimum_error, standard_deviations)
     """
     n_pars = len(ks_lst)
-    xvar = 0.0
+    
+    # One independent random stream per chain, plus one for the chains'
+    # starting points
+    streams = np.random.SeedSequence(42).spawn(chains + 1)
+    seeds = streams[:chains]
     
     if chains == 1:
         # Single chain - no multiprocessing
-        np.random.seed(42)
-        r_rand = np.random.uniform(0, 1)
         thr = 1.0e-10
         
         result = exptn_maxtn(
-            [], r_rand, maxiter, inner_loop, n_pars, 
+            [], seeds[0], maxiter, inner_loop, n_pars, 
             positive_only, likelihood, args, thr,
             show_progress=True,
-            initial_guess=ks_lst  # PASS THE INITIAL GUESS!
+            initial_guess=ks_lst,  # PASS THE INITIAL GUESS!
+            n_workers=n_workers,
+            batch_likelihood=batch_likelihood,
+            full_covariance=full_covariance,
+            score_mean=score_mean,
+            coarse_likelihood=coarse_likelihood,
+            coarse_iters=coarse_iters
         )
         
         # Return all three: parameters, error, and std devs
         return result
     
-    # Note: Multi-chain code below is preserved but not currently used on Windows
-    # If needed in future, uncomment and fix multiprocessing for Windows
+    # Multiple chains, one process each. Chain ih runs maxiter*(ih+1)
+    # iterations of inner_loop*(ih+1) samples from its own seed, and the
+    # chain with the lowest error wins. Chain 1 starts from ks_lst, the
+    # others from ks_lst perturbed by the same 20% spread exptn_maxtn
+    # starts its proposals with (lognormal, or normal if not
+    # positive_only), so they explore different modes. The spawn context starts every
+    # worker from a fresh interpreter (the only option on Windows, and safe
+    # next to Numba's threading layer on Linux), so likelihood,
+    # batch_likelihood and args must be picklable (module-level) and the
+    # calling script must guard its entry point with
+    # if __name__ == "__main__".
+    thr = 1.0e-10
+    
+    start_rng = np.random.default_rng(streams[-1])
+    starts = np.tile(np.asarray(ks_lst, dtype=float), (chains, 1))
+    if positive_only:
+        starts[1:] *= start_rng.lognormal(0.0, 0.2, size=(chains - 1, n_pars))
+    else:
+        starts[1:] += start_rng.normal(0.0, 1.0, size=(chains - 1, n_pars)) * \
+            0.2 * np.abs(starts[1:])
+    
+    print(f"  MCEM: {chains} chains in parallel processes...")
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=chains, mp_context=ctx,
+                             initializer=_init_chain_worker,
+                             initargs=(max(1, (n_threads or MAX_THREADS) // chains),)) as executor:
+        futures = [
+            executor.submit(_run_chain, seeds[ih], maxiter * (ih + 1),
+                            inner_loop * (ih + 1), n_pars, positive_only,
+                            likelihood, args, thr, starts[ih], batch_likelihood,
+                            full_covariance, score_mean, coarse_likelihood,
+                            coarse_iters * (ih + 1))
+            for ih in range(chains)
+        ]
+        ffvar = [future.result() for future in futures]
+    
+    for ih, result in enumerate(ffvar):
+        print(f"  Chain {ih + 1}: SSE {result[1]:.2e}")
     
-    # else:
-    #     # Multiple chains with multiprocessing
-    #     # Note: This may not work on Windows due to multiprocessing limitations
-    #     # For Windows, use chains=1
-    #     
-    #     manager = multiprocessing.Manager()
-    #     LST = manager.list()
-    #     
-    #     pool = multiprocessing.Pool(chains)
-    #     np.random.seed(42)
-    #     rands = [(xvar + 1) * np.random.uniform(0, 1) for xvar in range(chains)]
-    # 
-    #     thr = 1.0e-10
-    #     results = [
-    #         pool.apply_async(
-    #             exptn_maxtn, args=(LST, rands[ih], maxiter * (ih + 1),
-    #                                inner_loop * (ih + 1), n_pars, positive_only,
-    #                                likelihood, args, thr)
-    #         ) for ih in range(chains)
-    #     ]
-    # 
-    #     ffvar = [result.get() for result in results]
-    #     pool.close()
-    #     pool.join()
-    # 
-    #     # Find best result across chains
-    #     er_list = [result[1] for result in ffvar]
-    #     er_min = min(er_list)
-    #     
-    #     ks_var = None
-    #     for result in ffvar:
-    #         if result[1] <= er_min:
-    #             ks_var = result[0]
-    #     
-    #     return (ks_var, er_min)
+    # Best result across chains
+    return min(ffvar, key=lambda result: result[1])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+"""
+Optional Numba Support
+======================
+
+Numba is an optional accelerator. When it is installed the decorators
+below compile the hot numerical kernels (ODE right-hand sides, residual
+sums) to machine code; when it is missing they fall back to plain Python
+so every module keeps working unchanged, only slower.
+
+Install with: pip install numba
+"""
+
+try:
+    from numba import njit, prange, set_num_threads, config
+    HAVE_NUMBA = True
+    MAX_THREADS = config.NUMBA_NUM_THREADS
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+    MAX_THREADS = 1
+
+    def set_num_threads(n):
+        """No-op stand-in for numba.set_num_threads"""
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# fastmath flags for the compiled kernels: reassociation, FMA contraction
+# and reciprocal division, but not 'nnan'/'ninf', so NaN and inf still
+# propagate and isfinite() keeps flagging failed integrations
+SAFE_FASTMATH = {'reassoc', 'contract', 'nsz', 'arcp'}
@@ -44,12 +44,15 @@ def run_bayesian_fispo(organisms, mode_name, settings, session_folder):
         'PYK_Vmax': 0.95
     }
     
-    # Save results
-    np.savez(
+    # Save results as parallel fixed-dtype arrays (loads without pickle)
+    ci = np.array([confidence_intervals[p] for p in identifiable_params], dtype=np.float64)
+    np.savez_compressed(
         session_folder / "bayesian_fispo.npz",
-        identifiable_params=identifiable_params,
-        confidence_intervals=confidence_intervals,
-        identifiability_scores=identifiability_scores
+        param_names=np.array(identifiable_params, dtype='U32'),
+        ci_lo=ci[:, 0],
+        ci_hi=ci[:, 1],
+        scores=np.array([identifiability_scores[p] for p in identifiable_params],
+                        dtype=np.float64)
     )
     
     # Print results
@@ -53,7 +53,6 @@ def run_complete_analysis(organisms, mode_name, settings, session_folder):
     print("\n" + "-"*80)
     print("Continuing to robustness testing...")
     print("-"*80)
-    time.sleep(2)  # Brief 2 second pause for readability
     
     # 2. Robustness Testing
     print("\n\n" + "="*80)
@@ -71,7 +70,6 @@ def run_complete_analysis(organisms, mode_name, settings, session_folder):
     print("\n" + "-"*80)
     print("Continuing to Bayesian + FISPO analysis...")
     print("-"*80)
-    time.sleep(2)  # Brief 2 second pause for readability
     
     # 3. Bayesian + FISPO
     print("\n\n" + "="*80)
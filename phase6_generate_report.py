@@ -5,8 +5,20 @@ Generates text-based comparative report from Phase 6 results.
 Works with the new parameter estimation data structure.
 """
 
+import io
 import numpy as np
 from pathlib import Path
+from data_io import load_results
+
+# One row per organism for the summary/ranking reductions
+SUMMARY_DTYPE = np.dtype([('organism', 'U32'), ('total_params', np.int64),
+                          ('overall_error', np.float64), ('total_runtime', np.float64)])
+
+
+def summary_table(results):
+    """Per-organism result dicts -> structured SUMMARY_DTYPE array"""
+    return np.array([(r['organism'], r['total_params'], r['overall_error'], r['total_runtime'])
+                     for r in results], dtype=SUMMARY_DTYPE)
 
 def generate_comparative_report():
     """Generate comparative report from existing results"""
@@ -64,16 +76,18 @@ def generate_comparative_report():
     param_file = selected_session / 'parameter_estimation.npz'
     
     try:
-        data = np.load(param_file, allow_pickle=True)
-        results = data['results']
+        results = load_results(param_file)
     except Exception as e:
         print(f"\n✗ Error loading results: {e}")
         return
     
+    summary = summary_table(results)
+    
     # Generate report
     report_file = selected_session / 'COMPARATIVE_REPORT.txt'
     
-    with open(report_file, 'w', encoding='utf-8') as f:
+    # Composed in memory, then written (and echoed) in one go
+    with io.StringIO() as f:
         # Header
         f.write("="*80 + "\n")
         f.write("PHASE 6 2.0: COMPARATIVE ANALYSIS REPORT\n")
@@ -87,16 +101,12 @@ def generate_comparative_report():
         f.write("-"*80 + "\n")
         f.write(f"Total organisms analyzed: {len(results)}\n")
         
-        total_params = sum(r['total_params'] for r in results)
-        f.write(f"Total parameters estimated: {total_params}\n")
-        
-        all_errors = []
-        for r in results:
-            all_errors.append(r['overall_error'])
+        f.write(f"Total parameters estimated: {summary['total_params'].sum()}\n")
         
-        f.write(f"Average error across all organisms: {np.mean(all_errors):.2f}%\n")
-        f.write(f"Best performing organism: {results[np.argmin(all_errors)]['organism']} ({min(all_errors):.2f}%)\n")
-        f.write(f"Total runtime: {sum(r['total_runtime'] for r in results)/3600:.2f} hours\n")
+        best = summary[summary['overall_error'].argmin()]
+        f.write(f"Average error across all organisms: {summary['overall_error'].mean():.2f}%\n")
+        f.write(f"Best performing organism: {best['organism']} ({best['overall_error']:.2f}%)\n")
+        f.write(f"Total runtime: {summary['total_runtime'].sum()/3600:.2f} hours\n")
         f.write("\n")
         
         # Per-Organism Results
@@ -122,16 +132,18 @@ def generate_comparative_report():
             for pathway_data in organism_result['pathway_results']:
                 pathway = pathway_data['pathway']
                 n_params = len(pathway_data['parameters'])
-                errors = pathway_data['errors']
+                # one array conversion; min/median/max from one quantile call
+                errors = np.asarray(pathway_data['errors'], dtype=np.float64)
+                err_min, err_median, err_max = np.quantile(errors, [0.0, 0.5, 1.0])
                 pathway_runtime = pathway_data['runtime']
                 
                 f.write(f"  {pathway.upper()} Pathway:\n")
                 f.write(f"    Parameters: {n_params}\n")
-                f.write(f"    Mean error: {np.mean(errors):.2f}%\n")
-                f.write(f"    Median error: {np.median(errors):.2f}%\n")
-                f.write(f"    Std dev: {np.std(errors):.2f}%\n")
-                f.write(f"    Min error: {np.min(errors):.2f}%\n")
-                f.write(f"    Max error: {np.max(errors):.2f}%\n")
+                f.write(f"    Mean error: {errors.mean():.2f}%\n")
+                f.write(f"    Median error: {err_median:.2f}%\n")
+                f.write(f"    Std dev: {errors.std():.2f}%\n")
+                f.write(f"    Min error: {err_min:.2f}%\n")
+                f.write(f"    Max error: {err_max:.2f}%\n")
                 f.write(f"    Runtime: {pathway_runtime/60:.1f} min\n")
                 f.write("\n")
         
@@ -140,12 +152,12 @@ def generate_comparative_report():
         f.write("COMPARATIVE ANALYSIS\n")
         f.write("="*80 + "\n\n")
         
-        # Sort by performance
-        sorted_results = sorted(results, key=lambda x: x['overall_error'])
+        # Sort by performance (stable, so ties keep the session order)
+        ranking = summary[np.argsort(summary['overall_error'], kind='stable')]
         
         f.write("Performance Ranking (by error):\n")
         f.write("-"*80 + "\n")
-        for idx, r in enumerate(sorted_results, 1):
+        for idx, r in enumerate(ranking, 1):
             f.write(f"  {idx}. {r['organism']:<20} {r['overall_error']:6.2f}%  ")
             f.write(f"({r['total_params']} params, {r['total_runtime']/3600:.2f} hrs)\n")
         
@@ -162,19 +174,22 @@ def generate_comparative_report():
         }
         
         for kingdom, org_names in kingdoms.items():
-            kingdom_results = [r for r in results if r['organism'] in org_names]
-            if kingdom_results:
-                avg_error = np.mean([r['overall_error'] for r in kingdom_results])
-                total_params = sum(r['total_params'] for r in kingdom_results)
-                f.write(f"  {kingdom:<15} {len(kingdom_results)} organism(s), ")
+            kingdom_rows = summary[np.isin(summary['organism'], org_names)]
+            if len(kingdom_rows):
+                avg_error = kingdom_rows['overall_error'].mean()
+                total_params = kingdom_rows['total_params'].sum()
+                f.write(f"  {kingdom:<15} {len(kingdom_rows)} organism(s), ")
                 f.write(f"{total_params} total params, {avg_error:.2f}% avg error\n")
         
         f.write("\n" + "="*80 + "\n")
         f.write("END OF REPORT\n")
         f.write("="*80 + "\n")
+        report_text = f.getvalue()
+    
+    report_file.write_text(report_text, encoding='utf-8')
     
     print(f"\n✓ Report generated: {report_file}")
-    print(f"\n{report_file.read_text(encoding='utf-8')}")
+    print(f"\n{report_text}")
     print("\n" + "="*80)
     print("REPORT GENERATION COMPLETE!")
     print("="*80)
@@ -3,14 +3,24 @@ PHASE 6 PARAMETER ESTIMATION - FLEXIBLE DATA LOADING
 ====================================================
 Detects data file structure automatically!
 """
+import os
+import multiprocessing
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy.integrate import odeint
 import time
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from glycolysis_model import GlycolysisModel
-from tca_model import TCAModel
-from my_mcem_fixed import run_mcem
+from glycolysis_model import GlycolysisModel, glycolysis_rhs_into, glycolysis_jac_into, DEFAULT_COFACTORS
+from glycolysis_model import GLYCOLYSIS_LSODA_ADDRESS, simulate_batch, warmup as warmup_glycolysis
+from tca_model import TCAModel, simulate_batch as simulate_tca_batch, warmup as warmup_tca
+from my_mcem_fixed import run_mcem, CachedLikelihood, cost_value
+from kinetic_parameters import (GLYCOLYSIS_PARAM_ORDER, GLYCOLYSIS_PARAM_INDEX,
+                                TCA_PARAMS, TCA_PARAM_ORDER, TCA_PARAM_INDEX)
+from numba_compat import HAVE_NUMBA, MAX_THREADS, set_num_threads
+from ode_integrators import integrate_batch, integrate_batch_lsoda, HAVE_NUMBALSODA
+from data_io import load_npy_sidecars, write_npy_sidecars, load_param_record, save_results
 
 def get_parameters_to_estimate(pathway='glycolysis'):
     """Get list of parameters to estimate"""
@@ -46,37 +56,50 @@ def get_parameters_to_estimate(pathway='glycolysis'):
 def load_data_flexible(data_file):
     """Load data file - detects structure automatically"""
     
-    data = np.load(data_file, allow_pickle=True)
+    # Pickle-free by default; see load_param_record for legacy files
+    data = np.load(data_file)
     
     print(f"  Data file keys: {list(data.files)}")
     
-    # Try to get time data
-    if 't_observed' in data.files:
-        t_obs = data['t_observed']
-    elif 't' in data.files:
-        t_obs = data['t']
+    # Prefer memory-mapped .npy sidecars for the arrays (see data_io)
+    sidecars = load_npy_sidecars(data_file)
+    if sidecars is not None:
+        t_obs, y_obs, obs_idx = sidecars
+        print(f"  Using memory-mapped .npy sidecars")
     else:
-        raise KeyError("Could not find time data (tried: 't_observed', 't')")
-    
-    # Try to get concentration data
-    if 'y_observed' in data.files:
-        y_obs = data['y_observed']
-    elif 'y' in data.files:
-        y_obs = data['y']
-    else:
-        raise KeyError("Could not find concentration data (tried: 'y_observed', 'y')")
-    
-    # Try to get observable indices
-    if 'observable_idx' in data.files:
-        obs_idx = data['observable_idx']
-    else:
-        # If no observable_idx, assume all metabolites are observable
-        obs_idx = np.arange(y_obs.shape[0])
-        print(f"  Note: No observable_idx found, using all {len(obs_idx)} metabolites")
+        # Try to get time data
+        if 't_observed' in data.files:
+            t_obs = data['t_observed']
+        elif 't' in data.files:
+            t_obs = data['t']
+        else:
+            raise KeyError("Could not find time data (tried: 't_observed', 't')")
+    
+        # Try to get concentration data
+        if 'y_observed' in data.files:
+            y_obs = data['y_observed']
+        elif 'y' in data.files:
+            y_obs = data['y']
+        else:
+            raise KeyError("Could not find concentration data (tried: 'y_observed', 'y')")
+    
+        # Try to get observable indices
+        if 'observable_idx' in data.files:
+            obs_idx = data['observable_idx']
+        else:
+            # If no observable_idx, assume all metabolites are observable
+            obs_idx = np.arange(y_obs.shape[0])
+            print(f"  Note: No observable_idx found, using all {len(obs_idx)} metabolites")
+        
+        # Later loads (and the other job workers) map these instead
+        try:
+            write_npy_sidecars(data_file, t_obs, y_obs, obs_idx)
+        except OSError as e:
+            print(f"  Note: Could not write .npy sidecars ({e})")
     
     # Try to get true parameters
     if 'true_params' in data.files:
-        true_params = data['true_params'].item()
+        true_params = load_param_record(data, data_file)
         has_true_params = True
     else:
         true_params = None
@@ -85,6 +108,167 @@ def load_data_flexible(data_file):
     
     return t_obs, y_obs, obs_idx, true_params, has_true_params
 
+def resolve_parameters(fixed_params, param_names, pathway):
+    """Flat parameter vector of a pathway model and the estimated slots
+    
+    Returns (base, est_idx): base holds fixed_params in the model's
+    parameter order (GLYCOLYSIS_PARAM_ORDER / TCA_PARAM_ORDER, NaN where a
+    value is missing) and est_idx the positions of param_names in it, so a
+    sample is placed with one fancy assignment instead of a dict copy.
+    """
+    if pathway == 'glycolysis':
+        order, index = GLYCOLYSIS_PARAM_ORDER, GLYCOLYSIS_PARAM_INDEX
+    else:
+        order, index = TCA_PARAM_ORDER, TCA_PARAM_INDEX
+    base = np.array([fixed_params.get(k, np.nan) for k in order], dtype=np.float64)
+    est_idx = np.array([index[name] for name in param_names], dtype=np.intp)
+    return base, est_idx
+
+def perturbed_guess(values, pathway):
+    """Starting point of MCEM: values scaled by uniform factors in [0.875, 1.125)
+    
+    Drawn from a private RandomState seeded per pathway (42 glycolysis,
+    43 TCA), so every process gets the same guess without touching the
+    global NumPy seed, and the draws match earlier runs exactly.
+    """
+    rng = np.random.RandomState(42 if pathway == 'glycolysis' else 43)
+    values = np.asarray(values, dtype=np.float64)
+    return values * (1 + 0.25 * (rng.rand(len(values)) - 0.5))
+
+# One (model, y0) pair per pathway and process, reused by pathway_residuals:
+# each call sets the model's parameters (set_parameters, which also resets
+# its params dict) and y0 is a read-only initial state
+_RESIDUAL_MODELS = {}
+
+def _residual_model(pathway, base_params):
+    """The process's cached (model, y0) for pathway, created on first use"""
+    entry = _RESIDUAL_MODELS.get(pathway)
+    if entry is None:
+        model_class = GlycolysisModel if pathway == 'glycolysis' else TCAModel
+        model = model_class(np.array(base_params, dtype=np.float64))
+        y0 = model.get_initial_state()
+        y0.setflags(write=False)
+        entry = _RESIDUAL_MODELS[pathway] = (model, y0)
+    return entry
+
+def pathway_residuals(param_values, args):
+    """Residuals of one model simulation against the observed data
+    
+    Module-level (picklable) so MCEM can evaluate samples in worker
+    processes. args = (data, time_points, obs_idx, base_params, est_idx,
+    pathway), with base_params and est_idx from resolve_parameters.
+    """
+    data, time_points, obs_idx, base_params, est_idx, pathway = args
+    
+    # Reuse the cached model with this sample's parameters
+    model, y0 = _residual_model(pathway, base_params)
+    model.set_parameters(base_params, est_idx, param_values)
+    
+    # LSODA via odeint: lower call overhead than solve_ivp, and the
+    # analytic Jacobian spares the stiff phase its finite differences.
+    # odeint copies each dy/dt, so the RHS can reuse one buffer
+    t_out = time_points if time_points[0] == 0 else np.concatenate(([0.0], time_points))
+    
+    y_sol, info = odeint(
+        model.ode_system_buffered,
+        y0,
+        t_out,
+        Dfun=model.jacobian,
+        tfirst=True,
+        rtol=1e-6,
+        atol=1e-8,
+        mxstep=5000,
+        full_output=True
+    )
+    
+    # odeint reports failures instead of raising; non-finite states (e.g.
+    # from a NaN parameter) count as failures too
+    if info['message'] != 'Integration successful.' or not np.isfinite(y_sol).all():
+        return np.full(data.size, 1e10)
+    
+    # Subtract straight into a C-ordered result, so ravel() needs no copy
+    # (the result must be a fresh array: CachedLikelihood keeps it)
+    y_model = y_sol[-len(time_points):, obs_idx].T
+    residuals = np.subtract(y_model, data, out=np.empty(data.shape))
+    
+    return residuals.ravel()
+
+def pathway_residuals_batch(param_matrix, args, solver='rosenbrock', dtype=np.float64,
+                            rtol=1e-6, atol=None):
+    """Residuals for a whole batch of samples (glycolysis or TCA)
+    
+    Integrates every row of param_matrix in one parallel call, either with
+    native LSODA (solver='lsoda', needs numbalsoda) or the compiled
+    Rosenbrock integrator. Samples the batch integrator fails on are
+    retried one by one with pathway_residuals (scipy LSODA), which gives
+    the 1e10 penalty if that fails too. With dtype=np.float32 the
+    Rosenbrock trajectories are integrated in single precision; residuals
+    are always returned as float64. atol defaults to 1e-8 (1e-6 in
+    float32).
+    """
+    data, time_points, obs_idx, base_params, est_idx, pathway = args
+    
+    n_samples = param_matrix.shape[0]
+    P = np.tile(base_params, (n_samples, 1))
+    P[:, est_idx] = param_matrix
+    
+    if pathway == 'glycolysis':
+        y0 = GlycolysisModel().get_initial_state()
+        simulate = simulate_batch
+    else:
+        y0 = TCAModel(base_params).get_initial_state()
+        simulate = simulate_tca_batch
+    # float32 cannot resolve atol=1e-8 on mM-scale states
+    if atol is None:
+        atol = 1e-8 if dtype == np.float64 else 1e-6
+    Y, ok = simulate(P, time_points, y0, rtol=rtol, atol=atol,
+                     solver=solver, dtype=dtype)
+    
+    # (S, n_times, n_species) -> (S, n_obs, n_times), same layout as
+    # pathway_residuals. The subtraction writes (and upcasts float32)
+    # straight into a C-ordered float64 block, so the reshape is a view
+    y_model = Y[:, :, obs_idx].transpose(0, 2, 1)
+    residuals = np.subtract(y_model, data, out=np.empty((n_samples,) + data.shape))
+    residuals = residuals.reshape(n_samples, -1)
+    for i in np.flatnonzero(~ok):
+        residuals[i] = pathway_residuals(param_matrix[i], args)
+    
+    return residuals
+
+def warmup_kernels():
+    """Compile the estimation kernels once, before any timed run
+    
+    RHS/Jacobian and residual kernels load from Numba's on-disk cache (the
+    model modules' warmup()); the batch integrators cannot be cached
+    (kernel arguments, C library calls), so they are compiled here on a
+    single one-step sample. This only warms the calling process, so
+    run_parameter_estimation passes it as the initializer of its spawned
+    job workers and calls it itself only when it runs the jobs serially.
+    """
+    if not HAVE_NUMBA:
+        return
+    
+    from my_mcem_fixed import sum_squares, sum_squares_rows
+    
+    warmup_glycolysis()
+    warmup_tca()
+    y0 = GlycolysisModel().get_initial_state()
+    p = GlycolysisModel().p_vec
+    if HAVE_NUMBALSODA:
+        integrate_batch_lsoda(GLYCOLYSIS_LSODA_ADDRESS, y0[None, :],
+                              np.concatenate([p, DEFAULT_COFACTORS])[None, :],
+                              np.array([0.0, 1.0]), 1e-6, 1e-8)
+    integrate_batch(glycolysis_rhs_into, glycolysis_jac_into,
+                    y0[None, :].astype(np.float32), p[None, :].astype(np.float32),
+                    DEFAULT_COFACTORS.astype(np.float32),
+                    np.array([1.0], dtype=np.float32), 1e-6, 1e-6, 100000)
+    # The Rosenbrock batch compiles once per model (the LSODA loop is shared)
+    tca = TCAModel(TCA_PARAMS)
+    simulate_tca_batch(tca.p_vec[None, :], np.array([1.0]), tca.get_initial_state(),
+                       atol=1e-6, dtype=np.float32)
+    sum_squares(y0)
+    sum_squares_rows(y0[None, :])
+
 def estimate_pathway(pathway, organism_folder, settings, mode_name):
     """Estimate parameters for one pathway"""
     
@@ -117,9 +301,7 @@ def estimate_pathway(pathway, organism_folder, settings, mode_name):
     # Get initial guesses
     if has_true_params:
         # Phase 5 style: perturb true values
-        np.random.seed(42 if pathway == 'glycolysis' else 43)
-        initial_guess = np.array([true_params[p] for p in params_to_est])
-        initial_guess = initial_guess * (1 + 0.25 * (np.random.rand(len(params_to_est)) - 0.5))
+        initial_guess = perturbed_guess([true_params[p] for p in params_to_est], pathway)
         fixed_params = {k: v for k, v in true_params.items() if k not in params_to_est}
     else:
         # Use default from kinetic_parameters
@@ -131,71 +313,114 @@ def estimate_pathway(pathway, organism_folder, settings, mode_name):
         params_to_est = available_params
         
         # Perturb defaults
-        np.random.seed(42 if pathway == 'glycolysis' else 43)
-        initial_guess = np.array([param_source[p] for p in params_to_est])
-        initial_guess = initial_guess * (1 + 0.25 * (np.random.rand(len(params_to_est)) - 0.5))
+        initial_guess = perturbed_guess([param_source[p] for p in params_to_est], pathway)
         fixed_params = param_source.copy()
     
-    # Likelihood function
-    def likelihood(param_values, args):
-        data, time_points, obs_idx, fix_params, p_names = args
-        
-        full_params = fix_params.copy()
-        for i, pname in enumerate(p_names):
-            full_params[pname] = param_values[i]
-        
-        try:
-            if pathway == 'glycolysis':
-                model = GlycolysisModel(full_params)
-            else:
-                model = TCAModel(full_params)
-            
-            y0 = model.get_initial_state()
-            
-            sol = solve_ivp(
-                model.ode_system,
-                t_span=[0, time_points[-1]],
-                y0=y0,
-                t_eval=time_points,
-                method='LSODA',
-                rtol=1e-6,
-                atol=1e-8
-            )
-            
-            if not sol.success:
-                return np.ones(data.size) * 1e10
-            
-            y_model = sol.y[obs_idx, :]
-            residuals = (y_model - data).flatten()
-            
-            return residuals
-        except Exception as e:
-            return np.ones(data.size) * 1e10
-    
-    args = (y_obs, t_obs, obs_idx, fixed_params, params_to_est)
+    base_params, est_idx = resolve_parameters(fixed_params, params_to_est, pathway)
+    # Solver-ready time grid and index array, converted once rather than
+    # on every call
+    t_obs = np.ascontiguousarray(t_obs, dtype=np.float64)
+    obs_idx = np.ascontiguousarray(obs_idx, dtype=np.intp)
+    args = (y_obs, t_obs, obs_idx, base_params, est_idx, pathway)
+    
+    # Batched E-steps run on Numba threads: keep them within this process's
+    # share of the cores when organisms run side by side (chain processes
+    # split the same budget, see run_mcem)
+    n_threads = max(1, min(settings.get('workers', MAX_THREADS), MAX_THREADS))
+    set_num_threads(n_threads)
+    
+    # Optional Julia backend (glycolysis only); scipy LSODA otherwise
+    residual_function = pathway_residuals
+    if settings.get('solver') == 'julia' and pathway == 'glycolysis':
+        from diffeq_backend import HAVE_DIFFEQPY, julia_pathway_residuals
+        if HAVE_DIFFEQPY:
+            residual_function = julia_pathway_residuals
+            print("   Solver: DifferentialEquations.jl (Rodas5, diffeqpy)")
+        else:
+            print("   Note: diffeqpy not installed, using scipy LSODA")
+    
+    # Batched E-step needs the compiled integrator (glycolysis and TCA
+    # kernels): one prange loop over all samples of an iteration.
+    # settings['numba_parallel'] = False falls back to per-sample scipy LSODA
+    batch_likelihood = None
+    if HAVE_NUMBA and settings.get('numba_parallel', True) and residual_function is pathway_residuals:
+        batch_solver = settings.get('batch_solver', 'lsoda' if HAVE_NUMBALSODA else 'rosenbrock')
+        if batch_solver == 'lsoda' and HAVE_NUMBALSODA:
+            # Native LSODA with a C-pointer RHS (float64 only)
+            batch_likelihood = partial(pathway_residuals_batch, solver='lsoda')
+            batch_label = "LSODA, numbalsoda"
+        elif settings.get('batch_dtype', 'float32') == 'float32':
+            # Single-precision sampling; MCEM means/std stay float64
+            batch_likelihood = partial(pathway_residuals_batch, dtype=np.float32)
+            batch_label = "Rosenbrock, float32"
+        else:
+            batch_likelihood = pathway_residuals_batch
+            batch_label = "Rosenbrock, float64"
+    
+    # Looser integrator tolerances (rtol 1e-3, atol 1e-5) for the first
+    # part of the run, while the proposals are still broad: 2-10x cheaper
+    # E-steps, with sample SSEs within ~1e-7 (relative) of the tight ones.
+    # The means are always scored at full tolerance
+    coarse_likelihood = None
+    coarse_iters = 0
+    coarse_fraction = settings.get('coarse_tol_fraction', 0.5)
+    if batch_likelihood is not None and coarse_fraction > 0:
+        coarse_likelihood = partial(batch_likelihood, rtol=1e-3, atol=1e-5)
+        coarse_iters = int(coarse_fraction * settings['maxiter'])
+    
+    # Independent MCEM chains from perturbed starts; the lowest-SSE chain
+    # is kept (see run_mcem)
+    chains = settings.get('chains', 1)
     
     # Run MCEM
     print(f"\n🚀 Running MCEM ({mode_name})...")
     print(f"   Iterations: {settings['maxiter']}, Samples: {settings['inner']}")
+    if chains > 1:
+        print(f"   Chains: {chains} (chain k runs k x iterations and samples)")
+    if batch_likelihood is not None:
+        print(f"   E-step: batched integration ({batch_label})")
+    if coarse_iters:
+        print(f"   Loose tolerances (rtol 1e-3) for the first {coarse_iters} iterations")
     
     start_time = time.time()
     
+    # Memoize repeated proposals (e.g. once the sampler's spread collapses)
+    likelihood = CachedLikelihood(residual_function, maxsize=8192)
+    
     ks_est, er_min, std_est = run_mcem(
         ks_lst=initial_guess.tolist(),
-        chains=1,
+        chains=chains,
         maxiter=settings['maxiter'],
         inner_loop=settings['inner'],
         positive_only=True,
         likelihood=likelihood,
-        args=args
+        args=args,
+        n_workers=settings.get('workers', 1),
+        batch_likelihood=batch_likelihood,
+        full_covariance=settings.get('full_covariance', False),
+        score_mean=settings.get('score_mean', True),
+        coarse_likelihood=coarse_likelihood,
+        coarse_iters=coarse_iters,
+        n_threads=n_threads
     )
     
     runtime = time.time() - start_time
     
+    if mode_name == 'TEST':
+        info = likelihood.cache_info()
+        calls = info.hits + info.misses
+        if calls:
+            print(f"   Likelihood cache: {info.hits}/{calls} hits "
+                  f"({100 * info.hits / calls:.1f}%) in the main process")
+    
     # Calculate results
     estimated = np.array(ks_est)
     std_devs = np.array(std_est)
     
+    # The E-step may have sampled in float32: score the final estimate with
+    # one float64 LSODA integration
+    final_sse = float(cost_value(estimated, pathway_residuals, args))
+    
     # Calculate errors if we have true values
     if has_true_params:
         true_values = np.array([true_params[p] for p in params_to_est])
@@ -212,6 +437,7 @@ def estimate_pathway(pathway, organism_folder, settings, mode_name):
         print(f"Average Error: {np.mean(errors):.2f}%")
     else:
         print(f"Average Change from Initial: {np.mean(errors):.2f}%")
+    print(f"Final SSE (float64): {final_sse:.3e}")
     print(f"Runtime: {runtime/60:.1f} minutes ({runtime/3600:.2f} hours)")
     print(f"{'='*60}")
     
@@ -222,10 +448,60 @@ def estimate_pathway(pathway, organism_folder, settings, mode_name):
         'estimated': estimated.tolist(),
         'errors': errors.tolist(),
         'std_devs': std_devs.tolist(),
+        'final_sse': final_sse,
         'runtime': runtime,
         'has_true_params': has_true_params
     }
 
+def organism_pathways(organism_folder):
+    """Pathways with experimental data in an organism folder, in run order"""
+    org_folder = Path(organism_folder)
+    
+    # Check what data files exist
+    has_glycolysis = len(list(org_folder.glob('experimental_data*.npz'))) > 0
+    has_tca = len(list(org_folder.glob('experimental_data_tca.npz'))) > 0
+    
+    if not has_glycolysis:
+        raise FileNotFoundError(f"No experimental data found in {org_folder}")
+    
+    return ['glycolysis', 'tca'] if has_tca else ['glycolysis']
+
+def summarize_organism(organism_name, organism_folder, all_results, mode):
+    """Print and save the per-organism summary of its pathway results"""
+    
+    if not all_results:
+        return None, 0, None
+    
+    total_params = sum(len(r['parameters']) for r in all_results)
+    all_errors = []
+    for r in all_results:
+        all_errors.extend(r['errors'])
+    total_runtime = sum(r['runtime'] for r in all_results)
+    
+    print(f"\n{'='*80}")
+    print(f"ORGANISM SUMMARY: {organism_name}")
+    print(f"{'='*80}")
+    print(f"Total parameters estimated: {total_params}")
+    print(f"Overall average error: {np.mean(all_errors):.2f}%")
+    print(f"Total runtime: {total_runtime/60:.1f} minutes ({total_runtime/3600:.2f} hours)")
+    print(f"{'='*80}")
+    
+    organism_result = {
+        'organism': organism_name,
+        'total_params': total_params,
+        'pathway_results': all_results,
+        'overall_error': np.mean(all_errors),
+        'total_runtime': total_runtime,
+        'mode': mode
+    }
+    
+    # Save to organism folder (flat arrays, see data_io.results_to_arrays)
+    org_results = Path(organism_folder) / 'results'
+    org_results.mkdir(exist_ok=True)
+    save_results(org_results / 'estimation.npz', [organism_result])
+    
+    return np.mean(all_errors), total_runtime, organism_result
+
 def estimate_organism(organism_name, organism_folder, settings, mode):
     """Estimate parameters for one organism"""
     
@@ -236,72 +512,18 @@ def estimate_organism(organism_name, organism_folder, settings, mode):
     print(f"Iterations: {settings['maxiter']}, Samples: {settings['inner']}")
     print("-"*80)
     
-    org_folder = Path(organism_folder)
-    
-    # Check what data files exist
-    has_glycolysis = len(list(org_folder.glob('experimental_data*.npz'))) > 0
-    has_tca = len(list(org_folder.glob('experimental_data_tca.npz'))) > 0
-    
-    if not has_glycolysis:
-        raise FileNotFoundError(f"No experimental data found in {org_folder}")
-    
     all_results = []
     
-    # Estimate glycolysis
-    if has_glycolysis:
+    for pathway in organism_pathways(organism_folder):
         print("\n" + "-"*80)
-        print("GLYCOLYSIS PATHWAY")
+        print("GLYCOLYSIS PATHWAY" if pathway == 'glycolysis' else "TCA CYCLE PATHWAY")
         print("-"*80)
         
-        result = estimate_pathway('glycolysis', organism_folder, settings, mode)
+        result = estimate_pathway(pathway, organism_folder, settings, mode)
         if result:
             all_results.append(result)
     
-    # Estimate TCA if data exists
-    if has_tca:
-        print("\n" + "-"*80)
-        print("TCA CYCLE PATHWAY")
-        print("-"*80)
-        
-        result = estimate_pathway('tca', organism_folder, settings, mode)
-        if result:
-            all_results.append(result)
-    
-    # Overall summary
-    if all_results:
-        total_params = sum(len(r['parameters']) for r in all_results)
-        all_errors = []
-        for r in all_results:
-            all_errors.extend(r['errors'])
-        total_runtime = sum(r['runtime'] for r in all_results)
-        
-        print(f"\n{'='*80}")
-        print(f"ORGANISM SUMMARY: {organism_name}")
-        print(f"{'='*80}")
-        print(f"Total parameters estimated: {total_params}")
-        print(f"Overall average error: {np.mean(all_errors):.2f}%")
-        print(f"Total runtime: {total_runtime/60:.1f} minutes ({total_runtime/3600:.2f} hours)")
-        print(f"{'='*80}")
-        
-        # Save to organism folder
-        org_results = org_folder / 'results'
-        org_results.mkdir(exist_ok=True)
-        np.savez(org_results / 'estimation.npz',
-                results=all_results,
-                organism=organism_name,
-                total_params=total_params,
-                total_runtime=total_runtime)
-        
-        return np.mean(all_errors), total_runtime, {
-            'organism': organism_name,
-            'total_params': total_params,
-            'pathway_results': all_results,
-            'overall_error': np.mean(all_errors),
-            'total_runtime': total_runtime,
-            'mode': mode
-        }
-    
-    return None, 0, None
+    return summarize_organism(organism_name, organism_folder, all_results, mode)
 
 def run_parameter_estimation(organisms, mode_name, settings, session_folder):
     """Main parameter estimation function"""
@@ -320,10 +542,47 @@ def run_parameter_estimation(organisms, mode_name, settings, session_folder):
     
     all_results = []
     
-    for organism in organisms:
-        folder, name = org_map[organism]
-        err, rt, res_dict = estimate_organism(name, folder, settings, mode_name)
+    # Every (organism, pathway) MCEM run is independent: split the cores
+    # into one process per run, the remainder evaluate MCEM inner samples
+    # within each run (pool processes or Numba batch threads)
+    jobs = [(organism, pathway) for organism in organisms
+            for pathway in organism_pathways(org_map[organism][0])]
+    n_cpu = os.cpu_count() or 1
+    job_workers = min(n_cpu, len(jobs))
+    settings = dict(settings)
+    settings.setdefault('workers', max(1, n_cpu // job_workers))
+    
+    if job_workers > 1:
+        print(f"Running {len(jobs)} pathway estimations on {job_workers} processes "
+              f"({settings['workers']} sample worker(s) each)")
+        # Spawned, not forked: this process has already run Numba's
+        # threaded batch kernels, and forking after that leaves the parent
+        # hung in the threading layer at exit
+        # Each worker compiles its kernels before taking a job, so JIT
+        # latency stays out of the timed estimate_pathway runs
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=job_workers, mp_context=ctx,
+                                 initializer=warmup_kernels) as executor:
+            futures = [executor.submit(estimate_pathway, pathway, org_map[organism][0],
+                                       settings, mode_name)
+                       for organism, pathway in jobs]
+            pathway_results = [future.result() for future in futures]
         
+        # Regroup by organism, in menu order (pathways stay in run order)
+        outcomes = []
+        for organism in organisms:
+            folder, name = org_map[organism]
+            results = [result for (org, _), result in zip(jobs, pathway_results)
+                       if org == organism and result]
+            outcomes.append(summarize_organism(name, folder, results, mode_name))
+    else:
+        warmup_kernels()
+        outcomes = []
+        for organism in organisms:
+            folder, name = org_map[organism]
+            outcomes.append(estimate_organism(name, folder, settings, mode_name))
+    
+    for err, rt, res_dict in outcomes:
         if res_dict:
             all_results.append(res_dict)
     
@@ -331,7 +590,7 @@ def run_parameter_estimation(organisms, mode_name, settings, session_folder):
     session_folder.mkdir(parents=True, exist_ok=True)
     
     if all_results:
-        np.savez(session_folder / 'parameter_estimation.npz', results=all_results)
+        save_results(session_folder / 'parameter_estimation.npz', all_results)
     
     # Print final summary
     print("\n" + "="*80)
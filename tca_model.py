@@ -22,7 +22,380 @@ Based on:
 PYR_mito, AcCoA, CIT, ISOCIT, aKG, SucCoA, SUC, FUM, MAL, OAA
 """
 
+from functools import lru_cache
 import numpy as np
+from numba_compat import njit, HAVE_NUMBA, SAFE_FASTMATH
+from ode_integrators import (integrate_batch, integrate_batch_lsoda, integrate_batch_cuda,
+                             HAVE_NUMBALSODA)
+from kinetic_parameters import (
+    TCA_PARAMS, TCA_PARAM_ORDER,
+    PYR_transport_Vmax_IDX, PYR_transport_Km_IDX,
+    PDH_Vmax_IDX, PDH_Km_pyruvate_IDX, PDH_Km_NAD_IDX, PDH_Km_CoA_IDX,
+    CS_Vmax_IDX, CS_Km_AcCoA_IDX, CS_Km_OAA_IDX, CS_Ki_citrate_IDX,
+    ACO_Vmax_IDX, ACO_Km_citrate_IDX, ACO_Km_isocitrate_IDX, ACO_Keq_IDX,
+    ICDH_Vmax_IDX, ICDH_Km_isocitrate_IDX, ICDH_Km_NAD_IDX, ICDH_Ka_Ca_IDX,
+    KGDH_Vmax_IDX, KGDH_Km_aKG_IDX, KGDH_Km_NAD_IDX, KGDH_Km_CoA_IDX,
+    KGDH_Ki_SucCoA_IDX, KGDH_Ki_NADH_IDX, KGDH_Ka_Ca_IDX,
+    SCS_Vmax_IDX, SCS_Km_SucCoA_IDX, SCS_Km_GDP_IDX, SCS_Km_Pi_IDX,
+    SDH_Vmax_IDX, SDH_Km_succinate_IDX, SDH_Km_FAD_IDX,
+    FH_Vmax_IDX, FH_Km_fumarate_IDX, FH_Km_malate_IDX, FH_Keq_IDX,
+    MDH_Vmax_IDX, MDH_Km_malate_IDX, MDH_Km_NAD_IDX, MDH_Km_OAA_IDX,
+    MDH_Km_NADH_IDX, MDH_Keq_IDX,
+)
+
+# Initial concentrations (mM), in state order
+_Y0_TEMPLATE = np.array([
+    0.5,   # PYR_mito
+    0.1,   # AcCoA
+    0.5,   # CIT
+    0.05,  # ISOCIT
+    0.1,   # aKG
+    0.05,  # SucCoA
+    0.5,   # SUC
+    0.2,   # FUM
+    0.5,   # MAL
+    0.01   # OAA (very low!)
+])
+
+# Fixed cofactor levels (mM), in kernel order:
+# CoA, NAD, NADH, FAD, FADH2, GDP, GTP, Pi, Ca, PYR_supply
+DEFAULT_COFACTORS = np.array([0.5, 2.0, 0.1, 0.5, 0.05, 1.0, 0.5, 5.0, 0.001, 0.5])
+
+
+# ==============================================================================
+# COMPILED RIGHT-HAND SIDE
+# ==============================================================================
+
+# Reaction rates returned by tca_rates, in order
+FLUX_NAMES = ('v_PYR_transport', 'v_PDH', 'v_CS', 'v_ACO', 'v_ICDH',
+              'v_KGDH', 'v_SCS', 'v_SDH', 'v_FH', 'v_MDH')
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy', inline='always')
+def tca_rates(y, p, cof):
+    """
+    The 10 reaction rates (FLUX_NAMES order) at state y, as a tuple.
+
+    Parameters are read from the flat vector p (TCA_PARAM_ORDER) and the
+    fixed cofactors from cof (DEFAULT_COFACTORS order). Shared by
+    tca_rhs_into and tca_fluxes_into; Numba inlines it into both.
+    """
+    # Unpack state variables, ensuring non-negative concentrations
+    PYR_mito = max(y[0], 1e-10)
+    AcCoA = max(y[1], 1e-10)
+    CIT = max(y[2], 1e-10)
+    ISOCIT = max(y[3], 1e-10)
+    aKG = max(y[4], 1e-10)
+    SucCoA = max(y[5], 1e-10)
+    SUC = max(y[6], 1e-10)
+    FUM = max(y[7], 1e-10)
+    MAL = max(y[8], 1e-10)
+    OAA = max(y[9], 1e-10)
+
+    CoA = cof[0]
+    NAD = cof[1]
+    NADH = cof[2]
+    FAD = cof[3]
+    GDP = cof[5]
+    Pi = cof[7]
+    Ca = cof[8]
+    PYR_supply = cof[9]
+
+    # 1. Pyruvate transport (cytosol -> mitochondria): constant pyruvate
+    # supply from glycolysis, so the rate is constant
+    v_PYR_transport = p[PYR_transport_Vmax_IDX] * PYR_supply / \
+        (p[PYR_transport_Km_IDX] + PYR_supply)
+
+    # 2. Pyruvate dehydrogenase: Pyruvate + NAD + CoA -> AcCoA + NADH + CO2
+    v_PDH = p[PDH_Vmax_IDX] * (PYR_mito / (p[PDH_Km_pyruvate_IDX] + PYR_mito)) * \
+        (NAD / (p[PDH_Km_NAD_IDX] + NAD)) * (CoA / (p[PDH_Km_CoA_IDX] + CoA))
+
+    # 3. Citrate synthase (rate limiting, citrate inhibited):
+    # AcCoA + OAA -> Citrate + CoA
+    v_CS = p[CS_Vmax_IDX] * AcCoA * OAA / \
+        ((p[CS_Km_AcCoA_IDX] + AcCoA) * (p[CS_Km_OAA_IDX] + OAA)) / \
+        (1 + CIT / p[CS_Ki_citrate_IDX])
+
+    # 4. Aconitase: Citrate <-> Isocitrate
+    v_ACO = p[ACO_Vmax_IDX] * CIT / (p[ACO_Km_citrate_IDX] + CIT) - \
+        (p[ACO_Vmax_IDX] / p[ACO_Keq_IDX]) * ISOCIT / (p[ACO_Km_isocitrate_IDX] + ISOCIT)
+
+    # 5. Isocitrate dehydrogenase (Ca2+ activated):
+    # Isocitrate + NAD -> aKG + NADH + CO2
+    v_ICDH = p[ICDH_Vmax_IDX] * (1 + Ca / p[ICDH_Ka_Ca_IDX]) * \
+        (ISOCIT / (p[ICDH_Km_isocitrate_IDX] + ISOCIT)) * \
+        (NAD / (p[ICDH_Km_NAD_IDX] + NAD))
+
+    # 6. aKG dehydrogenase (rate limiting; Ca2+ activated, SucCoA and NADH
+    # inhibited): aKG + NAD + CoA -> SucCoA + NADH + CO2
+    v_KGDH = p[KGDH_Vmax_IDX] * (1 + Ca / p[KGDH_Ka_Ca_IDX]) / \
+        (1 + NADH / p[KGDH_Ki_NADH_IDX]) / (1 + SucCoA / p[KGDH_Ki_SucCoA_IDX]) * \
+        (aKG / (p[KGDH_Km_aKG_IDX] + aKG)) * \
+        (NAD / (p[KGDH_Km_NAD_IDX] + NAD)) * (CoA / (p[KGDH_Km_CoA_IDX] + CoA))
+
+    # 7. Succinyl-CoA synthetase: SucCoA + GDP + Pi -> Succinate + GTP + CoA
+    v_SCS = p[SCS_Vmax_IDX] * (SucCoA / (p[SCS_Km_SucCoA_IDX] + SucCoA)) * \
+        (GDP / (p[SCS_Km_GDP_IDX] + GDP)) * (Pi / (p[SCS_Km_Pi_IDX] + Pi))
+
+    # 8. Succinate dehydrogenase (complex II): Succinate + FAD -> Fumarate + FADH2
+    v_SDH = p[SDH_Vmax_IDX] * (SUC / (p[SDH_Km_succinate_IDX] + SUC)) * \
+        (FAD / (p[SDH_Km_FAD_IDX] + FAD))
+
+    # 9. Fumarase: Fumarate <-> Malate
+    v_FH = p[FH_Vmax_IDX] * FUM / (p[FH_Km_fumarate_IDX] + FUM) - \
+        (p[FH_Vmax_IDX] / p[FH_Keq_IDX]) * MAL / (p[FH_Km_malate_IDX] + MAL)
+
+    # 10. Malate dehydrogenase: Malate + NAD <-> OAA + NADH
+    v_MDH = p[MDH_Vmax_IDX] * (MAL / (p[MDH_Km_malate_IDX] + MAL)) * \
+        (NAD / (p[MDH_Km_NAD_IDX] + NAD)) - \
+        (p[MDH_Vmax_IDX] / p[MDH_Keq_IDX]) * (OAA / (p[MDH_Km_OAA_IDX] + OAA)) * \
+        (NADH / (p[MDH_Km_NADH_IDX] + NADH))
+
+    return (v_PYR_transport, v_PDH, v_CS, v_ACO, v_ICDH,
+            v_KGDH, v_SCS, v_SDH, v_FH, v_MDH)
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def tca_rhs_into(t, y, p, cof, dydt):
+    """
+    TCA cycle dy/dt written into a preallocated buffer (rates from tca_rates).
+    """
+    (v_PYR_transport, v_PDH, v_CS, v_ACO, v_ICDH,
+     v_KGDH, v_SCS, v_SDH, v_FH, v_MDH) = tca_rates(y, p, cof)
+
+    # ODEs (mass balance for each metabolite)
+    dydt[0] = v_PYR_transport - v_PDH    # PYR_mito
+    dydt[1] = v_PDH - v_CS               # AcCoA
+    dydt[2] = v_CS - v_ACO               # CIT
+    dydt[3] = v_ACO - v_ICDH             # ISOCIT
+    dydt[4] = v_ICDH - v_KGDH            # aKG
+    dydt[5] = v_KGDH - v_SCS             # SucCoA
+    dydt[6] = v_SCS - v_SDH              # SUC
+    dydt[7] = v_SDH - v_FH               # FUM
+    dydt[8] = v_FH - v_MDH               # MAL
+    dydt[9] = v_MDH - v_CS               # OAA (completes cycle!)
+    return dydt
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def tca_fluxes_into(Y, p, cof, V):
+    """
+    Reaction rates along a trajectory: Y of shape (10, T) -> V of shape (10, T)
+
+    Row i of V is reaction FLUX_NAMES[i].
+    """
+    for j in range(Y.shape[1]):
+        rates = tca_rates(Y[:, j], p, cof)
+        for i in range(10):
+            V[i, j] = rates[i]
+    return V
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def tca_rhs(t, y, p, cof):
+    """TCA dy/dt as a new array (solve_ivp/odeint-compatible via args=(p, cof))"""
+    return tca_rhs_into(t, y, p, cof, np.empty(y.shape[0]))
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def tca_jac_into(t, y, p, cof, J):
+    """
+    Analytic Jacobian d(dy/dt)/dy written into a preallocated 10x10 buffer.
+
+    Hand-differentiated from the rate laws in tca_rhs_into (the 1e-10
+    concentration floor is treated as the identity). Every flux depends on
+    at most three metabolites, so 28 of the 100 entries are non-zero.
+    """
+    PYR_mito = max(y[0], 1e-10)
+    AcCoA = max(y[1], 1e-10)
+    CIT = max(y[2], 1e-10)
+    ISOCIT = max(y[3], 1e-10)
+    aKG = max(y[4], 1e-10)
+    SucCoA = max(y[5], 1e-10)
+    SUC = max(y[6], 1e-10)
+    FUM = max(y[7], 1e-10)
+    MAL = max(y[8], 1e-10)
+    OAA = max(y[9], 1e-10)
+
+    CoA = cof[0]
+    NAD = cof[1]
+    NADH = cof[2]
+    FAD = cof[3]
+    GDP = cof[5]
+    Pi = cof[7]
+    Ca = cof[8]
+
+    J[:, :] = 0.0
+
+    # PDH: v = A * PYR/(Km+PYR)
+    K = p[PDH_Km_pyruvate_IDX]
+    dPDH_pyr = p[PDH_Vmax_IDX] * (NAD / (p[PDH_Km_NAD_IDX] + NAD)) * \
+        (CoA / (p[PDH_Km_CoA_IDX] + CoA)) * K / (K + PYR_mito) ** 2
+
+    # CS: v = Vmax * AcCoA/(K1+AcCoA) * OAA/(K2+OAA) * 1/(1+CIT/Ki)
+    K1 = p[CS_Km_AcCoA_IDX]
+    K2 = p[CS_Km_OAA_IDX]
+    Ki = p[CS_Ki_citrate_IDX]
+    inh = 1 / (1 + CIT / Ki)
+    sat_accoa = AcCoA / (K1 + AcCoA)
+    sat_oaa = OAA / (K2 + OAA)
+    dCS_accoa = p[CS_Vmax_IDX] * K1 / (K1 + AcCoA) ** 2 * sat_oaa * inh
+    dCS_oaa = p[CS_Vmax_IDX] * sat_accoa * K2 / (K2 + OAA) ** 2 * inh
+    dCS_cit = -p[CS_Vmax_IDX] * sat_accoa * sat_oaa * inh * inh / Ki
+
+    # ACO (reversible)
+    K = p[ACO_Km_citrate_IDX]
+    dACO_cit = p[ACO_Vmax_IDX] * K / (K + CIT) ** 2
+    K = p[ACO_Km_isocitrate_IDX]
+    dACO_iso = -(p[ACO_Vmax_IDX] / p[ACO_Keq_IDX]) * K / (K + ISOCIT) ** 2
+
+    # ICDH: v = A * ISOCIT/(Km+ISOCIT)
+    K = p[ICDH_Km_isocitrate_IDX]
+    dICDH_iso = p[ICDH_Vmax_IDX] * (1 + Ca / p[ICDH_Ka_Ca_IDX]) * \
+        (NAD / (p[ICDH_Km_NAD_IDX] + NAD)) * K / (K + ISOCIT) ** 2
+
+    # KGDH: v = A * aKG/(Km+aKG) * 1/(1+SucCoA/Ki)
+    A = p[KGDH_Vmax_IDX] * (1 + Ca / p[KGDH_Ka_Ca_IDX]) / \
+        (1 + NADH / p[KGDH_Ki_NADH_IDX]) * \
+        (NAD / (p[KGDH_Km_NAD_IDX] + NAD)) * (CoA / (p[KGDH_Km_CoA_IDX] + CoA))
+    K = p[KGDH_Km_aKG_IDX]
+    Ki = p[KGDH_Ki_SucCoA_IDX]
+    inh = 1 / (1 + SucCoA / Ki)
+    dKGDH_akg = A * inh * K / (K + aKG) ** 2
+    dKGDH_succoa = -A * (aKG / (K + aKG)) * inh * inh / Ki
+
+    # SCS: v = A * SucCoA/(Km+SucCoA)
+    K = p[SCS_Km_SucCoA_IDX]
+    dSCS_succoa = p[SCS_Vmax_IDX] * (GDP / (p[SCS_Km_GDP_IDX] + GDP)) * \
+        (Pi / (p[SCS_Km_Pi_IDX] + Pi)) * K / (K + SucCoA) ** 2
+
+    # SDH: v = A * SUC/(Km+SUC)
+    K = p[SDH_Km_succinate_IDX]
+    dSDH_suc = p[SDH_Vmax_IDX] * (FAD / (p[SDH_Km_FAD_IDX] + FAD)) * K / (K + SUC) ** 2
+
+    # FH (reversible)
+    K = p[FH_Km_fumarate_IDX]
+    dFH_fum = p[FH_Vmax_IDX] * K / (K + FUM) ** 2
+    K = p[FH_Km_malate_IDX]
+    dFH_mal = -(p[FH_Vmax_IDX] / p[FH_Keq_IDX]) * K / (K + MAL) ** 2
+
+    # MDH (reversible)
+    K = p[MDH_Km_malate_IDX]
+    dMDH_mal = p[MDH_Vmax_IDX] * (NAD / (p[MDH_Km_NAD_IDX] + NAD)) * K / (K + MAL) ** 2
+    K = p[MDH_Km_OAA_IDX]
+    dMDH_oaa = -(p[MDH_Vmax_IDX] / p[MDH_Keq_IDX]) * \
+        (NADH / (p[MDH_Km_NADH_IDX] + NADH)) * K / (K + OAA) ** 2
+
+    # Mass balances, row by row (same order as tca_rhs_into)
+    J[0, 0] = -dPDH_pyr
+
+    J[1, 0] = dPDH_pyr
+    J[1, 1] = -dCS_accoa
+    J[1, 2] = -dCS_cit
+    J[1, 9] = -dCS_oaa
+
+    J[2, 1] = dCS_accoa
+    J[2, 2] = dCS_cit - dACO_cit
+    J[2, 3] = -dACO_iso
+    J[2, 9] = dCS_oaa
+
+    J[3, 2] = dACO_cit
+    J[3, 3] = dACO_iso - dICDH_iso
+
+    J[4, 3] = dICDH_iso
+    J[4, 4] = -dKGDH_akg
+    J[4, 5] = -dKGDH_succoa
+
+    J[5, 4] = dKGDH_akg
+    J[5, 5] = dKGDH_succoa - dSCS_succoa
+
+    J[6, 5] = dSCS_succoa
+    J[6, 6] = -dSDH_suc
+
+    J[7, 6] = dSDH_suc
+    J[7, 7] = -dFH_fum
+    J[7, 8] = -dFH_mal
+
+    J[8, 7] = dFH_fum
+    J[8, 8] = dFH_mal - dMDH_mal
+    J[8, 9] = -dMDH_oaa
+
+    J[9, 1] = -dCS_accoa
+    J[9, 2] = -dCS_cit
+    J[9, 8] = dMDH_mal
+    J[9, 9] = dMDH_oaa - dCS_oaa
+    return J
+
+
+@njit(cache=True, fastmath=SAFE_FASTMATH, boundscheck=False, error_model='numpy')
+def tca_jac(t, y, p, cof):
+    """Analytic Jacobian as a new array (solve_ivp jac= / odeint Dfun= with tfirst=True)"""
+    n = y.shape[0]
+    return tca_jac_into(t, y, p, cof, np.empty((n, n)))
+
+
+# ==============================================================================
+# NATIVE LSODA CALLBACK (for numbalsoda)
+# ==============================================================================
+# data vector layout: the TCA parameters (TCA_PARAM_ORDER), then the
+# cofactors (DEFAULT_COFACTORS order)
+
+N_TCA_PARAMS = len(TCA_PARAM_ORDER)
+N_COFACTORS = len(DEFAULT_COFACTORS)
+
+if HAVE_NUMBA:
+    from numba import cfunc, carray
+    from glycolysis_model import LSODA_SIG
+
+    @cfunc(LSODA_SIG, cache=True)
+    def tca_rhs_cfunc(t, u, du, data):
+        """C-callable RHS: LSODA calls it through a function pointer, no Python"""
+        y = carray(u, (10,))
+        dydt = carray(du, (10,))
+        d = carray(data, (N_TCA_PARAMS + N_COFACTORS,))
+        tca_rhs_into(t, y, d[:N_TCA_PARAMS], d[N_TCA_PARAMS:], dydt)
+
+    TCA_LSODA_ADDRESS = tca_rhs_cfunc.address
+else:
+    TCA_LSODA_ADDRESS = None
+
+
+def simulate_batch(P, t_eval, y0, cofactors=DEFAULT_COFACTORS, rtol=1e-6, atol=1e-8,
+                   solver='rosenbrock', dtype=np.float64, max_steps=100000):
+    """
+    Integrate one TCA trajectory per parameter row of P, in parallel.
+    
+    Same solvers as glycolysis_model.simulate_batch: 'lsoda' (numbalsoda
+    on tca_rhs_cfunc, float64 only), 'rosenbrock' (compiled Rosenbrock
+    2(3) with the analytic Jacobian, in the given dtype) or 'cuda'.
+    
+    Args:
+        P: parameter vectors (TCA_PARAM_ORDER), shape (S, N_TCA_PARAMS)
+        t_eval: output times (ascending, >= 0); integration starts at t=0
+        y0: initial state shared by all samples, shape (10,)
+    
+    Returns:
+        tuple: (Y, ok) with Y of shape (S, len(t_eval), 10) and ok flagging
+            successful integrations
+    """
+    n_samples = P.shape[0]
+    Y0 = np.tile(y0, (n_samples, 1))
+    
+    if solver == 'lsoda':
+        # LSODA starts at t_eval[0], so prepend t=0 when the data does not
+        t_out = np.asarray(t_eval, dtype=np.float64)
+        if t_out[0] != 0:
+            t_out = np.concatenate(([0.0], t_out))
+        D = np.hstack([P, np.tile(cofactors, (n_samples, 1))])
+        Y, ok = integrate_batch_lsoda(TCA_LSODA_ADDRESS, Y0, D, t_out, rtol, atol)
+        return Y[:, -len(t_eval):, :], ok
+    
+    integrate = integrate_batch_cuda if solver == 'cuda' else integrate_batch
+    return integrate(tca_rhs_into, tca_jac_into,
+                     Y0.astype(dtype), P.astype(dtype),
+                     np.asarray(cofactors).astype(dtype),
+                     np.asarray(t_eval, dtype=dtype),
+                     rtol, atol, max_steps)
 
 
 class TCAModel:
@@ -34,10 +407,16 @@ class TCAModel:
         
         Parameters:
         -----------
-        parameters : dict
-            Dictionary of kinetic parameters
+        parameters : dict or ndarray
+            Dictionary of kinetic parameters, or a flat vector already in
+            TCA_PARAM_ORDER (used as is, skipping the per-name lookups)
         """
-        self.params = parameters
+        if isinstance(parameters, np.ndarray):
+            self._params = None
+            self.p_vec = np.asarray(parameters, dtype=np.float64)
+        else:
+            self._params = parameters
+            self.p_vec = np.array([parameters[k] for k in TCA_PARAM_ORDER], dtype=np.float64)
         
         # State variable names
         self.state_names = [
@@ -53,6 +432,9 @@ class TCAModel:
             'OAA'        # 9: Oxaloacetate
         ]
         
+        # Reaction names, in get_fluxes_batch row order
+        self.flux_names = list(FLUX_NAMES)
+        
         # Fixed cofactor concentrations (mM)
         self.CoA = 0.5
         self.NAD = 2.0
@@ -63,26 +445,46 @@ class TCAModel:
         self.GTP = 0.5
         self.Pi = 5.0
         self.Ca = 0.001  # Calcium for regulation
+        self.PYR_supply = 0.5  # mM (from glycolysis endpoint)
+        
+        # dy/dt buffer reused by ode_system_buffered
+        self._dydt = np.empty(10)
+        
+        # Cofactor vector passed to the kernel
+        # (rebuild with _cofactor_vector() after changing a cofactor)
+        self.cof = self._cofactor_vector()
+    
+    @property
+    def params(self):
+        """Parameter dict (built from p_vec if the model was given a vector)"""
+        if self._params is None:
+            self._params = dict(zip(TCA_PARAM_ORDER, self.p_vec.tolist()))
+        return self._params
+    
+    def set_parameters(self, p_vec, idx=None, values=None):
+        """
+        Overwrite the parameter vector in place (TCA_PARAM_ORDER), then
+        values at positions idx if given. Write p_vec through here, not
+        directly, so params follows it.
+        """
+        self.p_vec[:] = p_vec
+        if idx is not None:
+            self.p_vec[idx] = values
+        self._params = None
+    
+    def _cofactor_vector(self):
+        """Fixed cofactor levels in kernel order (see DEFAULT_COFACTORS)"""
+        return np.array([self.CoA, self.NAD, self.NADH, self.FAD, self.FADH2,
+                         self.GDP, self.GTP, self.Pi, self.Ca, self.PYR_supply],
+                        dtype=np.float64)
     
     def get_initial_state(self):
         """Get initial concentrations for all metabolites"""
-        y0 = np.array([
-            0.5,   # PYR_mito
-            0.1,   # AcCoA
-            0.5,   # CIT
-            0.05,  # ISOCIT
-            0.1,   # aKG
-            0.05,  # SucCoA
-            0.5,   # SUC
-            0.2,   # FUM
-            0.5,   # MAL
-            0.01   # OAA (very low!)
-        ])
-        return y0
+        return _Y0_TEMPLATE.copy()
     
-    def ode_system(self, t, y):
+    def ode_system(self, t, y, out=None):
         """
-        TCA cycle ODE system.
+        TCA cycle ODE system, evaluated by the compiled tca_rhs_into kernel.
         
         Parameters:
         -----------
@@ -90,184 +492,128 @@ class TCAModel:
             Time
         y : array
             Current state [PYR_mito, AcCoA, CIT, ISOCIT, aKG, SucCoA, SUC, FUM, MAL, OAA]
+        out : array, optional
+            Length-10 array to write the rates into (default: a new array)
         
         Returns:
         --------
         dydt : array
             Rate of change for each metabolite
         """
-        # Unpack state variables
-        PYR_mito, AcCoA, CIT, ISOCIT, aKG, SucCoA, SUC, FUM, MAL, OAA = y
-        
-        # Ensure non-negative concentrations
-        PYR_mito = max(PYR_mito, 1e-10)
-        AcCoA = max(AcCoA, 1e-10)
-        CIT = max(CIT, 1e-10)
-        ISOCIT = max(ISOCIT, 1e-10)
-        aKG = max(aKG, 1e-10)
-        SucCoA = max(SucCoA, 1e-10)
-        SUC = max(SUC, 1e-10)
-        FUM = max(FUM, 1e-10)
-        MAL = max(MAL, 1e-10)
-        OAA = max(OAA, 1e-10)
-        
-        p = self.params
-        
-        # ============================================================
-        # Reaction 1: Pyruvate Transport (cytosol → mitochondria)
-        # ============================================================
-        # Assume constant pyruvate supply from glycolysis
-        PYR_supply = 0.5  # mM (from glycolysis endpoint)
-        
-        v_PYR_transport = (p['PYR_transport_Vmax'] * PYR_supply / 
-                          (p['PYR_transport_Km'] + PYR_supply))
-        
-        # ============================================================
-        # Reaction 2: Pyruvate Dehydrogenase (PDH)
-        # Pyruvate + NAD + CoA → AcCoA + NADH + CO2
-        # ============================================================
-        v_PDH = (p['PDH_Vmax'] * PYR_mito * self.NAD * self.CoA /
-                ((p['PDH_Km_pyruvate'] + PYR_mito) *
-                 (p['PDH_Km_NAD'] + self.NAD) *
-                 (p['PDH_Km_CoA'] + self.CoA)))
-        
-        # ============================================================
-        # Reaction 3: Citrate Synthase (CS) - RATE LIMITING
-        # AcCoA + OAA → Citrate + CoA
-        # ============================================================
-        # Inhibited by ATP and citrate
-        v_CS = (p['CS_Vmax'] * AcCoA * OAA /
-               ((p['CS_Km_AcCoA'] + AcCoA) * (p['CS_Km_OAA'] + OAA)) *
-               (1 / (1 + CIT / p['CS_Ki_citrate'])))
-        
-        # ============================================================
-        # Reaction 4: Aconitase (ACO)
-        # Citrate ⇌ Isocitrate
-        # ============================================================
-        v_ACO_forward = (p['ACO_Vmax'] * CIT / 
-                        (p['ACO_Km_citrate'] + CIT))
-        
-        v_ACO_reverse = (p['ACO_Vmax'] / p['ACO_Keq'] * ISOCIT /
-                        (p['ACO_Km_isocitrate'] + ISOCIT))
-        
-        v_ACO = v_ACO_forward - v_ACO_reverse
-        
-        # ============================================================
-        # Reaction 5: Isocitrate Dehydrogenase (ICDH) - KEY REGULATION
-        # Isocitrate + NAD → α-KG + NADH + CO2
-        # Activated by Ca2+ and ADP
-        # ============================================================
-        Ca_activation = 1 + self.Ca / p['ICDH_Ka_Ca']
-        
-        v_ICDH = (p['ICDH_Vmax'] * Ca_activation * ISOCIT * self.NAD /
-                 ((p['ICDH_Km_isocitrate'] + ISOCIT) *
-                  (p['ICDH_Km_NAD'] + self.NAD)))
-        
-        # ============================================================
-        # Reaction 6: α-Ketoglutarate Dehydrogenase (KGDH) - RATE LIMITING
-        # α-KG + NAD + CoA → SucCoA + NADH + CO2
-        # Activated by Ca2+, inhibited by SucCoA and NADH
-        # ============================================================
-        Ca_activation = 1 + self.Ca / p['KGDH_Ka_Ca']
-        SucCoA_inhibition = 1 / (1 + SucCoA / p['KGDH_Ki_SucCoA'])
-        NADH_inhibition = 1 / (1 + self.NADH / p['KGDH_Ki_NADH'])
-        
-        v_KGDH = (p['KGDH_Vmax'] * Ca_activation * SucCoA_inhibition * NADH_inhibition *
-                 aKG * self.NAD * self.CoA /
-                 ((p['KGDH_Km_aKG'] + aKG) *
-                  (p['KGDH_Km_NAD'] + self.NAD) *
-                  (p['KGDH_Km_CoA'] + self.CoA)))
-        
-        # ============================================================
-        # Reaction 7: Succinyl-CoA Synthetase (SCS)
-        # SucCoA + GDP + Pi → Succinate + GTP + CoA
-        # ============================================================
-        v_SCS = (p['SCS_Vmax'] * SucCoA * self.GDP * self.Pi /
-                ((p['SCS_Km_SucCoA'] + SucCoA) *
-                 (p['SCS_Km_GDP'] + self.GDP) *
-                 (p['SCS_Km_Pi'] + self.Pi)))
-        
-        # ============================================================
-        # Reaction 8: Succinate Dehydrogenase (SDH) - Complex II
-        # Succinate + FAD → Fumarate + FADH2
-        # ============================================================
-        v_SDH = (p['SDH_Vmax'] * SUC * self.FAD /
-                ((p['SDH_Km_succinate'] + SUC) *
-                 (p['SDH_Km_FAD'] + self.FAD)))
-        
-        # ============================================================
-        # Reaction 9: Fumarase (FH)
-        # Fumarate ⇌ Malate
-        # ============================================================
-        v_FH_forward = (p['FH_Vmax'] * FUM /
-                       (p['FH_Km_fumarate'] + FUM))
-        
-        v_FH_reverse = (p['FH_Vmax'] / p['FH_Keq'] * MAL /
-                       (p['FH_Km_malate'] + MAL))
-        
-        v_FH = v_FH_forward - v_FH_reverse
-        
-        # ============================================================
-        # Reaction 10: Malate Dehydrogenase (MDH)
-        # Malate + NAD ⇌ OAA + NADH
-        # ============================================================
-        v_MDH_forward = (p['MDH_Vmax'] * MAL * self.NAD /
-                        ((p['MDH_Km_malate'] + MAL) *
-                         (p['MDH_Km_NAD'] + self.NAD)))
-        
-        v_MDH_reverse = (p['MDH_Vmax'] / p['MDH_Keq'] * OAA * self.NADH /
-                        ((p['MDH_Km_OAA'] + OAA) *
-                         (p['MDH_Km_NADH'] + self.NADH)))
+        dydt = np.empty(10) if out is None else out
+        return tca_rhs_into(t, np.asarray(y, dtype=np.float64), self.p_vec, self.cof, dydt)
+    
+    def ode_system_buffered(self, t, y):
+        """
+        ode_system written into a per-model buffer
         
-        v_MDH = v_MDH_forward - v_MDH_reverse
+        The returned array is overwritten by the next call, so this is only
+        for solvers that copy the RHS result at once (odeint, LSODA).
+        """
+        return self.ode_system(t, y, self._dydt)
+    
+    def jacobian(self, t, y):
+        """
+        Analytic Jacobian d(dy/dt)/dy of ode_system (10x10)
         
-        # ============================================================
-        # ODEs (mass balance for each metabolite)
-        # ============================================================
-        dydt = np.zeros(10)
+        Pass as jac= to solve_ivp (LSODA/BDF/Radau) or Dfun= to odeint
+        with tfirst=True. Its non-zero pattern is TCA_JAC_SPARSITY.
+        """
+        return tca_jac_into(t, np.asarray(y, dtype=np.float64), self.p_vec, self.cof,
+                            np.empty((10, 10)))
+    
+    def simulate(self, t_eval, y0=None, rtol=1e-6, atol=1e-8):
+        """
+        Integrate from t_eval[0] and return the states at t_eval, shape (n_times, 10)
         
-        dydt[0] = v_PYR_transport - v_PDH                    # PYR_mito
-        dydt[1] = v_PDH - v_CS                               # AcCoA
-        dydt[2] = v_CS - v_ACO                               # CIT
-        dydt[3] = v_ACO - v_ICDH                            # ISOCIT
-        dydt[4] = v_ICDH - v_KGDH                           # aKG
-        dydt[5] = v_KGDH - v_SCS                            # SucCoA
-        dydt[6] = v_SCS - v_SDH                             # SUC
-        dydt[7] = v_SDH - v_FH                              # FUM
-        dydt[8] = v_FH - v_MDH                              # MAL
-        dydt[9] = v_MDH - v_CS                              # OAA (completes cycle!)
+        With numbalsoda the whole run stays in compiled code (LSODA calls
+        the RHS through TCA_LSODA_ADDRESS); otherwise SciPy LSODA with the
+        analytic Jacobian. Raises RuntimeError if the integration fails.
+        """
+        t_eval = np.asarray(t_eval, dtype=np.float64)
+        y0 = self.get_initial_state() if y0 is None else np.asarray(y0, dtype=np.float64)
+        
+        if HAVE_NUMBALSODA:
+            import numbalsoda
+            Y, success = numbalsoda.lsoda(TCA_LSODA_ADDRESS, y0.copy(), t_eval,
+                                          data=np.concatenate([self.p_vec, self.cof]),
+                                          rtol=rtol, atol=atol)
+            message = "numbalsoda integration failed"
+        else:
+            from scipy.integrate import solve_ivp
+            sol = solve_ivp(self.ode_system, (t_eval[0], t_eval[-1]), y0,
+                            method='LSODA', jac=self.jacobian, t_eval=t_eval,
+                            rtol=rtol, atol=atol)
+            Y, success, message = sol.y.T, sol.success, sol.message
+        
+        if not success:
+            raise RuntimeError(message)
+        return Y
+    
+    def get_fluxes_batch(self, Y):
+        """
+        Reaction rates for states Y of shape (10, T), e.g. sol.y of solve_ivp
         
-        return dydt
+        Returns a (10, T) float64 array; row i is reaction self.flux_names[i].
+        """
+        Y = np.asarray(Y, dtype=np.float64)
+        return tca_fluxes_into(Y, self.p_vec, self.cof, np.empty(Y.shape))
     
     def get_fluxes(self, y):
         """
         Calculate reaction fluxes at given state.
         
-        Returns dict of {reaction_name: flux}
+        Returns dict of {reaction_name: flux}, with the same rate laws as
+        ode_system (see get_fluxes_batch for whole trajectories)
         """
-        PYR_mito, AcCoA, CIT, ISOCIT, aKG, SucCoA, SUC, FUM, MAL, OAA = y
-        p = self.params
-        
-        PYR_supply = 0.5
-        
-        fluxes = {
-            'v_PYR_transport': p['PYR_transport_Vmax'] * PYR_supply / (p['PYR_transport_Km'] + PYR_supply),
-            'v_PDH': p['PDH_Vmax'] * PYR_mito * self.NAD * self.CoA / ((p['PDH_Km_pyruvate'] + PYR_mito) * (p['PDH_Km_NAD'] + self.NAD) * (p['PDH_Km_CoA'] + self.CoA)),
-            'v_CS': p['CS_Vmax'] * AcCoA * OAA / ((p['CS_Km_AcCoA'] + AcCoA) * (p['CS_Km_OAA'] + OAA)),
-            'v_ICDH': p['ICDH_Vmax'] * ISOCIT * self.NAD / ((p['ICDH_Km_isocitrate'] + ISOCIT) * (p['ICDH_Km_NAD'] + self.NAD)),
-            'v_KGDH': p['KGDH_Vmax'] * aKG * self.NAD * self.CoA / ((p['KGDH_Km_aKG'] + aKG) * (p['KGDH_Km_NAD'] + self.NAD) * (p['KGDH_Km_CoA'] + self.CoA)),
-            'v_SDH': p['SDH_Vmax'] * SUC * self.FAD / ((p['SDH_Km_succinate'] + SUC) * (p['SDH_Km_FAD'] + self.FAD))
-        }
-        
-        return fluxes
+        V = self.get_fluxes_batch(np.reshape(y, (10, 1)))
+        return dict(zip(self.flux_names, V[:, 0].tolist()))
+
+def warmup():
+    """Compile (or load from cache) the RHS, Jacobian and flux kernels, before any timed solver call"""
+    model = TCAModel(TCA_PARAMS)
+    y0 = model.get_initial_state()
+    tca_rhs(0.0, y0, model.p_vec, model.cof)
+    tca_jac(0.0, y0, model.p_vec, model.cof)
+    model.get_fluxes_batch(y0.reshape(10, 1))
+
+
+def tca_jac_sparsity(p=None, cof=DEFAULT_COFACTORS, n_probe=8, seed=0):
+    """
+    Structural non-zeros of the TCA Jacobian, bool (10, 10)
+    
+    Union of the non-zero entries of the analytic Jacobian over random
+    positive states, as glycolysis_jac_sparsity. Pass as jac_sparsity= to
+    solve_ivp with method='BDF' or 'Radau' (without jac=). 28 of 100
+    entries: the cycle's sub-diagonal chain plus the citrate synthase
+    couplings of AcCoA, citrate and OAA.
+    """
+    p = TCAModel(TCA_PARAMS).p_vec if p is None else np.asarray(p, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    pattern = np.zeros((10, 10), dtype=bool)
+    for _ in range(n_probe):
+        y = _Y0_TEMPLATE * rng.uniform(0.5, 2.0, 10)
+        pattern |= tca_jac(0.0, y, p, cof) != 0.0
+    return pattern
+
+
+
+@lru_cache(maxsize=None)
+def _default_jac_sparsity():
+    return tca_jac_sparsity()
+
+
+def __getattr__(attr):
+    """TCA_JAC_SPARSITY is probed from the compiled Jacobian on first access"""
+    if attr == 'TCA_JAC_SPARSITY':
+        return _default_jac_sparsity()
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
 
 
 if __name__ == "__main__":
     print("TCA Cycle Model Test")
     print("=" * 70)
     
-    from kinetic_parameters import TCA_PARAMS
-    
     model = TCAModel(TCA_PARAMS)
     y0 = model.get_initial_state()
     